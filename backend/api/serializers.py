@@ -1,10 +1,64 @@
 from rest_framework import serializers
-from core.models import Driver, Constructor, Race, Result, Lap, ChampionshipStanding, Season, ConstructorSeason, DriverSeason, Qualifying, Sprint
-from django.db.models import Count, Sum, Min, Max, Q
+from core.models import Driver, Constructor, Race, Result, Lap, ChampionshipStanding, Season, ConstructorSeason, DriverSeason, Qualifying, Sprint, DriverCareerStats
+from django.db.models import Count, Sum, Min, Max, Q, F
 from datetime import date
 
 
-class DriverSerializer(serializers.ModelSerializer):
+class FlexFieldsSerializerMixin:
+    """
+    Serializer mixin adding sparse fieldsets and relation expansion.
+    
+    The view puts the requested `fields` and `expand` sets in the context.
+    Relations listed in Meta.expandable_fields are rendered as primary keys
+    unless expanded. Only applies to the top-level serializer of a request.
+    """
+    
+    def _is_top_level(self):
+        parent = self.parent
+        if isinstance(parent, serializers.ListSerializer):
+            parent = parent.parent
+        return parent is None
+    
+    def get_fields(self):
+        fields = super().get_fields()
+        if not self._is_top_level():
+            return fields
+        
+        expand = self.context.get('expand') or set()
+        for name, serializer_class in getattr(self.Meta, 'expandable_fields', {}).items():
+            if name in fields and name in expand:
+                fields[name] = serializer_class(read_only=True)
+        
+        requested = self.context.get('fields')
+        if requested:
+            fields = {name: field for name, field in fields.items() if name in requested}
+        
+        return fields
+
+
+class ExpandableListSerializer(serializers.ListSerializer):
+    """
+    List serializer that lets expanded nested serializers bulk-load their
+    data for every related object on the page before rows are serialized.
+    """
+    
+    def to_representation(self, data):
+        iterable = data.all() if hasattr(data, 'all') else data
+        instances = list(iterable)
+        
+        for name, field in self.child.fields.items():
+            if hasattr(field, 'load_season_data'):
+                related = {}
+                for instance in instances:
+                    obj = getattr(instance, name)
+                    if obj is not None:
+                        related[obj.id] = obj
+                field.load_season_data(list(related.values()))
+        
+        return super().to_representation(instances)
+
+
+class DriverSerializer(FlexFieldsSerializerMixin, serializers.ModelSerializer):
     full_name = serializers.ReadOnlyField()
     age = serializers.SerializerMethodField()
     
@@ -26,14 +80,14 @@ class DriverSerializer(serializers.ModelSerializer):
         return None
 
 
-class SeasonSerializer(serializers.ModelSerializer):
+class SeasonSerializer(FlexFieldsSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = Season
         fields = ['id', 'year', 'is_active', 'created_at', 'updated_at']
         read_only_fields = ['created_at', 'updated_at']
 
 
-class DriverSeasonSerializer(serializers.ModelSerializer):
+class DriverSeasonSerializer(FlexFieldsSerializerMixin, serializers.ModelSerializer):
     """
     Comprehensive driver data for a specific season including team info and career statistics.
     """
@@ -55,10 +109,16 @@ class DriverSeasonSerializer(serializers.ModelSerializer):
     def get_constructor(self, obj):
         """Get constructor with season-specific data (colors, car model)"""
         constructor = obj.constructor
-        season_data = ConstructorSeason.objects.filter(
-            constructor=constructor,
-            season=obj.season
-        ).first()
+        if hasattr(constructor, 'prefetched_season_data'):
+            season_data = next(
+                (cs for cs in constructor.prefetched_season_data if cs.season_id == obj.season_id),
+                None
+            )
+        else:
+            season_data = ConstructorSeason.objects.filter(
+                constructor=constructor,
+                season=obj.season
+            ).first()
         
         return {
             'id': constructor.id,
@@ -71,84 +131,58 @@ class DriverSeasonSerializer(serializers.ModelSerializer):
         }
     
     def get_career_stats(self, obj):
-        """Calculate comprehensive career statistics for the driver"""
-        driver = obj.driver
-        
-        # Total race wins (P1 finishes)
-        total_wins = Result.objects.filter(
-            driver=driver,
-            final_position=1
-        ).count()
-        
-        # Total podiums (P1, P2, P3)
-        total_podiums = Result.objects.filter(
-            driver=driver,
-            final_position__in=[1, 2, 3]
-        ).count()
-        
-        # World Championships (P1 in final standings)
-        world_championships = ChampionshipStanding.objects.filter(
-            driver=driver,
-            standing_type='driver',
-            round=0,  # Season total
-            position=1
-        ).count()
-        
-        # Total seasons in F1
-        total_seasons = DriverSeason.objects.filter(
-            driver=driver
-        ).values('season').distinct().count()
-        
-        # Best championship finish
-        best_finish_qs = ChampionshipStanding.objects.filter(
-            driver=driver,
-            standing_type='driver',
-            round=0  # Season total
-        ).aggregate(best=Min('position'))
-        best_championship_finish = best_finish_qs['best']
-        
-        # Best finish in current season (best race result)
-        best_season_finish_qs = Result.objects.filter(
-            driver=driver,
-            race__season=obj.season.year,
-            final_position__isnull=False
-        ).aggregate(best=Min('final_position'))
-        best_season_finish = best_season_finish_qs['best']
+        """Read precomputed career statistics for the driver"""
+        try:
+            stats = obj.driver.career_stats
+        except DriverCareerStats.DoesNotExist:
+            stats = None
         
-        # Total career points
-        career_points = Result.objects.filter(
-            driver=driver
-        ).aggregate(total=Sum('points'))['total'] or 0
+        # Best finish in current season (annotated by DriverSeasonViewSet)
+        if hasattr(obj, 'best_season_finish'):
+            best_season_finish = obj.best_season_finish
+        else:
+            best_season_finish = Result.objects.filter(
+                driver=obj.driver,
+                season=obj.season.year,
+                final_position__isnull=False
+            ).aggregate(best=Min('final_position'))['best']
         
         return {
-            'total_wins': total_wins,
-            'total_podiums': total_podiums,
-            'world_championships': world_championships,
-            'total_seasons': total_seasons,
-            'best_championship_finish': best_championship_finish,
+            'total_wins': stats.total_wins if stats else 0,
+            'total_podiums': stats.total_podiums if stats else 0,
+            'world_championships': stats.world_championships if stats else 0,
+            'total_seasons': stats.total_seasons if stats else 0,
+            'best_championship_finish': stats.best_championship_finish if stats else None,
             'best_season_finish': best_season_finish,
-            'career_points': float(career_points),
+            'career_points': float(stats.career_points) if stats else 0.0,
         }
     
     def get_current_standing(self, obj):
         """Get current championship standing for this season"""
-        try:
-            standing = ChampionshipStanding.objects.get(
+        if hasattr(obj.driver, 'prefetched_season_totals'):
+            standing = next(
+                (st for st in obj.driver.prefetched_season_totals if st.season == obj.season.year),
+                None
+            )
+        else:
+            standing = ChampionshipStanding.objects.filter(
                 driver=obj.driver,
                 season=obj.season.year,
                 standing_type='driver',
                 round=0  # Season total
-            )
-            return {
-                'position': standing.position,
-                'points': standing.points,
-                'wins': standing.wins,
-            }
-        except ChampionshipStanding.DoesNotExist:
+            ).first()
+        
+        if standing is None:
             return None
+        
+        return {
+            'position': standing.position,
+            'points': standing.points,
+            'wins': standing.wins,
+        }
 
 
-class ConstructorSeasonSerializer(serializers.ModelSerializer):
+class ConstructorSeasonSerializer(FlexFieldsSerializerMixin, serializers.ModelSerializer):
     constructor_name = serializers.CharField(source='constructor.name', read_only=True)
     season_year = serializers.IntegerField(source='season.year', read_only=True)
     
@@ -162,7 +196,36 @@ class ConstructorSeasonSerializer(serializers.ModelSerializer):
         read_only_fields = ['created_at', 'updated_at']
 
 
-class ConstructorSerializer(serializers.ModelSerializer):
+def resolve_season_year(request=None):
+    """
+    Resolve the season year from the request or fall back to the active season.
+    A ?season= value that is not a year is answered with 400.
+    """
+    if request is not None and 'season' in request.query_params:
+        try:
+            return int(request.query_params['season'])
+        except ValueError:
+            raise serializers.ValidationError({'season': ['A valid integer is required.']})
+    
+    active_season = Season.objects.filter(is_active=True).first()
+    return active_season.year if active_season else 2024
+
+
+class ConstructorListSerializer(serializers.ListSerializer):
+    """
+    List serializer that bulk-loads season data for every constructor on the page
+    before serializing, so each row reads from the request-scoped cache.
+    """
+    
+    def to_representation(self, data):
+        iterable = data.all() if hasattr(data, 'all') else data
+        constructors = list(iterable)
+        if ConstructorSerializer.SEASON_FIELDS & set(self.child.fields):
+            self.child.load_season_data(constructors)
+        return super().to_representation(constructors)
+
+
+class ConstructorSerializer(FlexFieldsSerializerMixin, serializers.ModelSerializer):
     drivers = serializers.SerializerMethodField()
     championship_position = serializers.SerializerMethodField()
     car_model = serializers.SerializerMethodField()
@@ -170,6 +233,12 @@ class ConstructorSerializer(serializers.ModelSerializer):
     team_color = serializers.SerializerMethodField()
     team_color_secondary = serializers.SerializerMethodField()
     
+    # Fields that depend on the season data loaded by load_season_data
+    SEASON_FIELDS = {
+        'car_model', 'car_image_url', 'team_color', 'team_color_secondary',
+        'drivers', 'championship_position',
+    }
+    
     class Meta:
         model = Constructor
         fields = [
@@ -179,26 +248,65 @@ class ConstructorSerializer(serializers.ModelSerializer):
             'created_at', 'updated_at'
         ]
         read_only_fields = ['created_at', 'updated_at']
+        list_serializer_class = ConstructorListSerializer
     
     def _get_season_year(self):
-        """Helper to get season year from request or active season"""
-        request = self.context.get('request')
-        if request and 'season' in request.query_params:
-            return int(request.query_params['season'])
+        """Helper to get season year, resolved once per request and kept in the context"""
+        if 'season_year' not in self.context:
+            self.context['season_year'] = resolve_season_year(self.context.get('request'))
+        return self.context['season_year']
+    
+    def _get_season_cache(self):
+        """Request-scoped cache of season data keyed by constructor id"""
+        return self.context.setdefault('constructor_season_cache', {
+            'loaded': set(),
+            'season_data': {},
+            'standings': {},
+            'drivers': {},
+        })
+    
+    def load_season_data(self, constructors):
+        """
+        Bulk-load ConstructorSeason rows, final standings and drivers for the
+        given constructors with one query each. Already loaded ids are skipped.
+        """
+        cache = self._get_season_cache()
+        missing = {c.id for c in constructors} - cache['loaded']
+        if not missing:
+            return
+        
+        season_year = self._get_season_year()
+        
+        for season_data in ConstructorSeason.objects.filter(
+            season__year=season_year,
+            constructor_id__in=missing
+        ):
+            cache['season_data'][season_data.constructor_id] = season_data
+        
+        for standing in ChampionshipStanding.objects.filter(
+            season=season_year,
+            standing_type='constructor',
+            round=0,  # Season total
+            constructor_id__in=missing
+        ):
+            cache['standings'][standing.constructor_id] = standing
+        
+        # Get unique drivers for each constructor from specified season results
+        drivers = Driver.objects.filter(
+            results__constructor_id__in=missing,
+            results__season=season_year
+        ).annotate(
+            team_id=F('results__constructor_id')
+        ).order_by('last_name', 'first_name').distinct()
+        for driver in drivers:
+            cache['drivers'].setdefault(driver.team_id, []).append(driver)
         
-        active_season = Season.objects.filter(is_active=True).first()
-        return active_season.year if active_season else 2024
+        cache['loaded'].update(missing)
     
     def _get_constructor_season(self, obj):
         """Get ConstructorSeason for current season if exists"""
-        season_year = self._get_season_year()
-        try:
-            return ConstructorSeason.objects.get(
-                constructor=obj,
-                season__year=season_year
-            )
-        except ConstructorSeason.DoesNotExist:
-            return None
+        self.load_season_data([obj])
+        return self._get_season_cache()['season_data'].get(obj.id)
     
     def get_car_model(self, obj):
         """Get car model from ConstructorSeason or fallback to base model"""
@@ -222,38 +330,25 @@ class ConstructorSerializer(serializers.ModelSerializer):
     
     def get_drivers(self, obj):
         """Get drivers for this constructor in the specified season"""
-        season_year = self._get_season_year()
-        
-        # Get unique drivers for this constructor from specified season results
-        from django.db.models import Q
-        drivers = Driver.objects.filter(
-            results__constructor=obj,
-            results__race__season=season_year
-        ).distinct()
+        self.load_season_data([obj])
+        drivers = self._get_season_cache()['drivers'].get(obj.id, [])
         return DriverSerializer(drivers, many=True).data
     
     def get_championship_position(self, obj):
         """Get constructor championship standing for specified season"""
-        season_year = self._get_season_year()
-        
-        # Get constructor championship standing for specified season
-        try:
-            standing = ChampionshipStanding.objects.get(
-                constructor=obj,
-                season=season_year,
-                standing_type='constructor',
-                round=0  # Season total
-            )
-            return {
-                'position': standing.position,
-                'points': standing.points,
-                'wins': standing.wins
-            }
-        except ChampionshipStanding.DoesNotExist:
+        self.load_season_data([obj])
+        standing = self._get_season_cache()['standings'].get(obj.id)
+        if standing is None:
             return None
+        
+        return {
+            'position': standing.position,
+            'points': standing.points,
+            'wins': standing.wins
+        }
 
 
-class RaceSerializer(serializers.ModelSerializer):
+class RaceSerializer(FlexFieldsSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = Race
         fields = [
@@ -264,73 +359,78 @@ class RaceSerializer(serializers.ModelSerializer):
         read_only_fields = ['created_at', 'updated_at']
 
 
-class ResultSerializer(serializers.ModelSerializer):
-    driver = DriverSerializer(read_only=True)
-    constructor = ConstructorSerializer(read_only=True)
-    race = RaceSerializer(read_only=True)
-    
+class ResultSerializer(FlexFieldsSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = Result
         fields = [
-            'id', 'race', 'driver', 'constructor',
+            'id', 'race', 'season', 'driver', 'constructor',
             'grid_position', 'final_position', 'position_text',
             'points', 'laps_completed', 'status', 'retirement_reason',
-            'fastest_lap', 'fastest_lap_time', 'fastest_lap_speed',
+            'fastest_lap', 'fastest_lap_time', 'fastest_lap_time_milliseconds', 'fastest_lap_speed',
             'created_at', 'updated_at'
         ]
-        read_only_fields = ['created_at', 'updated_at']
+        read_only_fields = ['race', 'driver', 'constructor', 'created_at', 'updated_at']
+        expandable_fields = {
+            'race': RaceSerializer,
+            'driver': DriverSerializer,
+            'constructor': ConstructorSerializer,
+        }
+        list_serializer_class = ExpandableListSerializer
 
 
-class QualifyingSerializer(serializers.ModelSerializer):
-    driver = DriverSerializer(read_only=True)
-    constructor = ConstructorSerializer(read_only=True)
-    race = RaceSerializer(read_only=True)
-    
+class QualifyingSerializer(FlexFieldsSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = Qualifying
         fields = [
-            'id', 'race', 'driver', 'constructor',
+            'id', 'race', 'season', 'driver', 'constructor',
             'position', 'q1_time', 'q2_time', 'q3_time',
+            'q1_milliseconds', 'q2_milliseconds', 'q3_milliseconds',
             'created_at', 'updated_at'
         ]
-        read_only_fields = ['created_at', 'updated_at']
+        read_only_fields = ['race', 'driver', 'constructor', 'created_at', 'updated_at']
+        expandable_fields = {
+            'race': RaceSerializer,
+            'driver': DriverSerializer,
+            'constructor': ConstructorSerializer,
+        }
+        list_serializer_class = ExpandableListSerializer
 
 
-class SprintSerializer(serializers.ModelSerializer):
-    driver = DriverSerializer(read_only=True)
-    constructor = ConstructorSerializer(read_only=True)
-    race = RaceSerializer(read_only=True)
-    
+class SprintSerializer(FlexFieldsSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = Sprint
         fields = [
-            'id', 'race', 'driver', 'constructor',
+            'id', 'race', 'season', 'driver', 'constructor',
             'grid_position', 'final_position', 'position_text',
             'points', 'laps_completed', 'status', 'retirement_reason',
-            'fastest_lap_time',
+            'fastest_lap_time', 'fastest_lap_time_milliseconds',
             'created_at', 'updated_at'
         ]
-        read_only_fields = ['created_at', 'updated_at']
+        read_only_fields = ['race', 'driver', 'constructor', 'created_at', 'updated_at']
+        expandable_fields = {
+            'race': RaceSerializer,
+            'driver': DriverSerializer,
+            'constructor': ConstructorSerializer,
+        }
+        list_serializer_class = ExpandableListSerializer
 
 
-class LapSerializer(serializers.ModelSerializer):
-    driver = DriverSerializer(read_only=True)
-    race = RaceSerializer(read_only=True)
-    
+class LapSerializer(FlexFieldsSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = Lap
         fields = [
-            'id', 'race', 'driver', 'lap_number',
+            'id', 'race', 'season', 'driver', 'lap_number',
             'position', 'lap_time', 'lap_time_milliseconds',
             'created_at'
         ]
-        read_only_fields = ['created_at']
+        read_only_fields = ['race', 'driver', 'created_at']
+        expandable_fields = {
+            'race': RaceSerializer,
+            'driver': DriverSerializer,
+        }
 
 
-class ChampionshipStandingSerializer(serializers.ModelSerializer):
-    driver = DriverSerializer(read_only=True)
-    constructor = ConstructorSerializer(read_only=True)
-    
+class ChampionshipStandingSerializer(FlexFieldsSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = ChampionshipStanding
         fields = [
@@ -338,4 +438,9 @@ class ChampionshipStandingSerializer(serializers.ModelSerializer):
             'driver', 'constructor', 'position', 'points', 'wins',
             'created_at', 'updated_at'
         ]
-        read_only_fields = ['created_at', 'updated_at']
+        read_only_fields = ['driver', 'constructor', 'created_at', 'updated_at']
+        expandable_fields = {
+            'driver': DriverSerializer,
+            'constructor': ConstructorSerializer,
+        }
+        list_serializer_class = ExpandableListSerializer
@@ -1,3 +1,250 @@
+from datetime import date
 from django.test import TestCase
+from rest_framework.test import APIClient
+from core.models import Constructor, Driver, LapSeries, Qualifying, Race, Result
+from core.services.cache_service import SeasonCacheService
 
-# Create your tests here.
+
+class ConditionalGetTests(TestCase):
+    """
+    Responses carry an ETag derived from the season data versions and are
+    answered with 304 while the versions have not changed.
+    """
+
+    SEASON = 2023
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.driver = Driver.objects.create(driver_id='driver', first_name='Driver', last_name='One', nationality='British')
+        cls.constructor = Constructor.objects.create(constructor_id='team', name='Team', nationality='Italian')
+        cls.race = Race.objects.create(
+            race_id=f'{cls.SEASON}_1', season=cls.SEASON, round=1, race_name='Grand Prix', circuit_id='circuit',
+            circuit_name='Circuit', locality='City', country='Country', date=date(cls.SEASON, 3, 1),
+        )
+        Result.objects.create(
+            race=cls.race, driver=cls.driver, constructor=cls.constructor,
+            grid_position=1, final_position=1, position_text='1', points=25,
+        )
+
+    def setUp(self):
+        self.client = APIClient()
+
+    def get(self, path, **headers):
+        return self.client.get(path, **headers)
+
+    def test_not_modified_until_the_season_changes(self):
+        path = f'/api/v1/results/?season={self.SEASON}'
+        response = self.get(path)
+        self.assertEqual(response.status_code, 200)
+        etag = response['ETag']
+
+        with self.assertNumQueries(1):
+            not_modified = self.get(path, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(not_modified['ETag'], etag)
+
+        # Other seasons and data not tied to a season do not affect it
+        SeasonCacheService.bump_version(self.SEASON - 1)
+        self.assertEqual(self.get(path, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        SeasonCacheService.bump_version(self.SEASON)
+        response = self.get(path, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_expanded_drivers_follow_driver_changes(self):
+        path = f'/api/v1/results/?season={self.SEASON}&expand=driver'
+        etag = self.get(path)['ETag']
+        self.driver.nationality = 'German'
+        self.driver.save()
+        self.assertEqual(self.get(path, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_cache_lifetime_follows_the_requested_season(self):
+        for path in [
+            f'/api/v1/results/?season={self.SEASON}',
+            f'/api/v1/results/?season={self.SEASON}&expand=driver,constructor,race',
+            f'/api/v1/constructors/?season={self.SEASON}',
+        ]:
+            self.assertIn('max-age=', self.get(path)['Cache-Control'], path)
+        self.assertEqual(self.get(f'/api/v1/results/?season={date.today().year}')['Cache-Control'], 'no-cache')
+        self.assertEqual(self.get('/api/v1/results/')['Cache-Control'], 'no-cache')
+
+    def test_invalid_season(self):
+        self.assertEqual(self.get('/api/v1/constructors/?season=abc').status_code, 400)
+        self.assertEqual(self.get('/api/v1/results/?season=abc').status_code, 400)
+
+
+class FlexFieldsTests(TestCase):
+    """
+    ?fields= trims the serialized fields and relations come back as ids
+    unless listed in ?expand=, which joins them in the same query.
+    """
+
+    SEASON = 2023
+
+    @classmethod
+    def setUpTestData(cls):
+        constructor = Constructor.objects.create(constructor_id='team', name='Team', nationality='Italian')
+        cls.race = Race.objects.create(
+            race_id=f'{cls.SEASON}_1', season=cls.SEASON, round=1, race_name='Grand Prix', circuit_id='circuit',
+            circuit_name='Circuit', locality='City', country='Country', date=date(cls.SEASON, 3, 1),
+        )
+        cls.drivers = []
+        for position, name in enumerate(['One', 'Two', 'Three'], start=1):
+            driver = Driver.objects.create(
+                driver_id=name.lower(), first_name='Driver', last_name=name, nationality='British',
+            )
+            Result.objects.create(
+                race=cls.race, driver=driver, constructor=constructor, season=cls.SEASON,
+                grid_position=position, final_position=position, position_text=str(position), points=10 - position,
+            )
+            cls.drivers.append(driver)
+
+    def setUp(self):
+        self.client = APIClient()
+
+    def get_results(self, query=''):
+        response = self.client.get(f'/api/v1/results/?season={self.SEASON}{query}')
+        self.assertEqual(response.status_code, 200)
+        return response.json()['results']
+
+    def test_fields_trim_the_output(self):
+        results = self.get_results('&fields=id,points,driver')
+        self.assertEqual([set(result) for result in results], [{'id', 'points', 'driver'}] * 3)
+        self.assertEqual([result['driver'] for result in results], [driver.id for driver in self.drivers])
+
+        # Expanding a relation that is not requested does not add it
+        results = self.get_results('&fields=id,points&expand=driver')
+        self.assertEqual([set(result) for result in results], [{'id', 'points'}] * 3)
+
+    def test_relations_are_ids_unless_expanded(self):
+        with self.assertNumQueries(3) as queries:
+            results = self.get_results()
+        self.assertEqual(results[0]['race'], self.race.id)
+        self.assertEqual([result['driver'] for result in results], [driver.id for driver in self.drivers])
+        self.assertNotIn('"core_driver"', queries.captured_queries[-1]['sql'])
+
+        # Expanded relations are joined: no query per row
+        with self.assertNumQueries(3) as queries:
+            results = self.get_results('&expand=race,driver')
+        self.assertEqual(results[0]['race']['race_id'], f'{self.SEASON}_1')
+        self.assertEqual([result['driver']['last_name'] for result in results], ['One', 'Two', 'Three'])
+        self.assertIsInstance(results[0]['constructor'], int)
+        self.assertIn('"core_driver"."last_name"', queries.captured_queries[-1]['sql'])
+
+
+class TimingEndpointTests(TestCase):
+    """
+    Fastest laps, gaps to pole, lap charts and lap records of the race
+    endpoints, computed by TimingService on the millisecond columns.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        constructor = Constructor.objects.create(constructor_id='team', name='Team', nationality='Italian')
+        cls.drivers = {
+            code: Driver.objects.create(
+                driver_id=code, first_name='Driver', last_name=name, code=code.upper(), nationality='British',
+            )
+            for code, name in [('ver', 'Verstappen'), ('ham', 'Hamilton'), ('lec', 'Leclerc')]
+        }
+        cls.races = {}
+        for key, season, round_num, circuit_id, circuit_name in [
+            ('monza_2022', 2022, 1, 'monza', 'Monza'),
+            ('monza', 2023, 1, 'monza', 'Monza'),
+            ('spa', 2023, 2, 'spa', 'Spa'),
+        ]:
+            cls.races[key] = Race.objects.create(
+                race_id=f'{season}_{round_num}', season=season, round=round_num, race_name='Grand Prix',
+                circuit_id=circuit_id, circuit_name=circuit_name, locality='City', country='Country',
+                date=date(season, 3, round_num),
+            )
+
+        for race, code, lap, time, milliseconds in [
+            ('monza_2022', 'ham', 30, '1:20.000', 80000),
+            ('monza', 'ver', 50, '1:21.000', 81000),
+            ('monza', 'ham', 40, '1:20.500', 80500),
+            ('monza', 'lec', None, None, None),
+            ('spa', 'ver', 20, '1:45.000', 105000),
+        ]:
+            Result.objects.create(
+                race=cls.races[race], driver=cls.drivers[code], constructor=constructor,
+                grid_position=1, final_position=1, position_text='1', points=0,
+                fastest_lap=lap, fastest_lap_time=time, fastest_lap_time_milliseconds=milliseconds,
+            )
+
+        for race, code, position, q1, q2, q3 in [
+            ('monza', 'ver', 1, 81000, 80500, 80000),
+            ('monza', 'ham', 2, 81200, 80600, 80250),
+            ('monza', 'lec', 3, 82000, None, None),
+            # No times for the pole sitter
+            ('spa', 'ver', 1, None, None, None),
+            ('spa', 'ham', 2, 106000, None, None),
+        ]:
+            Qualifying.objects.create(
+                race=cls.races[race], driver=cls.drivers[code], constructor=constructor, position=position,
+                q1_milliseconds=q1, q2_milliseconds=q2, q3_milliseconds=q3,
+            )
+
+        LapSeries.objects.create(
+            race=cls.races['monza'], driver=cls.drivers['ver'],
+            lap_times_milliseconds=[90000, None, 89500], positions=[2, 2, 1],
+        )
+        LapSeries.objects.create(
+            race=cls.races['monza'], driver=cls.drivers['ham'],
+            lap_times_milliseconds=[89000, 89900, None], positions=[1, 1, 2],
+        )
+
+    def setUp(self):
+        self.client = APIClient()
+
+    def get(self, path):
+        response = self.client.get(f'/api/v1/races/{path}')
+        self.assertEqual(response.status_code, 200, path)
+        return response.json()
+
+    def test_fastest_laps(self):
+        race = self.races['monza']
+        fastest_laps = self.get(f'{race.id}/fastest-laps/')['fastest_laps']
+        # Drivers without a fastest lap are left out
+        self.assertEqual(
+            [(lap['rank'], lap['driver']['code'], lap['lap'], lap['gap_milliseconds']) for lap in fastest_laps],
+            [(1, 'HAM', 40, 0), (2, 'VER', 50, 500)],
+        )
+        self.assertEqual(fastest_laps[0]['time'], '1:20.500')
+
+        fastest_laps = self.get(f'{race.id}/fastest-laps/?limit=1')['fastest_laps']
+        self.assertEqual([lap['driver']['code'] for lap in fastest_laps], ['HAM'])
+        self.assertEqual(self.client.get(f'/api/v1/races/{race.id}/fastest-laps/?limit=abc').status_code, 400)
+
+    def test_pole_gap(self):
+        qualifying = self.get(f"{self.races['monza'].id}/pole-gap/")['qualifying']
+        # Compared on the last session each driver reached
+        self.assertEqual(
+            [(row['position'], row['driver']['code'], row['best_milliseconds'], row['gap_milliseconds'])
+             for row in qualifying],
+            [(1, 'VER', 80000, 0), (2, 'HAM', 80250, 250), (3, 'LEC', 82000, 2000)],
+        )
+
+        qualifying = self.get(f"{self.races['spa'].id}/pole-gap/")['qualifying']
+        self.assertEqual([row['gap_milliseconds'] for row in qualifying], [None, None])
+
+    def test_laps(self):
+        drivers = self.get(f"{self.races['monza'].id}/laps/")['drivers']
+        self.assertEqual(
+            [(row['driver']['code'], row['laps'], row['lap_times_milliseconds'], row['positions']) for row in drivers],
+            [('HAM', 3, [89000, 89900, None], [1, 1, 2]), ('VER', 3, [90000, None, 89500], [2, 2, 1])],
+        )
+        self.assertEqual(self.get(f"{self.races['spa'].id}/laps/")['drivers'], [])
+
+    def test_lap_records(self):
+        records = self.get('lap-records/')['lap_records']
+        # One record per circuit, however many races it held
+        self.assertEqual(
+            [(record['circuit_id'], record['driver']['code'], record['season'], record['milliseconds'])
+             for record in records],
+            [('monza', 'HAM', 2022, 80000), ('spa', 'VER', 2023, 105000)],
+        )
+
+        records = self.get('lap-records/?circuit_id=spa')['lap_records']
+        self.assertEqual([record['circuit_id'] for record in records], ['spa'])
@@ -1,31 +1,228 @@
+import hashlib
+from datetime import date, datetime, time, timezone
 from rest_framework import viewsets, filters
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
-from django.db.models import Sum, Count, Q
+from django.conf import settings
+from django.db.models import Sum, Count, Q, OuterRef, Subquery, Prefetch
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date
 from core.models import (
     Driver, Constructor, Race, Result, Lap, 
     ChampionshipStanding, ConstructorSeason, DriverSeason,
     Qualifying, Sprint, Season
 )
+from core.services.cache_service import SeasonCacheService
+from core.services.championship_service import ChampionshipService
+from core.services.timing_service import TimingService
 from .serializers import (
     DriverSerializer, ConstructorSerializer, RaceSerializer, 
     ResultSerializer, LapSerializer, ChampionshipStandingSerializer,
     ConstructorSeasonSerializer, DriverSeasonSerializer,
-    QualifyingSerializer, SprintSerializer, SeasonSerializer
+    QualifyingSerializer, SprintSerializer, SeasonSerializer,
+    resolve_season_year
 )
 
 
-class SeasonViewSet(viewsets.ReadOnlyModelViewSet):
+class FlexFieldsMixin:
+    """
+    Viewset mixin for sparse fieldsets and relation expansion.
+    
+    Query params:
+        fields: comma-separated fields to return (e.g. ?fields=id,points,driver)
+        expand: comma-separated relations to nest instead of returning ids
+                (e.g. ?expand=driver,constructor)
+    
+    Only the relations that are expanded are joined in the queryset.
+    """
+    
+    def _get_param_set(self, name):
+        request = getattr(self, 'request', None)
+        if request is None:
+            return set()
+        value = request.query_params.get(name, '')
+        return {item.strip() for item in value.split(',') if item.strip()}
+    
+    def get_expanded_fields(self):
+        """Expandable relations requested by the client"""
+        meta = getattr(self.get_serializer_class(), 'Meta', None)
+        expandable = getattr(meta, 'expandable_fields', {})
+        expand = self._get_param_set('expand') & set(expandable)
+        
+        fields = self._get_param_set('fields')
+        if fields:
+            expand &= fields
+        return expand
+    
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context['fields'] = self._get_param_set('fields')
+        context['expand'] = self.get_expanded_fields()
+        return context
+    
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        expand = self.get_expanded_fields()
+        if expand:
+            queryset = queryset.select_related(*sorted(expand))
+        return queryset
+
+
+class ConditionalGetMixin:
+    """
+    Viewset mixin for conditional GET requests on list and retrieve.
+    
+    The data only changes when an import runs, and every write bumps the data
+    version of its season and the global version (SeasonCacheService).
+    Responses are validated with one query on the version table: on the
+    version of the season given in the query string, or on the global
+    version when the response may cover any season or includes data not
+    tied to a season. Requests whose If-None-Match or If-Modified-Since
+    still matches get a 304 before the view queries or serializes anything.
+    
+    Responses for a completed season are cacheable for
+    API_COMPLETED_SEASON_MAX_AGE seconds, others must be revalidated.
+    
+    Class attributes:
+        validator_season_params: query parameters selecting a single season
+        validator_global: responses include data not tied to a season
+                          (drivers, constructors, career statistics)
+        validator_daily: responses include values derived from today's date (driver ages)
+    """
+    
+    validator_season_params = ('season',)
+    validator_global = False
+    validator_daily = False
+    
+    def list(self, request, *args, **kwargs):
+        return self.conditional_response(super().list, request, *args, **kwargs)
+    
+    def retrieve(self, request, *args, **kwargs):
+        return self.conditional_response(super().retrieve, request, *args, **kwargs)
+    
+    def get_validator_seasons(self):
+        """
+        Seasons covered by the response.
+        
+        Returns:
+            Set of season years, or None when the response may cover any season
+        """
+        seasons = set()
+        for param in self.validator_season_params:
+            value = self.request.query_params.get(param)
+            if value is None:
+                continue
+            try:
+                seasons.add(int(value))
+            except ValueError:
+                # Answered with 400 by the filter backend
+                return None
+        return seasons or None
+    
+    def is_validator_global(self):
+        """Whether the response includes drivers, constructors or career statistics"""
+        expand = self.get_expanded_fields() if hasattr(self, 'get_expanded_fields') else set()
+        return self.validator_global or bool(expand & {'driver', 'constructor'})
+    
+    def is_validator_daily(self):
+        """Whether the response includes driver ages"""
+        expand = self.get_expanded_fields() if hasattr(self, 'get_expanded_fields') else set()
+        return self.validator_daily or bool(expand & {'driver', 'constructor'})
+    
+    def get_validators(self, seasons):
+        """
+        Compute the validators of a response.
+        
+        Args:
+            seasons: Seasons covered by the response (None = every season)
+        
+        Returns:
+            Tuple of (etag, last_modified); last_modified is None before the
+            first write of the covered seasons
+        """
+        if seasons is None:
+            # Bumped with every season
+            keys = {SeasonCacheService.GLOBAL_SEASON}
+        elif self.is_validator_global():
+            keys = seasons | {SeasonCacheService.GLOBAL_SEASON}
+        else:
+            keys = seasons
+        versions = SeasonCacheService.get_versions(keys)
+        
+        parts = [self.request.get_full_path(), self.request.accepted_media_type]
+        parts += [f'{season}:{versions.get(season, (0, None))[0]}' for season in sorted(keys)]
+        modified = [updated_at for _, updated_at in versions.values()]
+        last_modified = max(modified) if modified else None
+        
+        if self.is_validator_daily():
+            today = date.today()
+            parts.append(today)
+            midnight = datetime.combine(today, time.min, tzinfo=timezone.utc)
+            last_modified = max(last_modified, midnight) if last_modified else midnight
+        
+        digest = hashlib.sha256('|'.join(str(part) for part in parts).encode('utf-8')).hexdigest()
+        return f'W/"{digest[:32]}"', last_modified
+    
+    def get_max_age(self, seasons):
+        """
+        Seconds a response may be reused without revalidation (0 = always revalidate).
+        
+        Only depends on the requested season: driver ages embedded in the
+        response may lag by up to the max-age.
+        
+        Args:
+            seasons: Seasons requested by the client (None = every season)
+        """
+        if not seasons or max(seasons) >= date.today().year:
+            return 0
+        return settings.API_COMPLETED_SEASON_MAX_AGE
+    
+    def conditional_response(self, render, request, *args, **kwargs):
+        """
+        Answer with 304 when the client's copy is current, otherwise render
+        the response and attach the validators.
+        
+        Args:
+            render: Handler producing the full response (list or retrieve)
+        
+        Returns:
+            The 304 or rendered response
+        """
+        seasons = self.get_validator_seasons()
+        etag, last_modified = self.get_validators(seasons)
+        
+        timestamp = int(last_modified.timestamp()) if last_modified else None
+        response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+        if response is None:
+            response = render(request, *args, **kwargs)
+            if response.status_code != 200:
+                return response
+        
+        response['ETag'] = etag
+        if timestamp is not None:
+            response['Last-Modified'] = http_date(timestamp)
+        max_age = self.get_max_age(seasons)
+        if max_age:
+            patch_cache_control(response, public=True, max_age=max_age)
+        else:
+            patch_cache_control(response, no_cache=True)
+        patch_vary_headers(response, ['Accept'])
+        return response
+
+
+class SeasonViewSet(ConditionalGetMixin, FlexFieldsMixin, viewsets.ReadOnlyModelViewSet):
     """
     API endpoint for viewing F1 seasons.
     """
     queryset = Season.objects.all()
     serializer_class = SeasonSerializer
     ordering = ['-year']
+    validator_season_params = ()
+    validator_global = True
 
 
-class DriverViewSet(viewsets.ReadOnlyModelViewSet):
+class DriverViewSet(ConditionalGetMixin, FlexFieldsMixin, viewsets.ReadOnlyModelViewSet):
     """
     API endpoint for viewing drivers.
     """
@@ -36,23 +233,46 @@ class DriverViewSet(viewsets.ReadOnlyModelViewSet):
     search_fields = ['first_name', 'last_name', 'driver_id']
     ordering_fields = ['last_name', 'number']
     ordering = ['last_name']
+    validator_season_params = ()
+    validator_global = True
+    validator_daily = True
 
 
-class DriverSeasonViewSet(viewsets.ReadOnlyModelViewSet):
+class DriverSeasonViewSet(ConditionalGetMixin, FlexFieldsMixin, viewsets.ReadOnlyModelViewSet):
     """
     API endpoint for viewing drivers with season-specific data including team colors and career stats.
     Filter by season year to get drivers for that season with their team info.
     """
-    queryset = DriverSeason.objects.select_related('driver', 'constructor', 'season').all()
+    queryset = DriverSeason.objects.select_related(
+        'driver', 'driver__career_stats', 'constructor', 'season'
+    ).prefetch_related(
+        Prefetch('constructor__season_data', to_attr='prefetched_season_data'),
+        Prefetch(
+            'driver__standings',
+            queryset=ChampionshipStanding.objects.filter(standing_type='driver', round=0),
+            to_attr='prefetched_season_totals'
+        ),
+    ).annotate(
+        best_season_finish=Subquery(
+            Result.objects.filter(
+                driver=OuterRef('driver'),
+                season=OuterRef('season__year'),
+                final_position__isnull=False
+            ).order_by('final_position').values('final_position')[:1]
+        )
+    )
     serializer_class = DriverSeasonSerializer
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_fields = ['season__year', 'constructor', 'driver']
     search_fields = ['driver__first_name', 'driver__last_name', 'constructor__name']
     ordering_fields = ['driver__last_name', 'season__year']
     ordering = ['-season__year', 'driver__last_name']
+    validator_season_params = ('season__year',)
+    validator_global = True
+    validator_daily = True
 
 
-class ConstructorViewSet(viewsets.ReadOnlyModelViewSet):
+class ConstructorViewSet(ConditionalGetMixin, FlexFieldsMixin, viewsets.ReadOnlyModelViewSet):
     """
     API endpoint for viewing constructors.
     """
@@ -63,9 +283,21 @@ class ConstructorViewSet(viewsets.ReadOnlyModelViewSet):
     search_fields = ['name', 'constructor_id']
     ordering_fields = ['name']
     ordering = ['name']
+    validator_global = True
+    validator_daily = True
+    
+    def get_serializer_context(self):
+        """Resolve the season once per request for every serialized constructor"""
+        context = super().get_serializer_context()
+        context['season_year'] = resolve_season_year(self.request)
+        return context
+    
+    def get_validator_seasons(self):
+        """Season data is read for the requested (or active) season"""
+        return {resolve_season_year(self.request)}
 
 
-class ConstructorSeasonViewSet(viewsets.ReadOnlyModelViewSet):
+class ConstructorSeasonViewSet(ConditionalGetMixin, FlexFieldsMixin, viewsets.ReadOnlyModelViewSet):
     """
     API endpoint for viewing constructor season-specific data (car models, colors, etc).
     """
@@ -76,9 +308,11 @@ class ConstructorSeasonViewSet(viewsets.ReadOnlyModelViewSet):
     search_fields = ['constructor__name', 'car_model']
     ordering_fields = ['season__year', 'constructor__name']
     ordering = ['-season__year', 'constructor__name']
+    validator_season_params = ('season__year',)
+    validator_global = True
 
 
-class RaceViewSet(viewsets.ReadOnlyModelViewSet):
+class RaceViewSet(ConditionalGetMixin, FlexFieldsMixin, viewsets.ReadOnlyModelViewSet):
     """
     API endpoint for viewing races.
     """
@@ -89,38 +323,89 @@ class RaceViewSet(viewsets.ReadOnlyModelViewSet):
     search_fields = ['race_name', 'circuit_name', 'country']
     ordering_fields = ['season', 'round', 'date']
     ordering = ['-season', 'round']
+    
+    @action(detail=True, methods=['get'], url_path='fastest-laps')
+    def fastest_laps(self, request, pk=None):
+        """
+        Drivers of a race ranked by their fastest lap, with the gap to the fastest.
+        Query params: limit (optional, e.g. 1 for the fastest lap only)
+        """
+        race = self.get_object()
+        limit = request.query_params.get('limit')
+        try:
+            limit = int(limit) if limit else None
+        except ValueError:
+            return Response({'error': 'limit must be an integer'}, status=400)
+        
+        return Response({
+            'race': race.id,
+            'fastest_laps': TimingService.get_fastest_laps(race.id, limit),
+        })
+    
+    @action(detail=True, methods=['get'], url_path='pole-gap')
+    def pole_gap(self, request, pk=None):
+        """
+        Qualifying order of a race with each driver's gap to pole.
+        """
+        race = self.get_object()
+        return Response({
+            'race': race.id,
+            'qualifying': TimingService.get_pole_gaps(race.id),
+        })
+    
+    @action(detail=True, methods=['get'])
+    def laps(self, request, pk=None):
+        """
+        Lap times and positions of every driver in a race, one entry per driver.
+        """
+        race = self.get_object()
+        return Response({
+            'race': race.id,
+            'drivers': TimingService.get_race_laps(race.id),
+        })
+    
+    @action(detail=False, methods=['get'], url_path='lap-records')
+    def lap_records(self, request):
+        """
+        Race lap record of every circuit.
+        Query params: circuit_id (optional)
+        """
+        return Response({
+            'lap_records': TimingService.get_lap_records(request.query_params.get('circuit_id')),
+        })
 
 
-class ResultViewSet(viewsets.ReadOnlyModelViewSet):
+class ResultViewSet(ConditionalGetMixin, FlexFieldsMixin, viewsets.ReadOnlyModelViewSet):
     """
     API endpoint for viewing race results.
     """
-    queryset = Result.objects.select_related('race', 'driver', 'constructor').all()
+    queryset = Result.objects.all()
     serializer_class = ResultSerializer
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
-    filterset_fields = ['race__season', 'race', 'driver', 'constructor', 'status']
+    filterset_fields = ['season', 'race__season', 'race', 'driver', 'constructor', 'status', 'final_position']
     ordering_fields = ['race', 'final_position', 'points']
     ordering = ['race', 'final_position']
+    validator_season_params = ('season', 'race__season')
 
 
-class LapViewSet(viewsets.ReadOnlyModelViewSet):
+class LapViewSet(ConditionalGetMixin, FlexFieldsMixin, viewsets.ReadOnlyModelViewSet):
     """
     API endpoint for viewing lap times.
     """
-    queryset = Lap.objects.select_related('race', 'driver').all()
+    queryset = Lap.objects.all()
     serializer_class = LapSerializer
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
-    filterset_fields = ['race', 'driver', 'lap_number']
+    filterset_fields = ['season', 'race', 'driver', 'lap_number']
     ordering_fields = ['lap_number', 'lap_time_milliseconds']
     ordering = ['race', 'lap_number', 'position']
 
 
-class ChampionshipStandingViewSet(viewsets.ReadOnlyModelViewSet):
+class ChampionshipStandingViewSet(ConditionalGetMixin, FlexFieldsMixin, viewsets.ReadOnlyModelViewSet):
     """
     API endpoint for viewing championship standings.
     Supports progressive standings calculation by round.
     """
-    queryset = ChampionshipStanding.objects.select_related('driver', 'constructor').all()
+    queryset = ChampionshipStanding.objects.all()
     serializer_class = ChampionshipStandingSerializer
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
     filterset_fields = ['season', 'standing_type', 'round', 'driver', 'constructor']
@@ -146,105 +431,37 @@ class ChampionshipStandingViewSet(viewsets.ReadOnlyModelViewSet):
         except ValueError:
             return Response({'error': 'season and round must be integers'}, status=400)
         
-        # Get all races up to and including this round
-        races = Race.objects.filter(season=season, round__lte=round_num).order_by('round')
-        
-        if standing_type == 'driver':
-            # Calculate driver standings
-            from django.db.models import Sum, F, Max
-            from core.models import DriverSeason
-            
-            standings = []
-            results = Result.objects.filter(
-                race__in=races
-            ).values('driver', 'driver__first_name','driver__last_name', 'driver__code', 'driver__number').annotate(
-                total_points=Sum('points'),
-                total_wins=Count('id', filter=Q(final_position=1))
-            ).order_by('-total_points', '-total_wins')
-            
-            # Get team for each driver (latest team in this round range)
-            for idx, standing in enumerate(results, 1):
-                driver_id = standing['driver']
-                
-                # Find latest team for this driver up to this round
-                latest_result = Result.objects.filter(
-                    driver_id=driver_id,
-                    race__season=season,
-                    race__round__lte=round_num
-                ).select_related('constructor', 'race').order_by('-race__round', '-race__date').first()
-                
-                standings.append({
-                    'position': idx,
-                    'driver': {
-                        'id': driver_id,
-                        'first_name': standing['driver__first_name'],
-                        'last_name': standing['driver__last_name'],
-                        'code': standing['driver__code'],
-                        'number': standing['driver__number'],
-                    },
-                    'constructor': {
-                        'id': latest_result.constructor.id,
-                        'name': latest_result.constructor.name,
-                        'team_color': latest_result.constructor.team_color,
-                    } if latest_result else None,
-                    'points': round(standing['total_points'], 1),
-                    'wins': standing['total_wins'],
-                })
-            
-            return Response({
-                'season': season,
-                'round': round_num,
-                'standings': standings
-            })
+        standings = ChampionshipService.get_progressive_standings(season, round_num, standing_type)
         
-        else:
-            # Constructor standings
-            standings = []
-            results = Result.objects.filter(
-                race__in=races
-            ).values('constructor', 'constructor__name').annotate(
-                total_points=Sum('points'),
-                total_wins=Count('race', filter=Q(final_position=1), distinct=True)
-            ).order_by('-total_points', '-total_wins')
-            
-            for idx, standing in enumerate(results, 1):
-                standings.append({
-                    'position': idx,
-                    'constructor': {
-                        'id': standing['constructor'],
-                        'name': standing['constructor__name'],
-                    },
-                    'points': round(standing['total_points'], 1),
-                    'wins': standing['total_wins'],
-                })
-            
-            return Response({
-                'season': season,
-                'round': round_num,
-                'standings': standings
-            })
-
-
-class QualifyingViewSet(viewsets.ReadOnlyModelViewSet):
+        return Response({
+            'season': season,
+            'round': round_num,
+            'standings': standings
+        })
+
+
+class QualifyingViewSet(ConditionalGetMixin, FlexFieldsMixin, viewsets.ReadOnlyModelViewSet):
     """
     API endpoint for viewing qualifying results.
     """
-    queryset = Qualifying.objects.select_related('race', 'driver', 'constructor').all()
+    queryset = Qualifying.objects.all()
     serializer_class = QualifyingSerializer
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
-    filterset_fields = ['race__season', 'race', 'driver', 'constructor']
+    filterset_fields = ['season', 'race__season', 'race', 'driver', 'constructor']
     ordering_fields = ['position']
     ordering = ['race', 'position']
+    validator_season_params = ('season', 'race__season')
 
 
-class SprintViewSet(viewsets.ReadOnlyModelViewSet):
+class SprintViewSet(ConditionalGetMixin, FlexFieldsMixin, viewsets.ReadOnlyModelViewSet):
     """
     API endpoint for viewing sprint race results.
     """
-    queryset = Sprint.objects.select_related('race', 'driver', 'constructor').all()
+    queryset = Sprint.objects.all()
     serializer_class = SprintSerializer
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
-    filterset_fields = ['race__season', 'race', 'driver', 'constructor', 'status']
+    filterset_fields = ['season', 'race__season', 'race', 'driver', 'constructor', 'status', 'final_position']
     ordering_fields = ['final_position', 'points']
     ordering = ['race', 'final_position']
+    validator_season_params = ('season', 'race__season')
 
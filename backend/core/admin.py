@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Season, Driver, DriverSeason, Constructor, ConstructorSeason, Race, Result, Lap, ChampionshipStanding, Qualifying, Sprint
+from .models import Season, Driver, DriverSeason, Constructor, ConstructorSeason, Race, Result, Lap, LapSeries, ChampionshipStanding, StandingsSnapshot, SeasonDataVersion, Qualifying, Sprint, DriverCareerStats, ImportState, RateLimitBucket
 
 
 @admin.register(Season)
@@ -51,7 +51,7 @@ class RaceAdmin(admin.ModelAdmin):
 class ResultAdmin(admin.ModelAdmin):
     list_display = ['race', 'driver', 'constructor', 'grid_position', 'final_position', 'points', 'status']
     search_fields = ['driver__last_name', 'constructor__name']
-    list_filter = ['race__season', 'status']
+    list_filter = ['season', 'status']
     raw_id_fields = ['race', 'driver', 'constructor']
 
 
@@ -59,8 +59,17 @@ class ResultAdmin(admin.ModelAdmin):
 class LapAdmin(admin.ModelAdmin):
     list_display = ['race', 'driver', 'lap_number', 'position', 'lap_time']
     search_fields = ['driver__last_name']
+    list_filter = ['season']
+    raw_id_fields = ['race', 'driver']
+
+
+@admin.register(LapSeries)
+class LapSeriesAdmin(admin.ModelAdmin):
+    list_display = ['race', 'driver', 'updated_at']
+    search_fields = ['driver__last_name']
     list_filter = ['race__season']
     raw_id_fields = ['race', 'driver']
+    readonly_fields = ['lap_times_milliseconds', 'positions']
 
 
 @admin.register(ChampionshipStanding)
@@ -74,11 +83,24 @@ class ChampionshipStandingAdmin(admin.ModelAdmin):
     get_entity.short_description = 'Driver/Constructor'
 
 
+@admin.register(StandingsSnapshot)
+class StandingsSnapshotAdmin(admin.ModelAdmin):
+    list_display = ['season', 'round', 'standing_type', 'is_stale', 'computed_at']
+    list_filter = ['season', 'standing_type', 'is_stale']
+    ordering = ['-season', 'round']
+
+
+@admin.register(SeasonDataVersion)
+class SeasonDataVersionAdmin(admin.ModelAdmin):
+    list_display = ['season', 'version', 'updated_at']
+    ordering = ['-season']
+
+
 @admin.register(Qualifying)
 class QualifyingAdmin(admin.ModelAdmin):
     list_display = ['race', 'position', 'driver', 'constructor', 'q1_time', 'q2_time', 'q3_time']
     search_fields = ['driver__last_name', 'constructor__name']
-    list_filter = ['race__season']
+    list_filter = ['season']
     raw_id_fields = ['race', 'driver', 'constructor']
     ordering = ['race', 'position']
 
@@ -87,6 +109,27 @@ class QualifyingAdmin(admin.ModelAdmin):
 class SprintAdmin(admin.ModelAdmin):
     list_display = ['race', 'final_position', 'driver', 'constructor', 'points', 'status']
     search_fields = ['driver__last_name', 'constructor__name']
-    list_filter = ['race__season', 'status']
+    list_filter = ['season', 'status']
     raw_id_fields = ['race', 'driver', 'constructor']
     ordering = ['race', 'final_position']
+
+
+@admin.register(DriverCareerStats)
+class DriverCareerStatsAdmin(admin.ModelAdmin):
+    list_display = ['driver', 'total_wins', 'total_podiums', 'world_championships', 'total_seasons', 'career_points']
+    search_fields = ['driver__last_name', 'driver__driver_id']
+    raw_id_fields = ['driver']
+    ordering = ['-world_championships', '-total_wins']
+
+
+@admin.register(ImportState)
+class ImportStateAdmin(admin.ModelAdmin):
+    list_display = ['season', 'round', 'resource', 'row_count', 'payload_hash', 'checked_at', 'updated_at']
+    list_filter = ['season', 'resource']
+    ordering = ['-season', 'round', 'resource']
+
+
+@admin.register(RateLimitBucket)
+class RateLimitBucketAdmin(admin.ModelAdmin):
+    list_display = ['name', 'tokens', 'refilled_at']
+    ordering = ['name']
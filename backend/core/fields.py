@@ -0,0 +1,44 @@
+"""
+Custom model fields.
+"""
+
+import json
+from django.db import models
+
+
+class IntegerListField(models.Field):
+    """
+    List of integers (None allowed for missing elements).
+
+    Stored as a native integer[] column on PostgreSQL (4 bytes per element,
+    no per-element text or JSON parsing) and as JSON text on other databases.
+    Values are always plain Python lists.
+    """
+
+    description = "List of integers"
+
+    def db_type(self, connection):
+        if connection.vendor == 'postgresql':
+            return 'integer[]'
+        return 'text'
+
+    def from_db_value(self, value, expression, connection):
+        if isinstance(value, str):
+            return json.loads(value)
+        return value
+
+    def to_python(self, value):
+        if isinstance(value, str):
+            return json.loads(value)
+        return value
+
+    def get_db_prep_value(self, value, connection, prepared=False):
+        if value is None:
+            return None
+        value = list(value)
+        if connection.vendor == 'postgresql':
+            return value
+        return json.dumps(value)
+
+    def value_to_string(self, obj):
+        return json.dumps(self.value_from_object(obj))
@@ -5,15 +5,64 @@ Usage:
     python manage.py import_f1_data --season 2024
     python manage.py import_f1_data --season 2024 --round 1
     python manage.py import_f1_data --season 2024 --calculate-standings
+    python manage.py import_f1_data --season 2024 --round 12 --calculate-standings
+    python manage.py import_f1_data --season 2023 --offline
+    python manage.py import_f1_data --season 2024 --laps
+    python manage.py import_f1_data --season 2024 --laps --purge-laps
+    python manage.py import_f1_data --season 2024 --full
+    python manage.py import_f1_data --season 2024 --full --dry-run --json
+
+With --round, standings are updated incrementally from the stored standings
+of the previous round. Without it, only rounds from the first stale one are
+recalculated. Use --recalculate-all to rebuild the whole season.
+
+All API data of a season is fetched first and then written in a single
+transaction with batched upserts; rows identical to the stored ones are
+left untouched.
+
+Imports are incremental: the hash of every fetched payload is stored per
+(season, round, resource) and unchanged payloads are not written again.
+Results, qualifying, sprints (and laps) are only fetched for rounds after
+the last imported one, so polling during a live season costs a few
+requests. --full fetches and rewrites every round.
+
+Lap times are only imported with --laps (they take many API pages per
+race). They are streamed race by race into the database, through COPY on
+PostgreSQL; races and drivers must already be imported. --purge-laps
+drops the stored laps of the season first (a partition TRUNCATE on
+PostgreSQL) and imports them all again.
+
+API responses are cached on disk (F1_API_CACHE_DIR). --offline rebuilds the
+data from the cache only, without any network request; --refresh-cache
+downloads everything again.
+
+--dry-run fetches (or replays, with --offline) the data and compares it
+with the stored rows using read-only queries: rows to insert, rows to
+update with their field-level changes, and stored rows of the imported
+races that the API no longer returns (orphans, which the import keeps).
+Nothing is written, not even the shared hourly request budget: a dry run
+keeps to an in-process rate limit instead. Add --json to get the diff as JSON on stdout.
 """
 
-from django.core.management.base import BaseCommand, CommandError
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError, OutputWrapper
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import transaction
 from core.services.f1_api_service import F1DataService, F1APIError
 from core.services.championship_service import ChampionshipService
-from core.models import Driver, Constructor, Race, Result
-from datetime import datetime
+from core.services.career_stats_service import CareerStatsService
+from core.services.cache_service import SeasonCacheService
+from core.services.bulk_service import BulkService
+from core.services.lap_import_service import LapImportService
+from core.services.import_state_service import ImportStateService
+from core.services.rate_limiter import RateLimiter
+from core.models import Driver, Constructor, Race, Result, Qualifying, Sprint, Lap
+from core.utils import merge_shared_drives, parse_lap_time, parse_result_status
+from datetime import date, datetime
+from itertools import count
+import json
 import logging
+import sys
 
 
 logger = logging.getLogger(__name__)
@@ -22,6 +71,33 @@ logger = logging.getLogger(__name__)
 class Command(BaseCommand):
     help = 'Import F1 data from Ergast API'
 
+    # Fields overwritten when an imported row already exists
+    DRIVER_FIELDS = [
+        'number', 'code', 'first_name', 'last_name', 'date_of_birth', 'nationality', 'url', 'updated_at',
+    ]
+    CONSTRUCTOR_FIELDS = ['name', 'nationality', 'url', 'updated_at']
+    RACE_FIELDS = [
+        'season', 'round', 'race_name', 'circuit_id', 'circuit_name', 'locality', 'country',
+        'date', 'time', 'url', 'updated_at',
+    ]
+    RESULT_FIELDS = [
+        'constructor', 'grid_position', 'final_position', 'position_text', 'points', 'laps_completed',
+        'status', 'retirement_reason', 'fastest_lap', 'fastest_lap_time', 'fastest_lap_time_milliseconds',
+        'fastest_lap_speed', 'updated_at',
+    ]
+    QUALIFYING_FIELDS = [
+        'constructor', 'position', 'q1_time', 'q2_time', 'q3_time',
+        'q1_milliseconds', 'q2_milliseconds', 'q3_milliseconds', 'updated_at',
+    ]
+    SPRINT_FIELDS = [
+        'constructor', 'grid_position', 'final_position', 'position_text', 'points', 'laps_completed',
+        'status', 'retirement_reason', 'fastest_lap_time', 'fastest_lap_time_milliseconds', 'updated_at',
+    ]
+    LAP_FIELDS = ['position', 'lap_time', 'lap_time_milliseconds']
+
+    # Rows listed per resource in the text dry-run report (all with -v 2)
+    DRY_RUN_DETAIL_LIMIT = 20
+
     def add_arguments(self, parser):
         parser.add_argument(
             '--season',
@@ -49,6 +125,16 @@ class Command(BaseCommand):
             action='store_true',
             help='Import only races'
         )
+        parser.add_argument(
+            '--laps',
+            action='store_true',
+            help='Import only lap times (streamed, races must already exist)'
+        )
+        parser.add_argument(
+            '--purge-laps',
+            action='store_true',
+            help='With --laps, delete the stored lap times of the season before importing them again'
+        )
         parser.add_argument(
             '--calculate-standings',
             action='store_true',
@@ -59,14 +145,63 @@ class Command(BaseCommand):
             action='store_true',
             help='Recalculate all standings for the season'
         )
+        parser.add_argument(
+            '--full',
+            action='store_true',
+            help='Fetch every round and rewrite data even if unchanged since the last import'
+        )
+        parser.add_argument(
+            '--offline',
+            action='store_true',
+            help='Replay cached API responses only, without network requests'
+        )
+        parser.add_argument(
+            '--refresh-cache',
+            action='store_true',
+            help='Ignore cached API responses and download them again'
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Show what the import would insert, update and orphan without writing anything'
+        )
+        parser.add_argument(
+            '--json',
+            action='store_true',
+            help='With --dry-run, print the diff as JSON (progress messages go to stderr)'
+        )
 
     def handle(self, *args, **options):
         season = options['season']
         round_num = options.get('round')
         calculate_standings = options.get('calculate_standings', False)
         recalculate_all = options.get('recalculate_all', False)
+        self.verbosity = options.get('verbosity', 1)
+        self.full = options.get('full', False)
+        self.dry_run = options.get('dry_run', False)
+        
+        if self.dry_run and recalculate_all:
+            raise CommandError('--dry-run cannot be combined with --recalculate-all')
+        if options.get('json') and not self.dry_run:
+            raise CommandError('--json requires --dry-run')
+        if options.get('purge_laps') and (not options['laps'] or round_num or self.dry_run):
+            raise CommandError('--purge-laps requires --laps and cannot be combined with --round or --dry-run')
         
-        service = F1DataService()
+        report_stdout = self.stdout
+        if options.get('json'):
+            # Keep stdout for the JSON document only
+            self.stdout = OutputWrapper(options.get('stderr') or sys.stderr)
+        
+        rate_limiter = None
+        if self.dry_run:
+            # The shared hourly budget is a database row: keep a dry run's requests in memory
+            rate_limiter = RateLimiter(settings.F1_API_RATE_LIMIT, settings.F1_API_HOURLY_LIMIT)
+        
+        service = F1DataService(
+            rate_limiter=rate_limiter,
+            offline=options.get('offline', False),
+            refresh_cache=options.get('refresh_cache', False),
+        )
         
         try:
             # Handle recalculate-all flag
@@ -86,22 +221,111 @@ class Command(BaseCommand):
             import_all = not any([
                 options['drivers'],
                 options['constructors'],
-                options['races']
+                options['races'],
+                options['laps']
             ])
             
+            # Fetch everything first so the database transaction stays short.
+            # Payloads are keyed by resource, then round (0 = season-wide)
+            payloads = {}
             if import_all or options['drivers']:
-                self.import_drivers(service, season)
+                self.stdout.write(f'Fetching drivers for season {season}...')
+                payloads['drivers'] = {0: service.fetch_drivers(season)}
             
             if import_all or options['constructors']:
-                self.import_constructors(service, season)
+                self.stdout.write(f'Fetching constructors for season {season}...')
+                payloads['constructors'] = {0: service.fetch_constructors(season)}
             
             if import_all or options['races']:
-                self.import_races(service, season, round_num)
+                self.stdout.write(f'Fetching races for season {season}...')
+                races_data = service.fetch_races(season)
+                if round_num:
+                    payloads['races'] = {round_num: [r for r in races_data if int(r['round']) == round_num]}
+                else:
+                    payloads['races'] = {0: races_data}
+                payloads['results'] = self.fetch_rounds(
+                    season, races_data, round_num, 'results',
+                    service.fetch_season_results, service.fetch_race_results,
+                )
+                payloads['qualifying'] = self.fetch_rounds(
+                    season, races_data, round_num, 'qualifying',
+                    service.fetch_season_qualifying, service.fetch_qualifying,
+                )
+                # Only sprint weekends list a 'Sprint' session in the schedule
+                payloads['sprint'] = self.fetch_rounds(
+                    season, races_data, round_num, 'sprint',
+                    service.fetch_season_sprint_results, service.fetch_sprint_results,
+                    held=lambda race: 'Sprint' in race,
+                )
+            
+            # Skip payloads identical to the last import
+            changes = {}
+            for resource, resource_payloads in payloads.items():
+                changes[resource] = ImportStateService.split_changed(
+                    season, resource, resource_payloads, force=self.full, touch=not self.dry_run
+                )
+            
+            if self.dry_run:
+                diff = self.preview_import(season, payloads, changes)
+                if options['laps']:
+                    diff['laps'] = self.preview_laps(service, season, round_num)
+                if options.get('json'):
+                    report_stdout.write(
+                        json.dumps({'season': season, 'resources': diff}, cls=DjangoJSONEncoder, indent=2)
+                    )
+                else:
+                    self.report_diff(season, diff)
+                return
+            
+            # One transaction per season
+            changed_rounds = set()
+            data_changed = any(changed for changed, _ in changes.values())
+            with transaction.atomic():
+                for resource, (changed, hashes) in changes.items():
+                    if not changed:
+                        reason = 'unchanged since last import' if payloads[resource] else 'nothing new to import'
+                        self.stdout.write(f'  - {resource.capitalize()}: {reason}, skipped')
+                        continue
+                    
+                    if resource == 'drivers':
+                        self.import_drivers(changed[0])
+                    elif resource == 'constructors':
+                        self.import_constructors(changed[0])
+                    elif resource == 'races':
+                        changed_rounds |= self.import_races(season, [r for data in changed.values() for r in data])
+                    elif resource == 'results':
+                        changed_rounds |= self.import_results(season, changed)
+                    elif resource == 'qualifying':
+                        self.import_qualifying(season, changed)
+                    elif resource == 'sprint':
+                        self.import_sprints(season, changed)
+                    
+                    ImportStateService.record(
+                        season, resource, hashes,
+                        {round_key: len(data) for round_key, data in changed.items()}
+                    )
+            
+            if 'races' in payloads:
+                # Bulk writes do not send the signals that invalidate standings
+                if changed_rounds:
+                    ChampionshipService.invalidate_season(season, from_round=min(changed_rounds))
+                    self.update_career_stats(season)
+                self.report_changes(changed_rounds)
+            
+            if options['laps']:
+                if options.get('purge_laps'):
+                    self.purge_laps(season)
+                self.import_laps(service, season, round_num)
             
             # Calculate standings if requested
             if calculate_standings:
                 self.calculate_standings(season, round_num)
             
+            if data_changed:
+                # After every write (career stats included), so no response is
+                # cached under the new version with data from before the import
+                SeasonCacheService.bump_version(season)
+            
             self.stdout.write(
                 self.style.SUCCESS(f'Successfully imported F1 data for season {season}')
             )
@@ -111,91 +335,204 @@ class Command(BaseCommand):
         except Exception as e:
             logger.exception("Unexpected error during import")
             raise CommandError(f'Unexpected error: {str(e)}')
+        finally:
+            self.report_request_stats(service)
+            service.close()
 
-    def import_drivers(self, service: F1DataService, season: int):
+    def report_request_stats(self, service: F1DataService):
+        """Print API request, retry and latency counters"""
+        stats = service.get_request_stats()
+        if not (stats['requests'] or stats['cache_hits']) or self.verbosity < 1:
+            return
+        self.stdout.write(
+            f'API requests: {stats["requests"]} ({stats["retries"]} retries, {stats["failures"]} failed), '
+            f'{stats["cache_hits"]} served from cache, '
+            f'latency avg {stats["avg_latency"]:.2f}s / max {stats["max_latency"]:.2f}s / '
+            f'total {stats["total_latency"]:.1f}s, rate limit wait {stats["rate_limit_wait"]:.1f}s'
+        )
+
+    def report_counts(self, label: str, counts: dict):
+        """Print created/updated/unchanged counts of a BulkService.sync() call"""
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'  ✓ {label}: {len(counts["created"])} created, {len(counts["updated"])} updated, '
+                f'{len(counts["unchanged"])} unchanged'
+            )
+        )
+
+    def import_drivers(self, drivers_data: list):
         """Import drivers for the specified season"""
-        self.stdout.write(f'Importing drivers for season {season}...')
-        
-        drivers_data = service.fetch_drivers(season)
-        imported = 0
-        
-        for driver_data in drivers_data:
-            driver, created = Driver.objects.update_or_create(
+        counts = BulkService.sync(Driver, self._build_drivers(drivers_data), ['driver_id'], self.DRIVER_FIELDS)
+        self.report_counts('Drivers', counts)
+
+    def _build_drivers(self, drivers_data: list) -> list:
+        """Build unsaved Drivers from API data"""
+        return [
+            Driver(
                 driver_id=driver_data['driverId'],
-                defaults={
-                    'number': driver_data.get('permanentNumber'),
-                    'code': driver_data.get('code', ''),
-                    'first_name': driver_data['givenName'],
-                    'last_name': driver_data['familyName'],
-                    'date_of_birth': driver_data.get('dateOfBirth'),
-                    'nationality': driver_data['nationality'],
-                    'url': driver_data.get('url', ''),
-                }
+                number=driver_data.get('permanentNumber'),
+                code=driver_data.get('code', ''),
+                first_name=driver_data['givenName'],
+                last_name=driver_data['familyName'],
+                date_of_birth=driver_data.get('dateOfBirth'),
+                nationality=driver_data['nationality'],
+                url=driver_data.get('url', ''),
             )
-            if created:
-                imported += 1
-        
-        self.stdout.write(
-            self.style.SUCCESS(f'  ✓ Imported {imported} new drivers (total: {len(drivers_data)})')
-        )
+            for driver_data in drivers_data
+        ]
 
-    def import_constructors(self, service: F1DataService, season: int):
+    def import_constructors(self, constructors_data: list):
         """Import constructors for the specified season"""
-        self.stdout.write(f'Importing constructors for season {season}...')
-        
-        constructors_data = service.fetch_constructors(season)
-        imported = 0
-        
-        for constructor_data in constructors_data:
-            constructor, created = Constructor.objects.update_or_create(
+        counts = BulkService.sync(
+            Constructor, self._build_constructors(constructors_data), ['constructor_id'], self.CONSTRUCTOR_FIELDS
+        )
+        self.report_counts('Constructors', counts)
+
+    def _build_constructors(self, constructors_data: list) -> list:
+        """Build unsaved Constructors from API data"""
+        return [
+            Constructor(
                 constructor_id=constructor_data['constructorId'],
-                defaults={
-                    'name': constructor_data['name'],
-                    'nationality': constructor_data['nationality'],
-                    'url': constructor_data.get('url', ''),
-                }
+                name=constructor_data['name'],
+                nationality=constructor_data['nationality'],
+                url=constructor_data.get('url', ''),
             )
-            if created:
-                imported += 1
+            for constructor_data in constructors_data
+        ]
+
+    def fetch_rounds(self, season: int, races_data: list, round_num: int, resource: str,
+                     fetch_season, fetch_round, held=None) -> dict:
+        """
+        Fetch per-race data (results, qualifying, sprints) of the rounds that need importing.
         
+        Args:
+            season: The season year
+            races_data: Races of the season from the API
+            round_num: Specific round to fetch (optional)
+            resource: ImportState resource name, for the high-water mark
+            fetch_season: Service method fetching every round with paged season-level calls
+            fetch_round: Service method fetching a single round
+            held: Optional predicate selecting the races that have this session
+        
+        Returns:
+            Dictionary mapping round number to its list of row dictionaries
+        """
+        if held:
+            races_data = [race for race in races_data if held(race)]
+            if not races_data or (round_num and round_num not in {int(race['round']) for race in races_data}):
+                return {}
+        
+        if round_num:
+            return {round_num: fetch_round(season, round_num)}
+        
+        last_round = 0 if self.full else ImportStateService.high_water_mark(season, resource)
+        if not last_round:
+            # One paged request for the whole season instead of one per round
+            return fetch_season(season)
+        
+        # Only races held after the high-water mark can have new data
+        today = date.today().isoformat()
+        pending = [
+            int(race['round']) for race in races_data
+            if int(race['round']) > last_round and race['date'] <= today
+        ]
         self.stdout.write(
-            self.style.SUCCESS(f'  ✓ Imported {imported} new constructors (total: {len(constructors_data)})')
+            f'  {resource.capitalize()} imported up to round {last_round}, '
+            f'fetching {", ".join(map(str, pending)) or "no new rounds"}'
         )
+        
+        rows_by_round = {}
+        for pending_round in pending:
+            rows = fetch_round(season, pending_round)
+            if rows:
+                rows_by_round[pending_round] = rows
+        return rows_by_round
 
-    def import_races(self, service: F1DataService, season: int, round_num: int = None):
-        """Import races and results for the specified season"""
-        self.stdout.write(f'Importing races for season {season}...')
+    def import_races(self, season: int, races_data: list) -> set:
+        """
+        Import races for the specified season.
         
-        races_data = service.fetch_races(season)
+        Returns:
+            Round numbers whose race was created or updated
+        """
+        races = [self._build_race(race_data, season) for race_data in races_data]
+        counts = BulkService.sync(Race, races, ['race_id'], self.RACE_FIELDS)
+        self.report_counts('Races', counts)
         
-        if round_num:
-            races_data = [r for r in races_data if int(r['round']) == round_num]
+        return {race.round for race in counts['created'] + counts['updated']}
+
+    def import_results(self, season: int, results_by_round: dict) -> set:
+        """
+        Import results of the given rounds.
         
-        imported_races = 0
-        imported_results = 0
+        Returns:
+            Round numbers whose results were created or updated
+        """
+        counts, race_rounds = self._sync_rounds(
+            season, results_by_round, Result, self._build_results, self.RESULT_FIELDS, 'Results'
+        )
+        return {race_rounds[result.race_id] for result in counts['created'] + counts['updated']}
+
+    def import_qualifying(self, season: int, qualifying_by_round: dict):
+        """Import qualifying results of the given rounds"""
+        self._sync_rounds(
+            season, qualifying_by_round, Qualifying, self._build_qualifying, self.QUALIFYING_FIELDS, 'Qualifying'
+        )
+
+    def import_sprints(self, season: int, sprints_by_round: dict):
+        """Import sprint results of the given rounds"""
+        self._sync_rounds(
+            season, sprints_by_round, Sprint, self._build_sprints, self.SPRINT_FIELDS, 'Sprint results'
+        )
+
+    def _sync_rounds(self, season: int, rows_by_round: dict, model, build, update_fields: list, label: str) -> tuple:
+        """
+        Bulk upsert per-race rows (one per race and driver) of the given rounds.
         
-        for race_data in races_data:
-            race, created = self._import_race(race_data, season)
-            if created:
-                imported_races += 1
-            
-            # Import results for this race
-            results_count = self._import_results(
-                service, 
-                season, 
-                int(race_data['round']), 
-                race
-            )
-            imported_results += results_count
+        Args:
+            season: The season year
+            rows_by_round: Dictionary mapping round number to its API rows
+            model: Model class (Result, Qualifying or Sprint)
+            build: Method building unsaved instances from the API rows of a race
+            update_fields: Fields overwritten when a row already exists
+            label: Name used in the output
         
-        self.stdout.write(
-            self.style.SUCCESS(
-                f'  ✓ Imported {imported_races} new races and {imported_results} results'
-            )
+        Returns:
+            Tuple of (BulkService.sync() counts, dictionary mapping race ID to round number)
+        """
+        # In-memory id maps replace per-row lookups
+        race_ids = dict(
+            Race.objects.filter(season=season, round__in=rows_by_round.keys()).values_list('round', 'id')
         )
+        driver_ids = dict(Driver.objects.values_list('driver_id', 'id'))
+        constructor_ids = dict(Constructor.objects.values_list('constructor_id', 'id'))
+        
+        objs = self._build_rounds(season, rows_by_round, build, race_ids, driver_ids, constructor_ids, label)
+        counts = BulkService.sync(model, objs, ['race', 'driver'], update_fields)
+        self.report_counts(label, counts)
+        
+        return counts, {race_id: round_key for round_key, race_id in race_ids.items()}
 
-    def _import_race(self, race_data: dict, season: int) -> tuple:
-        """Import a single race"""
+    def _build_rounds(self, season: int, rows_by_round: dict, build, race_ids: dict, driver_ids: dict,
+                      constructor_ids: dict, label: str) -> list:
+        """Build unsaved per-race rows of the given rounds with the in-memory id maps"""
+        objs = []
+        for round_key, rows in sorted(rows_by_round.items()):
+            if round_key not in race_ids:
+                self.stdout.write(self.style.WARNING(f'  ⚠ Skipping {label.lower()} of unknown round {round_key}'))
+                continue
+            objs.extend(build(rows, race_ids[round_key], season, driver_ids, constructor_ids))
+        return objs
+
+    def report_changes(self, changed_rounds: set):
+        """Print which rounds actually changed"""
+        if changed_rounds:
+            self.stdout.write(f'Changed rounds: {", ".join(map(str, sorted(changed_rounds)))}')
+        else:
+            self.stdout.write('No race or result changes since the last import')
+
+    def _build_race(self, race_data: dict, season: int) -> Race:
+        """Build an unsaved Race from API data"""
         circuit = race_data['Circuit']
         
         # Parse time if available
@@ -206,71 +543,430 @@ class Command(BaseCommand):
             except ValueError:
                 pass
         
-        race, created = Race.objects.update_or_create(
+        return Race(
             race_id=f"{season}_{race_data['round']}",
-            defaults={
-                'season': season,
-                'round': int(race_data['round']),
-                'race_name': race_data['raceName'],
-                'circuit_id': circuit['circuitId'],
-                'circuit_name': circuit['circuitName'],
-                'locality': circuit['Location']['locality'],
-                'country': circuit['Location']['country'],
-                'date': race_data['date'],
-                'time': race_time,
-                'url': race_data.get('url', ''),
-            }
+            season=season,
+            round=int(race_data['round']),
+            race_name=race_data['raceName'],
+            circuit_id=circuit['circuitId'],
+            circuit_name=circuit['circuitName'],
+            locality=circuit['Location']['locality'],
+            country=circuit['Location']['country'],
+            date=race_data['date'],
+            time=race_time,
+            url=race_data.get('url', ''),
         )
+
+    def _resolve_ids(self, row_data: dict, driver_ids: dict, constructor_ids: dict) -> tuple:
+        """
+        Get the database IDs of the driver and constructor of an API row.
         
-        return race, created
+        Returns:
+            Tuple of (driver ID, constructor ID), or None if either is unknown
+        """
+        driver_id = driver_ids.get(row_data['Driver']['driverId'])
+        constructor_id = constructor_ids.get(row_data['Constructor']['constructorId'])
+        if driver_id is None or constructor_id is None:
+            self.stdout.write(
+                self.style.WARNING(
+                    f'  ⚠ Skipping row: unknown driver {row_data["Driver"]["driverId"]} '
+                    f'or constructor {row_data["Constructor"]["constructorId"]}'
+                )
+            )
+            return None
+        return driver_id, constructor_id
+
+    @staticmethod
+    def _parse_status(row_data: dict) -> tuple:
+        """Get the (status, retirement_reason) of a result or sprint row"""
+        status_text = row_data.get('status', '')
+        status = parse_result_status(status_text)
+        return status, (status_text if status == 'retired' else None)
 
-    def _import_results(self, service: F1DataService, season: int, round_num: int, race: Race) -> int:
-        """Import results for a specific race"""
-        results_data = service.fetch_race_results(season, round_num)
-        imported = 0
+    def _build_results(self, results_data: list, race_id: int, season: int, driver_ids: dict,
+                       constructor_ids: dict) -> list:
+        """Build unsaved Results for a race from API data"""
+        results = []
         
         for result_data in results_data:
-            try:
-                driver = Driver.objects.get(driver_id=result_data['Driver']['driverId'])
-                constructor = Constructor.objects.get(
-                    constructor_id=result_data['Constructor']['constructorId']
-                )
-                
-                # Parse status
-                status = 'finished'
-                status_text = result_data.get('status', '').lower()
-                if 'retire' in status_text or 'engine' in status_text or 'collision' in status_text:
-                    status = 'retired'
-                elif 'disqualif' in status_text:
-                    status = 'dsq'
-                
-                result, created = Result.objects.update_or_create(
-                    race=race,
-                    driver=driver,
-                    defaults={
-                        'constructor': constructor,
-                        'grid_position': int(result_data['grid']),
-                        'final_position': int(result_data['position']) if result_data.get('position') else None,
-                        'position_text': result_data.get('positionText', 'N/A'),
-                        'points': float(result_data.get('points', 0)),
-                        'laps_completed': int(result_data.get('laps', 0)),
-                        'status': status,
-                        'fastest_lap': result_data.get('FastestLap', {}).get('lap'),
-                        'fastest_lap_time': result_data.get('FastestLap', {}).get('Time', {}).get('time'),
-                        'fastest_lap_speed': result_data.get('FastestLap', {}).get('AverageSpeed', {}).get('speed'),
-                    }
+            ids = self._resolve_ids(result_data, driver_ids, constructor_ids)
+            if ids is None:
+                continue
+            
+            fastest_lap = result_data.get('FastestLap', {})
+            fastest_lap_number = fastest_lap.get('lap')
+            fastest_lap_time = fastest_lap.get('Time', {}).get('time')
+            fastest_lap_speed = fastest_lap.get('AverageSpeed', {}).get('speed')
+            status, retirement_reason = self._parse_status(result_data)
+            
+            results.append(Result(
+                race_id=race_id,
+                season=season,
+                driver_id=ids[0],
+                constructor_id=ids[1],
+                grid_position=int(result_data['grid']),
+                final_position=int(result_data['position']) if result_data.get('position') else None,
+                position_text=result_data.get('positionText', 'N/A'),
+                points=float(result_data.get('points', 0)),
+                laps_completed=int(result_data.get('laps', 0)),
+                status=status,
+                retirement_reason=retirement_reason,
+                fastest_lap=int(fastest_lap_number) if fastest_lap_number else None,
+                fastest_lap_time=fastest_lap_time,
+                fastest_lap_time_milliseconds=parse_lap_time(fastest_lap_time),
+                fastest_lap_speed=float(fastest_lap_speed) if fastest_lap_speed else None,
+            ))
+        
+        # Shared drives list a driver once per car; the table holds one row per race and driver
+        return list(merge_shared_drives(results))
+
+    def _build_qualifying(self, qualifying_data: list, race_id: int, season: int, driver_ids: dict,
+                          constructor_ids: dict) -> list:
+        """Build unsaved Qualifying rows for a race from API data"""
+        qualifying = []
+        
+        for qualifying_row in qualifying_data:
+            ids = self._resolve_ids(qualifying_row, driver_ids, constructor_ids)
+            if ids is None:
+                continue
+            
+            q1, q2, q3 = (qualifying_row.get(session) for session in ('Q1', 'Q2', 'Q3'))
+            qualifying.append(Qualifying(
+                race_id=race_id,
+                season=season,
+                driver_id=ids[0],
+                constructor_id=ids[1],
+                position=int(qualifying_row['position']),
+                q1_time=q1,
+                q2_time=q2,
+                q3_time=q3,
+                q1_milliseconds=parse_lap_time(q1),
+                q2_milliseconds=parse_lap_time(q2),
+                q3_milliseconds=parse_lap_time(q3),
+            ))
+        
+        return qualifying
+
+    def _build_sprints(self, sprint_data: list, race_id: int, season: int, driver_ids: dict,
+                       constructor_ids: dict) -> list:
+        """Build unsaved Sprint results for a race from API data"""
+        sprints = []
+        
+        for sprint_row in sprint_data:
+            ids = self._resolve_ids(sprint_row, driver_ids, constructor_ids)
+            if ids is None:
+                continue
+            
+            status, retirement_reason = self._parse_status(sprint_row)
+            fastest_lap_time = sprint_row.get('FastestLap', {}).get('Time', {}).get('time')
+            sprints.append(Sprint(
+                race_id=race_id,
+                season=season,
+                driver_id=ids[0],
+                constructor_id=ids[1],
+                grid_position=int(sprint_row['grid']),
+                final_position=int(sprint_row['position']) if sprint_row.get('position') else None,
+                position_text=sprint_row.get('positionText', 'N/A'),
+                points=float(sprint_row.get('points', 0)),
+                laps_completed=int(sprint_row.get('laps', 0)),
+                status=status,
+                retirement_reason=retirement_reason,
+                fastest_lap_time=fastest_lap_time,
+                fastest_lap_time_milliseconds=parse_lap_time(fastest_lap_time),
+            ))
+        
+        return sprints
+
+    def purge_laps(self, season: int):
+        """Delete the stored laps of the season and forget their import hashes"""
+        with transaction.atomic():
+            deleted = LapImportService.delete_season(season)
+            ImportStateService.clear(season, 'laps')
+        self.stdout.write(self.style.SUCCESS(f'  ✓ Deleted {deleted} stored laps of season {season}'))
+
+    def import_laps(self, service: F1DataService, season: int, round_num: int = None):
+        """Stream lap times of the season (or one round) into the database"""
+        self.stdout.write(f'Importing lap times for season {season}...')
+        
+        race_ids = dict(Race.objects.filter(season=season).values_list('round', 'id'))
+        driver_ids = dict(Driver.objects.values_list('driver_id', 'id'))
+        
+        totals = {'created': 0, 'updated': 0, 'unchanged': 0}
+        skipped_rounds = []
+        for race in self.iter_pending_laps(service, season, round_num):
+            race_round = int(race['round'])
+            if race_round not in race_ids:
+                # Do not record the payload, so the laps are imported once the race exists
+                self.stdout.write(self.style.WARNING(f'  ⚠ Skipping laps of unknown round {race_round}'))
+                continue
+            changed, hashes = ImportStateService.split_changed(
+                season, 'laps', {race_round: race.get('Laps', [])}, force=self.full
+            )
+            if not changed:
+                skipped_rounds.append(race_round)
+                continue
+            
+            # One transaction per race keeps transactions short while pages download
+            with transaction.atomic():
+                counts = LapImportService.load_laps(
+                    LapImportService.iter_lap_rows([race], race_ids, driver_ids)
                 )
-                
-                if created:
-                    imported += 1
-                    
-            except (Driver.DoesNotExist, Constructor.DoesNotExist) as e:
+                ImportStateService.record(season, 'laps', hashes, {race_round: len(changed[race_round])})
+            for key in totals:
+                totals[key] += counts[key]
+            
+            if self.verbosity > 1:
                 self.stdout.write(
-                    self.style.WARNING(f'  ⚠ Skipping result: {str(e)}')
+                    f'  Round {race["round"]}: {counts["created"]} created, {counts["updated"]} updated, '
+                    f'{counts["unchanged"]} unchanged'
+                )
+        
+        if skipped_rounds:
+            self.stdout.write(
+                f'  - Laps of rounds {", ".join(map(str, skipped_rounds))}: unchanged since last import, skipped'
+            )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'  ✓ Laps: {totals["created"]} created, {totals["updated"]} updated, '
+                f'{totals["unchanged"]} unchanged'
+            )
+        )
+
+    def iter_pending_laps(self, service: F1DataService, season: int, round_num: int = None):
+        """Stream lap times of the rounds after the laps high-water mark"""
+        last_round = 0 if (self.full or round_num) else ImportStateService.high_water_mark(season, 'laps')
+        if not last_round:
+            yield from service.iter_lap_times(season, round_num)
+            return
+        
+        pending = Race.objects.filter(
+            season=season, round__gt=last_round, date__lte=date.today()
+        ).order_by('round').values_list('round', flat=True)
+        self.stdout.write(
+            f'  Laps imported up to round {last_round}, '
+            f'fetching {", ".join(map(str, pending)) or "no new rounds"}'
+        )
+        for pending_round in pending:
+            yield from service.iter_lap_times(season, pending_round)
+
+    def preview_import(self, season: int, payloads: dict, changes: dict) -> dict:
+        """
+        Compare the fetched data with the stored rows, without writing anything.
+        
+        Rows that do not exist yet get placeholder IDs, so that results of new
+        drivers or races can still be previewed.
+        
+        Args:
+            season: The season year
+            payloads: Fetched payloads by resource and round
+            changes: Output of ImportStateService.split_changed() by resource
+        
+        Returns:
+            Dictionary mapping resource name to its diff (see _diff_entry)
+        """
+        placeholders = count(-1, -1)
+        driver_ids = dict(Driver.objects.values_list('driver_id', 'id'))
+        constructor_ids = dict(Constructor.objects.values_list('constructor_id', 'id'))
+        race_ids = dict(Race.objects.filter(season=season).values_list('round', 'id'))
+        refs = {}
+        
+        diff = {}
+        for resource, (changed, _) in changes.items():
+            skipped_rounds = sorted(set(payloads[resource]) - set(changed))
+            
+            if resource == 'drivers':
+                preview = BulkService.preview(
+                    Driver, self._build_drivers(changed.get(0, [])), ['driver_id'], self.DRIVER_FIELDS
                 )
+                for driver in preview['created']:
+                    driver_ids[driver.driver_id] = next(placeholders)
+                key_attnames, describe = ['driver_id'], lambda key: {'driver': key[0]}
+            elif resource == 'constructors':
+                preview = BulkService.preview(
+                    Constructor, self._build_constructors(changed.get(0, [])), ['constructor_id'],
+                    self.CONSTRUCTOR_FIELDS,
+                )
+                for constructor in preview['created']:
+                    constructor_ids[constructor.constructor_id] = next(placeholders)
+                key_attnames, describe = ['constructor_id'], lambda key: {'constructor': key[0]}
+            elif resource == 'races':
+                rounds = set(changed)
+                scope = {'season': season} if 0 in rounds else {'season': season, 'round__in': rounds}
+                preview = BulkService.preview(
+                    Race, [self._build_race(race_data, season) for data in changed.values() for race_data in data],
+                    ['race_id'], self.RACE_FIELDS, scope=scope if changed else None,
+                )
+                for race in preview['created']:
+                    race_ids[race.round] = next(placeholders)
+                key_attnames, describe = ['race_id'], lambda key: {'race': key[0]}
+            else:
+                model, build, update_fields = {
+                    'results': (Result, self._build_results, self.RESULT_FIELDS),
+                    'qualifying': (Qualifying, self._build_qualifying, self.QUALIFYING_FIELDS),
+                    'sprint': (Sprint, self._build_sprints, self.SPRINT_FIELDS),
+                }[resource]
+                if not refs:
+                    refs = self._reverse_refs(race_ids, driver_ids, constructor_ids)
+                objs = self._build_rounds(
+                    season, changed, build, race_ids, driver_ids, constructor_ids, resource.capitalize()
+                )
+                stored_races = [race_ids[round_key] for round_key in changed if race_ids.get(round_key, 0) > 0]
+                preview = BulkService.preview(
+                    model, objs, ['race', 'driver'], update_fields, scope={'race_id__in': stored_races}
+                )
+                key_attnames = ['race_id', 'driver_id']
+                describe = lambda key: {'round': refs['race'][key[0]], 'driver': refs['driver'][key[1]]}
+            
+            diff[resource] = self._diff_entry(preview, key_attnames, describe, refs, skipped_rounds)
+        
+        return diff
+
+    def preview_laps(self, service: F1DataService, season: int, round_num: int = None) -> dict:
+        """
+        Compare fetched lap times with the stored laps race by race, without writing anything.
+        
+        Returns:
+            Diff of the laps (see _diff_entry)
+        """
+        race_ids = dict(Race.objects.filter(season=season).values_list('round', 'id'))
+        driver_ids = dict(Driver.objects.values_list('driver_id', 'id'))
+        refs = self._reverse_refs(race_ids, driver_ids, {})
+        
+        diff = self._diff_entry({}, [], None, refs, [])
+        for race in self.iter_pending_laps(service, season, round_num):
+            race_round = int(race['round'])
+            if race_round not in race_ids:
+                self.stdout.write(self.style.WARNING(f'  ⚠ Skipping laps of unknown round {race_round}'))
+                continue
+            changed, _ = ImportStateService.split_changed(
+                season, 'laps', {race_round: race.get('Laps', [])}, force=self.full, touch=False
+            )
+            if not changed:
+                diff['skipped_rounds'].append(race_round)
                 continue
+            
+            laps = [
+                Lap(**dict(zip(LapImportService.COLUMNS, row)))
+                for row in LapImportService.iter_lap_rows([race], race_ids, driver_ids)
+            ]
+            preview = BulkService.preview(
+                Lap, laps, ['race', 'driver', 'lap_number'], self.LAP_FIELDS,
+                scope={'race_id': race_ids[race_round]},
+            )
+            describe = lambda key: {'round': refs['race'][key[0]], 'driver': refs['driver'][key[1]], 'lap': key[2]}
+            race_diff = self._diff_entry(preview, ['race_id', 'driver_id', 'lap_number'], describe, refs, [])
+            for key in ('created', 'updated', 'orphaned'):
+                diff[key].extend(race_diff[key])
+            diff['unchanged'] += race_diff['unchanged']
+        
+        return diff
+
+    @staticmethod
+    def _reverse_refs(race_ids: dict, driver_ids: dict, constructor_ids: dict) -> dict:
+        """Map database (or placeholder) IDs back to rounds and external IDs"""
+        return {
+            'race': {race_id: round_key for round_key, race_id in race_ids.items()},
+            'driver': {driver_id: ref for ref, driver_id in driver_ids.items()},
+            'constructor': {constructor_id: ref for ref, constructor_id in constructor_ids.items()},
+        }
+
+    @staticmethod
+    def _diff_entry(preview: dict, key_attnames: list, describe, refs: dict, skipped_rounds: list) -> dict:
+        """
+        Turn a BulkService.preview() result into a serializable diff.
+        
+        Args:
+            preview: Output of BulkService.preview() (empty for an empty diff)
+            key_attnames: Attribute names of the unique key
+            describe: Function turning a key tuple into a readable key dictionary
+            refs: Output of _reverse_refs(), to show foreign keys by external ID
+            skipped_rounds: Rounds not compared because their payload is unchanged
         
-        return imported
+        Returns:
+            Dictionary with the keys of the rows to create, the keys and field
+            changes ({field: {'old', 'new'}}) of the rows to update, the number
+            of unchanged rows, the keys of orphaned rows and the rounds skipped
+            because their payload is unchanged since the last import
+        """
+        def key_of(obj):
+            return describe(tuple(getattr(obj, attname) for attname in key_attnames))
+        
+        def value(field, raw):
+            # Show foreign keys by their external ID
+            return refs.get('constructor', {}).get(raw, raw) if field == 'constructor' else raw
+        
+        if not preview:
+            return {'created': [], 'updated': [], 'unchanged': 0, 'orphaned': [], 'skipped_rounds': skipped_rounds}
+        
+        return {
+            'created': [key_of(obj) for obj in preview['created']],
+            'updated': [
+                {
+                    'key': key_of(obj),
+                    'changes': {
+                        field: {'old': value(field, old), 'new': value(field, new)}
+                        for field, (old, new) in changes.items()
+                    },
+                }
+                for obj, changes in preview['updated']
+            ],
+            'unchanged': len(preview['unchanged']),
+            'orphaned': [describe(key) for key in preview['orphaned']],
+            'skipped_rounds': skipped_rounds,
+        }
+
+    def report_diff(self, season: int, diff: dict):
+        """Print a dry-run diff"""
+        limit = None if self.verbosity > 1 else self.DRY_RUN_DETAIL_LIMIT
+        
+        self.stdout.write(self.style.WARNING(f'\nDry run for season {season}: nothing was written'))
+        for resource, entry in diff.items():
+            if not (entry['created'] or entry['updated'] or entry['unchanged'] or entry['orphaned']):
+                reason = 'unchanged since last import' if entry['skipped_rounds'] else 'nothing new to import'
+                self.stdout.write(f'  - {resource.capitalize()}: {reason}')
+                continue
+            
+            summary = (
+                f'  {resource.capitalize()}: {len(entry["created"])} to insert, '
+                f'{len(entry["updated"])} to update, {entry["unchanged"]} unchanged'
+            )
+            if entry['orphaned']:
+                summary += f', {len(entry["orphaned"])} orphaned'
+            if entry['skipped_rounds']:
+                summary += f' (rounds {", ".join(map(str, entry["skipped_rounds"]))} unchanged since last import)'
+            self.stdout.write(summary)
+            
+            lines = [f'    + {self._format_key(key)}' for key in entry['created']]
+            lines += [
+                f'    ~ {self._format_key(update["key"])}: ' + ', '.join(
+                    f'{field} {change["old"]!r} → {change["new"]!r}' for field, change in update['changes'].items()
+                )
+                for update in entry['updated']
+            ]
+            lines += [f'    - {self._format_key(key)} (orphaned)' for key in entry['orphaned']]
+            
+            for line in lines[:limit]:
+                self.stdout.write(line)
+            if limit is not None and len(lines) > limit:
+                self.stdout.write(f'    ... and {len(lines) - limit} more (use -v 2 to list all)')
+
+    @staticmethod
+    def _format_key(key: dict) -> str:
+        """Format a row key of a dry-run diff, e.g. 'round 3 / hamilton / lap 12'"""
+        parts = []
+        for name, value in key.items():
+            parts.append(f'{name} {value}' if name in ('round', 'lap') else str(value))
+        return ' / '.join(parts)
+
+    def update_career_stats(self, season: int):
+        """Refresh precomputed career statistics for drivers of the season"""
+        self.stdout.write(f'Updating driver career stats...')
+        
+        created, updated = CareerStatsService.update_for_season(season)
+        
+        self.stdout.write(
+            self.style.SUCCESS(f'  ✓ Career stats: {created} created, {updated} updated')
+        )
 
     def calculate_standings(self, season: int, round_num: int = None):
         """Calculate championship standings"""
@@ -278,28 +974,21 @@ class Command(BaseCommand):
         
         try:
             if round_num:
-                # Calculate standings for specific round
-                dc, du = ChampionshipService.save_driver_standings(season, round_num)
-                cc, cu = ChampionshipService.save_constructor_standings(season, round_num)
-                
-                self.stdout.write(
-                    self.style.SUCCESS(
-                        f'  ✓ Calculated standings for round {round_num}:\n'
-                        f'    - Drivers: {dc} created, {du} updated\n'
-                        f'    - Constructors: {cc} created, {cu} updated'
-                    )
-                )
+                # Derive standings from the stored previous round plus this round's results
+                stats = ChampionshipService.update_standings_for_round(season, round_num)
+                summary = f'Updated standings from round {round_num}'
             else:
-                # Recalculate all standings for the season
-                stats = ChampionshipService.recalculate_all_standings(season)
-                
-                self.stdout.write(
-                    self.style.SUCCESS(
-                        f'  ✓ Recalculated all standings:\n'
-                        f'    - Drivers: {stats["driver_created"]} created, {stats["driver_updated"]} updated\n'
-                        f'    - Constructors: {stats["constructor_created"]} created, {stats["constructor_updated"]} updated'
-                    )
+                # Recalculate from the first round that is stale or missing
+                stats = ChampionshipService.update_stale_standings(season)
+                summary = 'Updated stale standings'
+            
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f'  ✓ {summary}:\n'
+                    f'    - Drivers: {stats["driver_created"]} created, {stats["driver_updated"]} updated\n'
+                    f'    - Constructors: {stats["constructor_created"]} created, {stats["constructor_updated"]} updated'
                 )
+            )
         except Exception as e:
             logger.exception("Error calculating standings")
             self.stdout.write(
@@ -0,0 +1,189 @@
+"""
+Django management command to import a range of seasons in parallel.
+
+Usage:
+    python manage.py import_seasons --from 2020 --to 2025
+    python manage.py import_seasons --from 2020 --to 2025 --workers 3 --calculate-standings
+    python manage.py import_seasons --from 2010 --to 2019 --laps
+    python manage.py import_seasons --from 2020 --to 2025 --restart
+
+Each season is imported by import_f1_data in a worker thread and committed
+independently, so a failing season does not undo the others. All workers
+draw from the same process-wide API rate limiter.
+
+Completed seasons are checkpointed in ImportState. Re-running after an
+interruption skips them (the current season is always imported again)
+and resumes unfinished seasons from their last imported round, using the
+per-round payload hashes recorded by import_f1_data. --restart clears the
+checkpoints first.
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from io import StringIO
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections, connection, connections
+from django.utils import timezone
+from core.models import Season
+from core.services.import_state_service import ImportStateService
+
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = 'Import a range of F1 seasons in parallel with resumable checkpoints'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--from',
+            dest='from_season',
+            type=int,
+            required=True,
+            help='First season to import (e.g., 2020)'
+        )
+        parser.add_argument(
+            '--to',
+            dest='to_season',
+            type=int,
+            help='Last season to import (defaults to --from)'
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=2,
+            help='Seasons imported concurrently (default: 2)'
+        )
+        parser.add_argument(
+            '--laps',
+            action='store_true',
+            help='Also import lap times'
+        )
+        parser.add_argument(
+            '--calculate-standings',
+            action='store_true',
+            help='Calculate championship standings after each season import'
+        )
+        parser.add_argument(
+            '--full',
+            action='store_true',
+            help='Fetch every round and rewrite data even if unchanged'
+        )
+        parser.add_argument(
+            '--offline',
+            action='store_true',
+            help='Replay cached API responses only, without network requests'
+        )
+        parser.add_argument(
+            '--restart',
+            action='store_true',
+            help='Ignore checkpoints and import every season again'
+        )
+
+    def handle(self, *args, **options):
+        from_season = options['from_season']
+        to_season = options['to_season'] or from_season
+        if to_season < from_season:
+            raise CommandError('--to must not be before --from')
+
+        seasons = list(range(from_season, to_season + 1))
+        workers = max(1, min(options['workers'], len(seasons)))
+        if workers > 1 and connection.vendor == 'sqlite':
+            # SQLite allows a single writer; concurrent season transactions would fail with "database is locked"
+            self.stdout.write(self.style.WARNING('SQLite database: importing seasons with 1 worker'))
+            workers = 1
+
+        # Options that change what a season import writes; checkpoints only match the same ones
+        import_options = {
+            'laps': options['laps'],
+            'calculate_standings': options['calculate_standings'],
+        }
+
+        for year in seasons:
+            Season.objects.get_or_create(year=year)
+
+        if options['restart']:
+            cleared = ImportStateService.clear_checkpoints(seasons)
+            self.stdout.write(f'Cleared {cleared} season checkpoints')
+
+        # The current season keeps changing, so it is never considered complete
+        completed = ImportStateService.completed_seasons(seasons, import_options)
+        completed.discard(timezone.now().year)
+        pending = [year for year in seasons if year not in completed]
+
+        if completed:
+            self.stdout.write(f'Skipping completed seasons: {", ".join(map(str, sorted(completed)))}')
+        if not pending:
+            self.stdout.write(self.style.SUCCESS('All seasons already imported'))
+            return
+
+        self.stdout.write(f'Importing {len(pending)} seasons with {workers} workers...')
+
+        failed = {}
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='season-import') as executor:
+            futures = {
+                executor.submit(self.import_season, year, options, import_options): year
+                for year in pending
+            }
+            for future in as_completed(futures):
+                year = futures[future]
+                output, error = future.result()
+
+                self.stdout.write(f"\n{'=' * 60}\nSeason {year}\n{'=' * 60}")
+                self.stdout.write(output.rstrip())
+                if error:
+                    failed[year] = error
+                    self.stdout.write(self.style.ERROR(f'✗ Season {year} failed: {error}'))
+                else:
+                    self.stdout.write(self.style.SUCCESS(f'✓ Season {year} imported'))
+
+        self.stdout.write(
+            f'\nImported {len(pending) - len(failed)} of {len(pending)} seasons'
+        )
+        if failed:
+            raise CommandError(
+                f'Failed seasons: {", ".join(map(str, sorted(failed)))}. '
+                f'Re-run the command to resume them.'
+            )
+
+    def import_season(self, year: int, options: dict, import_options: dict) -> tuple:
+        """
+        Import one season in a worker thread.
+
+        Returns:
+            Tuple of (command output, error message or None)
+        """
+        output = StringIO()
+        close_old_connections()
+        try:
+            call_command(
+                'import_f1_data',
+                season=year,
+                calculate_standings=options['calculate_standings'],
+                full=options['full'],
+                offline=options['offline'],
+                verbosity=options['verbosity'],
+                stdout=output,
+                stderr=output,
+            )
+            if options['laps']:
+                # Laps commit race by race and resume from the last imported round
+                call_command(
+                    'import_f1_data',
+                    season=year,
+                    laps=True,
+                    full=options['full'],
+                    offline=options['offline'],
+                    verbosity=options['verbosity'],
+                    stdout=output,
+                    stderr=output,
+                )
+            ImportStateService.mark_season_completed(year, import_options)
+            return output.getvalue(), None
+        except Exception as e:
+            logger.exception(f"Import of season {year} failed")
+            return output.getvalue(), str(e)
+        finally:
+            # Each worker thread has its own database connection
+            connections.close_all()
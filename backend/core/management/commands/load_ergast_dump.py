@@ -0,0 +1,110 @@
+"""
+Django management command to load the Ergast CSV database dump.
+
+Usage:
+    python manage.py load_ergast_dump f1db_csv.zip
+    python manage.py load_ergast_dump /path/to/f1db_csv/ --from 2010 --to 2019
+    python manage.py load_ergast_dump f1db_csv.zip --no-laps
+
+Bootstraps the full history (1950 onwards) without any API request.
+Both the zip file and the extracted directory are accepted. Existing rows
+are matched on their natural keys (driverRef, constructorRef, season and
+round...), so the dump can be loaded into a database that already holds
+API imports and re-loaded after a newer dump is released.
+
+Official driver and constructor standings are taken from the dump.
+"""
+
+import logging
+from django.core.management.base import BaseCommand, CommandError
+from core.services.ergast_dump_service import ErgastDumpError, ErgastDumpLoader
+
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = 'Load drivers, races, results, qualifying, laps and standings from the Ergast CSV dump'
+
+    LABELS = {
+        'drivers': 'Drivers',
+        'constructors': 'Constructors',
+        'races': 'Races',
+        'results': 'Results',
+        'sprint_results': 'Sprint results',
+        'qualifying': 'Qualifying',
+        'lap_times': 'Lap times',
+        'driver_seasons': 'Driver seasons',
+        'standings': 'Standings',
+        'career_stats': 'Career stats',
+    }
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'path',
+            type=str,
+            help='Path to the dump zip file or to the directory with its CSV files'
+        )
+        parser.add_argument(
+            '--from',
+            dest='from_season',
+            type=int,
+            help='First season to load (default: all)'
+        )
+        parser.add_argument(
+            '--to',
+            dest='to_season',
+            type=int,
+            help='Last season to load (default: all)'
+        )
+        parser.add_argument(
+            '--no-laps',
+            action='store_true',
+            help='Skip lap_times.csv'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=ErgastDumpLoader.BATCH_SIZE,
+            help=f'Rows written per batch (default: {ErgastDumpLoader.BATCH_SIZE})'
+        )
+
+    def handle(self, *args, **options):
+        from_season = options['from_season']
+        to_season = options['to_season']
+        if from_season and to_season and to_season < from_season:
+            raise CommandError('--to must not be before --from')
+
+        try:
+            loader = ErgastDumpLoader(
+                options['path'],
+                from_season=from_season,
+                to_season=to_season,
+                batch_size=options['batch_size'],
+                log=self.stdout.write,
+            )
+        except ErgastDumpError as e:
+            raise CommandError(str(e))
+
+        self.stdout.write(self.style.SUCCESS(f'Loading Ergast dump from {options["path"]}...'))
+
+        try:
+            stats = loader.load(laps=not options['no_laps'])
+        except ErgastDumpError as e:
+            raise CommandError(str(e))
+        except Exception as e:
+            logger.exception("Unexpected error loading the Ergast dump")
+            raise CommandError(f'Error loading dump: {str(e)}')
+        finally:
+            loader.close()
+
+        self.stdout.write('')
+        for key, counts in stats.items():
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f'  ✓ {self.LABELS[key]}: {counts["created"]} created, {counts["updated"]} updated, '
+                    f'{counts["unchanged"]} unchanged'
+                )
+            )
+
+        self.stdout.write(self.style.SUCCESS('\n✓ Dump loaded successfully'))
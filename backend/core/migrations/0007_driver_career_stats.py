@@ -0,0 +1,75 @@
+# Generated by Django 5.2.11 on 2026-10-17 02:25
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Min, Q, Sum
+
+
+def backfill_career_stats(apps, schema_editor):
+    """Populate career stats for every driver that already has data"""
+    Result = apps.get_model('core', 'Result')
+    ChampionshipStanding = apps.get_model('core', 'ChampionshipStanding')
+    DriverSeason = apps.get_model('core', 'DriverSeason')
+    DriverCareerStats = apps.get_model('core', 'DriverCareerStats')
+
+    stats = {}
+
+    for row in Result.objects.values('driver').annotate(
+        wins=Count('id', filter=Q(final_position=1)),
+        podiums=Count('id', filter=Q(final_position__in=[1, 2, 3])),
+        points=Sum('points'),
+    ).order_by():
+        entry = stats.setdefault(row['driver'], {})
+        entry['total_wins'] = row['wins']
+        entry['total_podiums'] = row['podiums']
+        entry['career_points'] = float(row['points'] or 0)
+
+    for row in ChampionshipStanding.objects.filter(
+        standing_type='driver', round=0, driver__isnull=False
+    ).values('driver').annotate(
+        titles=Count('id', filter=Q(position=1)),
+        best=Min('position'),
+    ).order_by():
+        entry = stats.setdefault(row['driver'], {})
+        entry['world_championships'] = row['titles']
+        entry['best_championship_finish'] = row['best']
+
+    for row in DriverSeason.objects.values('driver').annotate(
+        seasons=Count('season', distinct=True),
+    ).order_by():
+        stats.setdefault(row['driver'], {})['total_seasons'] = row['seasons']
+
+    DriverCareerStats.objects.bulk_create(
+        [DriverCareerStats(driver_id=driver_id, **values) for driver_id, values in stats.items()],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0006_rename_core_qualif_race_id_pos_idx_core_qualif_race_id_82e934_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DriverCareerStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('total_wins', models.IntegerField(default=0)),
+                ('total_podiums', models.IntegerField(default=0)),
+                ('world_championships', models.IntegerField(default=0)),
+                ('total_seasons', models.IntegerField(default=0)),
+                ('best_championship_finish', models.IntegerField(blank=True, help_text='Best final position in the driver championship', null=True)),
+                ('career_points', models.FloatField(default=0.0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('driver', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='career_stats', to='core.driver')),
+            ],
+            options={
+                'verbose_name_plural': 'Driver career stats',
+                'ordering': ['driver'],
+            },
+        ),
+        migrations.RunPython(backfill_career_stats, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.11 on 2026-10-17 02:29
+
+import django.core.validators
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0007_driver_career_stats'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='championshipstanding',
+            name='team',
+            field=models.ForeignKey(blank=True, help_text="Driver's constructor as of this round", null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='core.constructor'),
+        ),
+        migrations.CreateModel(
+            name='StandingsSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('season', models.IntegerField(validators=[django.core.validators.MinValueValidator(1950)])),
+                ('standing_type', models.CharField(choices=[('driver', 'Driver Championship'), ('constructor', 'Constructor Championship')], max_length=20)),
+                ('round', models.IntegerField(help_text='0 means season total', validators=[django.core.validators.MinValueValidator(0)])),
+                ('is_stale', models.BooleanField(default=False, help_text='Results changed since the standings were computed')),
+                ('computed_at', models.DateTimeField(help_text='When the stored standings were last computed')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'ordering': ['season', 'standing_type', 'round'],
+                'unique_together': {('season', 'standing_type', 'round')},
+            },
+        ),
+    ]
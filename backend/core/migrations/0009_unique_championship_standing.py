@@ -0,0 +1,44 @@
+# Generated by Django 5.2.11 on 2026-10-17 02:31
+
+from django.db import migrations, models
+from django.db.models import Count, Max
+
+
+def remove_duplicate_standings(apps, schema_editor):
+    """Keep only the most recent row for each standing before adding the constraints"""
+    ChampionshipStanding = apps.get_model('core', 'ChampionshipStanding')
+
+    for entity in ('driver', 'constructor'):
+        duplicates = (
+            ChampionshipStanding.objects
+            .filter(**{f'{entity}__isnull': False})
+            .values('season', 'standing_type', 'round', entity)
+            .annotate(rows=Count('id'), keep=Max('id'))
+            .filter(rows__gt=1)
+        )
+        for duplicate in duplicates:
+            ChampionshipStanding.objects.filter(
+                season=duplicate['season'],
+                standing_type=duplicate['standing_type'],
+                round=duplicate['round'],
+                **{entity: duplicate[entity]}
+            ).exclude(id=duplicate['keep']).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0008_standings_snapshot'),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicate_standings, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='championshipstanding',
+            constraint=models.UniqueConstraint(fields=('season', 'standing_type', 'round', 'driver'), name='unique_driver_standing'),
+        ),
+        migrations.AddConstraint(
+            model_name='championshipstanding',
+            constraint=models.UniqueConstraint(fields=('season', 'standing_type', 'round', 'constructor'), name='unique_constructor_standing'),
+        ),
+    ]
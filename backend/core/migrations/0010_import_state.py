@@ -0,0 +1,32 @@
+# Generated by Django 5.2.11 on 2026-10-17 02:43
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0009_unique_championship_standing'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ImportState',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('season', models.IntegerField(validators=[django.core.validators.MinValueValidator(1950)])),
+                ('round', models.IntegerField(help_text='0 means season-wide resource', validators=[django.core.validators.MinValueValidator(0)])),
+                ('resource', models.CharField(choices=[('drivers', 'Drivers'), ('constructors', 'Constructors'), ('races', 'Races'), ('results', 'Results'), ('laps', 'Laps')], max_length=20)),
+                ('payload_hash', models.CharField(help_text='SHA-256 of the imported API payload', max_length=64)),
+                ('row_count', models.IntegerField(default=0, help_text='Rows in the imported payload')),
+                ('checked_at', models.DateTimeField(help_text='When the payload was last fetched and compared')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'ordering': ['season', 'round', 'resource'],
+                'unique_together': {('season', 'round', 'resource')},
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.11 on 2026-10-17 02:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0010_import_state'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='importstate',
+            name='resource',
+            field=models.CharField(choices=[('drivers', 'Drivers'), ('constructors', 'Constructors'), ('races', 'Races'), ('results', 'Results'), ('laps', 'Laps'), ('season', 'Completed season import')], max_length=20),
+        ),
+    ]
@@ -0,0 +1,72 @@
+# Generated by Django 5.2.11 on 2026-10-17 02:49
+
+from django.db import migrations, models
+
+
+def parse_lap_time(value):
+    """
+    Convert an 'h:mm:ss.SSS', 'm:ss.SSS' or 'ss.SSS' time to milliseconds (None
+    if empty or malformed). Copy of core.utils.parse_lap_time at the time of
+    this migration, so later changes to the application code do not alter it.
+    """
+    if not value:
+        return None
+
+    try:
+        parts = value.strip().split(':')
+        seconds = float(parts[-1])
+        minutes = int(parts[-2]) if len(parts) > 1 else 0
+        hours = int(parts[-3]) if len(parts) > 2 else 0
+    except ValueError:
+        return None
+
+    if len(parts) > 3 or seconds < 0 or minutes < 0 or hours < 0:
+        return None
+
+    return round((hours * 3600 + minutes * 60 + seconds) * 1000)
+
+
+def backfill_qualifying_milliseconds(apps, schema_editor):
+    """Parse the Q1/Q2/Q3 times of existing qualifying rows"""
+    Qualifying = apps.get_model('core', 'Qualifying')
+
+    rows = []
+    for row in Qualifying.objects.exclude(q1_time__isnull=True, q2_time__isnull=True, q3_time__isnull=True).iterator():
+        row.q1_milliseconds = parse_lap_time(row.q1_time)
+        row.q2_milliseconds = parse_lap_time(row.q2_time)
+        row.q3_milliseconds = parse_lap_time(row.q3_time)
+        rows.append(row)
+    Qualifying.objects.bulk_update(
+        rows, ['q1_milliseconds', 'q2_milliseconds', 'q3_milliseconds'], batch_size=1000
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0011_import_state_season_checkpoint'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='qualifying',
+            name='q1_milliseconds',
+            field=models.IntegerField(blank=True, help_text='Q1 time in milliseconds', null=True),
+        ),
+        migrations.AddField(
+            model_name='qualifying',
+            name='q2_milliseconds',
+            field=models.IntegerField(blank=True, help_text='Q2 time in milliseconds', null=True),
+        ),
+        migrations.AddField(
+            model_name='qualifying',
+            name='q3_milliseconds',
+            field=models.IntegerField(blank=True, help_text='Q3 time in milliseconds', null=True),
+        ),
+        migrations.RunPython(backfill_qualifying_milliseconds, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='importstate',
+            name='resource',
+            field=models.CharField(choices=[('drivers', 'Drivers'), ('constructors', 'Constructors'), ('races', 'Races'), ('results', 'Results'), ('qualifying', 'Qualifying'), ('sprint', 'Sprint results'), ('laps', 'Laps'), ('season', 'Completed season import')], max_length=20),
+        ),
+    ]
@@ -0,0 +1,83 @@
+# Generated by Django 5.2.11 on 2026-10-17 02:54
+
+from django.db import migrations, models
+
+
+def parse_lap_time(value):
+    """
+    Convert an 'h:mm:ss.SSS', 'm:ss.SSS' or 'ss.SSS' time to milliseconds (None
+    if empty or malformed). Copy of core.utils.parse_lap_time at the time of
+    this migration, so later changes to the application code do not alter it.
+    """
+    if not value:
+        return None
+
+    try:
+        parts = value.strip().split(':')
+        seconds = float(parts[-1])
+        minutes = int(parts[-2]) if len(parts) > 1 else 0
+        hours = int(parts[-3]) if len(parts) > 2 else 0
+    except ValueError:
+        return None
+
+    if len(parts) > 3 or seconds < 0 or minutes < 0 or hours < 0:
+        return None
+
+    return round((hours * 3600 + minutes * 60 + seconds) * 1000)
+
+
+def backfill_fastest_lap_milliseconds(apps, schema_editor):
+    """Parse the fastest lap times of existing results and sprint results"""
+    for model_name in ('Result', 'Sprint'):
+        model = apps.get_model('core', model_name)
+
+        rows = []
+        for row in model.objects.filter(fastest_lap_time__isnull=False).only('id', 'fastest_lap_time').iterator():
+            row.fastest_lap_time_milliseconds = parse_lap_time(row.fastest_lap_time)
+            rows.append(row)
+        model.objects.bulk_update(rows, ['fastest_lap_time_milliseconds'], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0012_qualifying_milliseconds'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='result',
+            name='fastest_lap_time_milliseconds',
+            field=models.IntegerField(blank=True, help_text='Fastest lap time in milliseconds', null=True),
+        ),
+        migrations.AddField(
+            model_name='sprint',
+            name='fastest_lap_time_milliseconds',
+            field=models.IntegerField(blank=True, help_text='Fastest lap time in milliseconds', null=True),
+        ),
+        migrations.RunPython(backfill_fastest_lap_milliseconds, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='qualifying',
+            index=models.Index(fields=['race', 'q1_milliseconds'], name='core_qualif_race_id_f2a5f9_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='qualifying',
+            index=models.Index(fields=['race', 'q2_milliseconds'], name='core_qualif_race_id_2ee73d_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='qualifying',
+            index=models.Index(fields=['race', 'q3_milliseconds'], name='core_qualif_race_id_f24dd9_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='race',
+            index=models.Index(fields=['circuit_id'], name='core_race_circuit_69a9ba_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='result',
+            index=models.Index(fields=['race', 'fastest_lap_time_milliseconds'], name='core_result_race_id_3f45f6_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='sprint',
+            index=models.Index(fields=['race', 'fastest_lap_time_milliseconds'], name='core_sprint_race_id_601c30_idx'),
+        ),
+    ]
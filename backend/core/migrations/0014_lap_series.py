@@ -0,0 +1,71 @@
+# Generated by Django 5.2.11 on 2026-10-17 02:57
+
+import django.db.models.deletion
+from itertools import groupby
+from django.db import migrations, models
+
+
+def group_lap_series(laps):
+    """
+    Group (race_id, driver_id, lap_number, position, lap_time_milliseconds) rows,
+    ordered by race and driver, into one lap time array and one position array
+    per driver and race. Copy of core.utils.group_lap_series at the time of this
+    migration, so later changes to the application code do not alter it.
+    """
+    for (race_id, driver_id), rows in groupby(laps, key=lambda lap: (lap[0], lap[1])):
+        times, positions = [], []
+        for _, _, lap_number, position, milliseconds in rows:
+            if lap_number > len(times):
+                missing = lap_number - len(times)
+                times.extend([None] * missing)
+                positions.extend([None] * missing)
+            times[lap_number - 1] = milliseconds
+            positions[lap_number - 1] = position
+        yield race_id, driver_id, times, positions
+
+
+def backfill_lap_series(apps, schema_editor):
+    """Build the lap series of the laps already imported"""
+    Lap = apps.get_model('core', 'Lap')
+    LapSeries = apps.get_model('core', 'LapSeries')
+
+    laps = (
+        Lap.objects.order_by('race_id', 'driver_id', 'lap_number')
+        .values_list('race_id', 'driver_id', 'lap_number', 'position', 'lap_time_milliseconds')
+        .iterator(chunk_size=5000)
+    )
+    series = []
+    for race_id, driver_id, times, positions in group_lap_series(laps):
+        series.append(LapSeries(race_id=race_id, driver_id=driver_id,
+                                lap_times_milliseconds=times, positions=positions))
+        if len(series) >= 1000:
+            LapSeries.objects.bulk_create(series)
+            series = []
+    LapSeries.objects.bulk_create(series)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0013_fastest_lap_milliseconds'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LapSeries',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('lap_times_milliseconds', models.JSONField(default=list, help_text='Lap times in milliseconds, by lap')),
+                ('positions', models.JSONField(default=list, help_text='Position at the end of each lap')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('driver', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='lap_series', to='core.driver')),
+                ('race', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='lap_series', to='core.race')),
+            ],
+            options={
+                'verbose_name_plural': 'Lap series',
+                'ordering': ['race', 'driver'],
+                'unique_together': {('race', 'driver')},
+            },
+        ),
+        migrations.RunPython(backfill_lap_series, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,58 @@
+# Generated by Django 5.2.11 on 2026-10-17 03:00
+
+from django.core.validators import MinValueValidator
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+SEASON_MODELS = ['result', 'lap', 'qualifying', 'sprint']
+
+
+def backfill_season(apps, schema_editor):
+    """Copy race.season onto the existing rows"""
+    Race = apps.get_model('core', 'Race')
+    race_season = Subquery(Race.objects.filter(pk=OuterRef('race_id')).values('season')[:1])
+    for model_name in SEASON_MODELS:
+        apps.get_model('core', model_name).objects.update(season=race_season)
+
+
+def season_field(null):
+    return models.IntegerField(
+        editable=False, null=null, validators=[MinValueValidator(1950)],
+        help_text='Season of the race (copied from race.season)',
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0014_lap_series'),
+    ]
+
+    operations = [
+        *[
+            migrations.AddField(model_name=model_name, name='season', field=season_field(null=True))
+            for model_name in SEASON_MODELS
+        ],
+        migrations.RunPython(backfill_season, migrations.RunPython.noop),
+        *[
+            migrations.AlterField(model_name=model_name, name='season', field=season_field(null=False))
+            for model_name in SEASON_MODELS
+        ],
+        migrations.AlterUniqueTogether(
+            name='lap',
+            unique_together={('race', 'driver', 'lap_number', 'season')},
+        ),
+        migrations.AddIndex(
+            model_name='qualifying',
+            index=models.Index(fields=['season', 'driver'], name='core_qualif_season_4134f9_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='result',
+            index=models.Index(fields=['season', 'driver'], name='core_result_season_ba331f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='sprint',
+            index=models.Index(fields=['season', 'driver'], name='core_sprint_season_0f63d4_idx'),
+        ),
+    ]
@@ -0,0 +1,106 @@
+"""
+Range-partition the lap table by season on PostgreSQL.
+
+Django cannot declare partitioned tables, so the table is rebuilt by hand:
+the existing table is renamed, a partitioned copy with one partition per
+known season is created, the rows are copied over and the constraints and
+indexes are recreated with their original names. The primary key becomes
+(id, season) since PostgreSQL requires the partition key in every unique
+constraint; ids stay unique through their sequence.
+
+Other databases keep the plain table.
+"""
+
+import re
+from django.db import migrations
+
+
+LAP_TABLE = 'core_lap'
+OLD_TABLE = 'core_lap_old'
+
+
+def rebuild_lap_table(schema_editor, partitioned):
+    connection = schema_editor.connection
+    if connection.vendor != 'postgresql':
+        return
+
+    quote = connection.ops.quote_name
+    with connection.cursor() as cursor:
+        cursor.execute(f"ALTER TABLE {quote(LAP_TABLE)} RENAME TO {quote(OLD_TABLE)}")
+
+        cursor.execute(
+            "SELECT conname, contype, pg_get_constraintdef(oid) FROM pg_constraint "
+            "WHERE conrelid = %s::regclass AND contype IN ('p', 'u', 'f') ORDER BY contype DESC",
+            [OLD_TABLE],
+        )
+        constraints = cursor.fetchall()
+        cursor.execute(
+            "SELECT index_class.relname, pg_get_indexdef(x.indexrelid) FROM pg_index x "
+            "JOIN pg_class index_class ON index_class.oid = x.indexrelid "
+            "WHERE x.indrelid = %s::regclass "
+            "AND NOT EXISTS (SELECT 1 FROM pg_constraint c WHERE c.conindid = x.indexrelid AND c.conrelid = x.indrelid)",
+            [OLD_TABLE],
+        )
+        indexes = cursor.fetchall()
+
+        if partitioned:
+            cursor.execute(
+                f"CREATE TABLE {quote(LAP_TABLE)} (LIKE {quote(OLD_TABLE)} INCLUDING STORAGE) "
+                f"PARTITION BY RANGE (season)"
+            )
+            cursor.execute(
+                f"SELECT DISTINCT season FROM {quote(OLD_TABLE)} "
+                f"UNION SELECT season FROM core_race UNION SELECT year FROM core_season"
+            )
+            for (season,) in cursor.fetchall():
+                cursor.execute(
+                    f"CREATE TABLE {quote(f'{LAP_TABLE}_{season}')} PARTITION OF {quote(LAP_TABLE)} "
+                    f"FOR VALUES FROM ({season}) TO ({season + 1})"
+                )
+        else:
+            cursor.execute(f"CREATE TABLE {quote(LAP_TABLE)} (LIKE {quote(OLD_TABLE)} INCLUDING STORAGE)")
+
+        cursor.execute(f"INSERT INTO {quote(LAP_TABLE)} SELECT * FROM {quote(OLD_TABLE)}")
+        # Drops the old id sequence (and the partitions when reverting)
+        cursor.execute(f"DROP TABLE {quote(OLD_TABLE)}")
+
+        # Identity columns are not supported on partitioned tables before PostgreSQL 17
+        if partitioned:
+            cursor.execute(f"CREATE SEQUENCE {quote(f'{LAP_TABLE}_id_seq')} OWNED BY {quote(LAP_TABLE)}.id")
+            cursor.execute(
+                f"ALTER TABLE {quote(LAP_TABLE)} ALTER COLUMN id SET DEFAULT nextval(%s::regclass)",
+                [f'{LAP_TABLE}_id_seq'],
+            )
+        else:
+            cursor.execute(f"ALTER TABLE {quote(LAP_TABLE)} ALTER COLUMN id ADD GENERATED BY DEFAULT AS IDENTITY")
+        cursor.execute(
+            f"SELECT setval(pg_get_serial_sequence(%s, 'id'), COALESCE(MAX(id), 1), MAX(id) IS NOT NULL) "
+            f"FROM {quote(LAP_TABLE)}",
+            [LAP_TABLE],
+        )
+
+        for name, contype, definition in constraints:
+            if contype == 'p':
+                definition = 'PRIMARY KEY (id, season)' if partitioned else 'PRIMARY KEY (id)'
+            cursor.execute(f"ALTER TABLE {quote(LAP_TABLE)} ADD CONSTRAINT {quote(name)} {definition}")
+        for name, definition in indexes:
+            cursor.execute(re.sub(r' ON (ONLY )?\S+ USING ', f' ON {quote(LAP_TABLE)} USING ', definition))
+
+
+def partition_laps(apps, schema_editor):
+    rebuild_lap_table(schema_editor, partitioned=True)
+
+
+def unpartition_laps(apps, schema_editor):
+    rebuild_lap_table(schema_editor, partitioned=False)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0015_season_columns'),
+    ]
+
+    operations = [
+        migrations.RunPython(partition_laps, unpartition_laps),
+    ]
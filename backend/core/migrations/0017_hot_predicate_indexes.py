@@ -0,0 +1,52 @@
+# Generated by Django 5.2.11 on 2026-10-17 03:04
+
+from django.db import migrations, models
+from django.db.models import Q
+
+
+def delete_mismatched_standings(apps, schema_editor):
+    """Drop cached standings rows that would violate the entity check (they are recalculated)"""
+    ChampionshipStanding = apps.get_model('core', 'ChampionshipStanding')
+    ChampionshipStanding.objects.exclude(
+        Q(standing_type='driver', driver__isnull=False, constructor__isnull=True)
+        | Q(standing_type='constructor', constructor__isnull=False, driver__isnull=True)
+    ).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0016_partition_laps'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='result',
+            name='core_result_season_ba331f_idx',
+        ),
+        migrations.AddIndex(
+            model_name='championshipstanding',
+            index=models.Index(condition=models.Q(('round', 0), ('standing_type', 'driver')), fields=['driver', 'season'], include=('position', 'points', 'wins'), name='final_driver_standing_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='championshipstanding',
+            index=models.Index(condition=models.Q(('round', 0), ('standing_type', 'constructor')), fields=['constructor', 'season'], include=('position', 'points', 'wins'), name='final_constructor_standing_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='result',
+            index=models.Index(fields=['season', 'driver', 'final_position'], name='core_result_season_4987ce_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='result',
+            index=models.Index(condition=models.Q(('final_position', 1)), fields=['driver', 'season'], name='result_win_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='result',
+            index=models.Index(condition=models.Q(('final_position__in', [1, 2, 3])), fields=['driver', 'season', 'final_position'], name='result_podium_idx'),
+        ),
+        migrations.RunPython(delete_mismatched_standings, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='championshipstanding',
+            constraint=models.CheckConstraint(condition=models.Q(models.Q(('constructor__isnull', True), ('driver__isnull', False), ('standing_type', 'driver')), models.Q(('constructor__isnull', False), ('driver__isnull', True), ('standing_type', 'constructor')), _connector='OR'), name='standing_entity_matches_type'),
+        ),
+    ]
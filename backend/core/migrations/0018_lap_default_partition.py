@@ -0,0 +1,44 @@
+"""
+Add a DEFAULT partition to the partitioned lap table on PostgreSQL.
+
+Without it, inserting a lap for a season that has no partition yet fails
+with "no partition of relation found for row" (ORM writes, fresh and test
+databases, seasons added after migration 0016). Rows in the default
+partition are moved to their season partition by
+PartitionService.ensure_partitions.
+
+Other databases and unpartitioned tables are left unchanged. Reverting is a
+no-op: the default partition is dropped with the table when 0016 is reverted.
+"""
+
+from django.db import migrations
+
+
+LAP_TABLE = 'core_lap'
+DEFAULT_PARTITION = 'core_lap_default'
+
+
+def add_default_partition(apps, schema_editor):
+    connection = schema_editor.connection
+    if connection.vendor != 'postgresql':
+        return
+
+    quote = connection.ops.quote_name
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(%s)", [LAP_TABLE])
+        if cursor.fetchone() is None:
+            return
+        cursor.execute(
+            f"CREATE TABLE IF NOT EXISTS {quote(DEFAULT_PARTITION)} PARTITION OF {quote(LAP_TABLE)} DEFAULT"
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0017_hot_predicate_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(add_default_partition, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,80 @@
+"""
+Store the LapSeries lap time and position series as integer arrays.
+
+On PostgreSQL the columns become native integer[] (4 bytes per lap instead
+of the JSON text of each number, and no JSON parsing when a race is read);
+the existing jsonb arrays are converted in place. Other databases keep the
+arrays as JSON text, so the table is only rebuilt with the new field.
+"""
+
+from django.db import migrations, models
+import core.fields
+
+
+LAP_SERIES_TABLE = 'core_lapseries'
+ARRAY_COLUMNS = ['lap_times_milliseconds', 'positions']
+HELP_TEXTS = {
+    'lap_times_milliseconds': 'Lap times in milliseconds, by lap',
+    'positions': 'Position at the end of each lap',
+}
+
+
+def alter_columns(apps, schema_editor, to_integer_arrays):
+    connection = schema_editor.connection
+    if connection.vendor == 'postgresql':
+        quote = connection.ops.quote_name
+        for column in ARRAY_COLUMNS:
+            if to_integer_arrays:
+                # '[1, null, 3]' -> '{1, null, 3}', a valid array literal
+                target = f"integer[] USING translate({quote(column)}::text, '[]', '{{}}')::integer[]"
+            else:
+                target = f"jsonb USING to_jsonb({quote(column)})"
+            schema_editor.execute(f"ALTER TABLE {quote(LAP_SERIES_TABLE)} ALTER COLUMN {quote(column)} TYPE {target}")
+        return
+
+    model = apps.get_model('core', 'LapSeries')
+    for column in ARRAY_COLUMNS:
+        json_field = models.JSONField(default=list, help_text=HELP_TEXTS[column])
+        array_field = core.fields.IntegerListField(default=list, help_text=HELP_TEXTS[column])
+        for field in (json_field, array_field):
+            field.set_attributes_from_name(column)
+            field.model = model
+        if to_integer_arrays:
+            schema_editor.alter_field(model, json_field, array_field)
+        else:
+            schema_editor.alter_field(model, array_field, json_field)
+
+
+def to_integer_arrays(apps, schema_editor):
+    alter_columns(apps, schema_editor, to_integer_arrays=True)
+
+
+def to_json(apps, schema_editor):
+    alter_columns(apps, schema_editor, to_integer_arrays=False)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0019_season_data_version'),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunPython(to_integer_arrays, to_json),
+            ],
+            state_operations=[
+                migrations.AlterField(
+                    model_name='lapseries',
+                    name='lap_times_milliseconds',
+                    field=core.fields.IntegerListField(default=list, help_text='Lap times in milliseconds, by lap'),
+                ),
+                migrations.AlterField(
+                    model_name='lapseries',
+                    name='positions',
+                    field=core.fields.IntegerListField(default=list, help_text='Position at the end of each lap'),
+                ),
+            ],
+        ),
+    ]
@@ -1,5 +1,7 @@
 from django.db import models
+from django.db.models import Q
 from django.core.validators import MinValueValidator
+from core.fields import IntegerListField
 
 
 class Season(models.Model):
@@ -145,13 +147,33 @@ class Race(models.Model):
             models.Index(fields=['race_id']),
             models.Index(fields=['season', 'round']),
             models.Index(fields=['date']),
+            models.Index(fields=['circuit_id']),
         ]
 
     def __str__(self):
         return f"{self.season} - Round {self.round}: {self.race_name}"
 
 
-class Result(models.Model):
+class RaceSeasonModel(models.Model):
+    """
+    Base class for the per-race tables (results, laps, qualifying, sprints).
+    Keeps a copy of race.season so season-scoped queries filter on the table
+    itself instead of joining races (and prune the lap partitions on PostgreSQL).
+    Bulk writers set season explicitly; save() fills it in from the race.
+    """
+    season = models.IntegerField(validators=[MinValueValidator(1950)], editable=False,
+                                 help_text="Season of the race (copied from race.season)")
+
+    class Meta:
+        abstract = True
+
+    def save(self, *args, **kwargs):
+        if self.season is None:
+            self.season = self.race.season
+        super().save(*args, **kwargs)
+
+
+class Result(RaceSeasonModel):
     """
     Represents the result of a driver in a specific race.
     """
@@ -177,6 +199,7 @@ class Result(models.Model):
     
     fastest_lap = models.IntegerField(null=True, blank=True, help_text="Lap number of fastest lap")
     fastest_lap_time = models.CharField(max_length=20, null=True, blank=True)
+    fastest_lap_time_milliseconds = models.IntegerField(null=True, blank=True, help_text="Fastest lap time in milliseconds")
     fastest_lap_speed = models.FloatField(null=True, blank=True, help_text="Speed in km/h")
     
     created_at = models.DateTimeField(auto_now_add=True)
@@ -189,13 +212,23 @@ class Result(models.Model):
             models.Index(fields=['race', 'final_position']),
             models.Index(fields=['driver', 'race']),
             models.Index(fields=['points']),
+            models.Index(fields=['race', 'fastest_lap_time_milliseconds']),
+            # Also serves a driver's best finish of a season
+            models.Index(fields=['season', 'driver', 'final_position']),
+            # Partial indexes matching the win and podium predicates
+            models.Index(fields=['driver', 'season'], condition=Q(final_position=1), name='result_win_idx'),
+            models.Index(
+                fields=['driver', 'season', 'final_position'],
+                condition=Q(final_position__in=[1, 2, 3]),
+                name='result_podium_idx',
+            ),
         ]
 
     def __str__(self):
         return f"{self.driver} - {self.race} - P{self.position_text}"
 
 
-class Lap(models.Model):
+class Lap(RaceSeasonModel):
     """
     Represents lap time data for a specific driver in a race.
     """
@@ -211,7 +244,9 @@ class Lap(models.Model):
 
     class Meta:
         ordering = ['race', 'lap_number', 'position']
-        unique_together = ['race', 'driver', 'lap_number']
+        # The partition key (season) must be part of every unique constraint of
+        # the partitioned lap table on PostgreSQL
+        unique_together = ['race', 'driver', 'lap_number', 'season']
         indexes = [
             models.Index(fields=['race', 'lap_number']),
             models.Index(fields=['driver', 'race']),
@@ -222,7 +257,31 @@ class Lap(models.Model):
         return f"{self.driver} - {self.race} - Lap {self.lap_number}: {self.lap_time}"
 
 
-class Qualifying(models.Model):
+class LapSeries(models.Model):
+    """
+    Compact copy of the laps of one driver in one race.
+    Element i of each array is lap i + 1 (null for a lap without timing data),
+    so a whole race is loaded with one row per driver instead of one per lap.
+    Rebuilt from Lap by LapImportService whenever lap times are imported.
+    """
+    race = models.ForeignKey(Race, on_delete=models.CASCADE, related_name='lap_series')
+    driver = models.ForeignKey(Driver, on_delete=models.CASCADE, related_name='lap_series')
+
+    lap_times_milliseconds = IntegerListField(default=list, help_text="Lap times in milliseconds, by lap")
+    positions = IntegerListField(default=list, help_text="Position at the end of each lap")
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['race', 'driver']
+        unique_together = ['race', 'driver']
+        verbose_name_plural = 'Lap series'
+
+    def __str__(self):
+        return f"{self.driver} - {self.race} - {len(self.positions)} laps"
+
+
+class Qualifying(RaceSeasonModel):
     """
     Represents qualifying results for a specific race.
     """
@@ -234,6 +293,9 @@ class Qualifying(models.Model):
     q1_time = models.CharField(max_length=20, null=True, blank=True, help_text="Q1 time")
     q2_time = models.CharField(max_length=20, null=True, blank=True, help_text="Q2 time")
     q3_time = models.CharField(max_length=20, null=True, blank=True, help_text="Q3 time")
+    q1_milliseconds = models.IntegerField(null=True, blank=True, help_text="Q1 time in milliseconds")
+    q2_milliseconds = models.IntegerField(null=True, blank=True, help_text="Q2 time in milliseconds")
+    q3_milliseconds = models.IntegerField(null=True, blank=True, help_text="Q3 time in milliseconds")
     
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -244,13 +306,17 @@ class Qualifying(models.Model):
         indexes = [
             models.Index(fields=['race', 'position']),
             models.Index(fields=['driver', 'race']),
+            models.Index(fields=['race', 'q1_milliseconds']),
+            models.Index(fields=['race', 'q2_milliseconds']),
+            models.Index(fields=['race', 'q3_milliseconds']),
+            models.Index(fields=['season', 'driver']),
         ]
 
     def __str__(self):
         return f"{self.driver} - {self.race} Qualifying - P{self.position}"
 
 
-class Sprint(models.Model):
+class Sprint(RaceSeasonModel):
     """
     Represents sprint race results (only exists for sprint weekends).
     """
@@ -275,6 +341,7 @@ class Sprint(models.Model):
     retirement_reason = models.CharField(max_length=255, blank=True, null=True, help_text='Reason for DNF/retirement')
     
     fastest_lap_time = models.CharField(max_length=20, null=True, blank=True)
+    fastest_lap_time_milliseconds = models.IntegerField(null=True, blank=True, help_text="Fastest lap time in milliseconds")
     
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -286,6 +353,8 @@ class Sprint(models.Model):
             models.Index(fields=['race', 'final_position']),
             models.Index(fields=['driver', 'race']),
             models.Index(fields=['points']),
+            models.Index(fields=['race', 'fastest_lap_time_milliseconds']),
+            models.Index(fields=['season', 'driver']),
         ]
 
     def __str__(self):
@@ -309,6 +378,8 @@ class ChampionshipStanding(models.Model):
     # These fields are mutually exclusive based on standing_type
     driver = models.ForeignKey(Driver, on_delete=models.CASCADE, null=True, blank=True, related_name='standings')
     constructor = models.ForeignKey(Constructor, on_delete=models.CASCADE, null=True, blank=True, related_name='standings')
+    # Driver standings only: the constructor the driver raced for in their latest race
+    team = models.ForeignKey(Constructor, on_delete=models.SET_NULL, null=True, blank=True, related_name='+', help_text="Driver's constructor as of this round")
     
     position = models.IntegerField()
     points = models.FloatField()
@@ -323,8 +394,159 @@ class ChampionshipStanding(models.Model):
             models.Index(fields=['season', 'standing_type', 'round']),
             models.Index(fields=['driver', 'season']),
             models.Index(fields=['constructor', 'season']),
+            # Final standings (round 0) per driver or constructor, covering the displayed columns
+            models.Index(
+                fields=['driver', 'season'], include=['position', 'points', 'wins'],
+                condition=Q(round=0, standing_type='driver'), name='final_driver_standing_idx',
+            ),
+            models.Index(
+                fields=['constructor', 'season'], include=['position', 'points', 'wins'],
+                condition=Q(round=0, standing_type='constructor'), name='final_constructor_standing_idx',
+            ),
+        ]
+        constraints = [
+            # NULLs are distinct, so each constraint only applies to its own standing type
+            models.UniqueConstraint(
+                fields=['season', 'standing_type', 'round', 'driver'],
+                name='unique_driver_standing'
+            ),
+            models.UniqueConstraint(
+                fields=['season', 'standing_type', 'round', 'constructor'],
+                name='unique_constructor_standing'
+            ),
+            # ...which requires exactly the entity of the standing type to be set
+            models.CheckConstraint(
+                condition=(
+                    Q(standing_type='driver', driver__isnull=False, constructor__isnull=True)
+                    | Q(standing_type='constructor', constructor__isnull=False, driver__isnull=True)
+                ),
+                name='standing_entity_matches_type'
+            ),
         ]
 
     def __str__(self):
         entity = self.driver if self.driver else self.constructor
         return f"{self.season} R{self.round} - P{self.position}: {entity} ({self.points} pts)"
+
+
+class StandingsSnapshot(models.Model):
+    """
+    Freshness marker for the stored ChampionshipStanding rows of a season round.
+    Stored standings are only served while their snapshot is not stale.
+    """
+    season = models.IntegerField(validators=[MinValueValidator(1950)])
+    standing_type = models.CharField(max_length=20, choices=ChampionshipStanding.STANDING_TYPE_CHOICES)
+    round = models.IntegerField(validators=[MinValueValidator(0)], help_text="0 means season total")
+    
+    is_stale = models.BooleanField(default=False, help_text="Results changed since the standings were computed")
+    computed_at = models.DateTimeField(help_text="When the stored standings were last computed")
+    
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['season', 'standing_type', 'round']
+        unique_together = ['season', 'standing_type', 'round']
+
+    def __str__(self):
+        state = 'stale' if self.is_stale else 'fresh'
+        return f"{self.season} R{self.round} {self.standing_type} standings ({state})"
+
+
+class SeasonDataVersion(models.Model):
+    """
+    Data version of a season, incremented in the same transaction as every
+    write to the season's stored data. Cached data embeds the version in its
+    key, so every process sees the invalidation as soon as the write commits.
+    """
+    season = models.IntegerField(unique=True)
+    version = models.PositiveIntegerField(default=1)
+    
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['season']
+
+    def __str__(self):
+        return f"{self.season} data v{self.version}"
+
+
+class DriverCareerStats(models.Model):
+    """
+    Stores precomputed career statistics for a driver (can be regenerated from
+    Results, ChampionshipStandings and DriverSeasons).
+    Cached for performance.
+    """
+    driver = models.OneToOneField(Driver, on_delete=models.CASCADE, related_name='career_stats')
+    
+    total_wins = models.IntegerField(default=0)
+    total_podiums = models.IntegerField(default=0)
+    world_championships = models.IntegerField(default=0)
+    total_seasons = models.IntegerField(default=0)
+    best_championship_finish = models.IntegerField(null=True, blank=True, help_text="Best final position in the driver championship")
+    career_points = models.FloatField(default=0.0)
+    
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['driver']
+        verbose_name_plural = 'Driver career stats'
+
+    def __str__(self):
+        return f"{self.driver} - {self.total_wins} wins, {self.world_championships} titles"
+
+
+class ImportState(models.Model):
+    """
+    Records the last imported API payload of a resource for a season round,
+    so repeated imports can skip data that has not changed.
+    """
+    RESOURCE_CHOICES = [
+        ('drivers', 'Drivers'),
+        ('constructors', 'Constructors'),
+        ('races', 'Races'),
+        ('results', 'Results'),
+        ('qualifying', 'Qualifying'),
+        ('sprint', 'Sprint results'),
+        ('laps', 'Laps'),
+        ('season', 'Completed season import'),
+    ]
+    
+    season = models.IntegerField(validators=[MinValueValidator(1950)])
+    round = models.IntegerField(validators=[MinValueValidator(0)], help_text="0 means season-wide resource")
+    resource = models.CharField(max_length=20, choices=RESOURCE_CHOICES)
+    
+    payload_hash = models.CharField(max_length=64, help_text="SHA-256 of the imported API payload")
+    row_count = models.IntegerField(default=0, help_text="Rows in the imported payload")
+    checked_at = models.DateTimeField(help_text="When the payload was last fetched and compared")
+    
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['season', 'round', 'resource']
+        unique_together = ['season', 'round', 'resource']
+
+    def __str__(self):
+        return f"{self.season} R{self.round} {self.resource} ({self.payload_hash[:8]})"
+
+
+class RateLimitBucket(models.Model):
+    """
+    Token bucket of an external API request budget, shared by every process
+    that calls the API (see core/services/rate_limiter.py).
+    """
+    name = models.CharField(max_length=100, unique=True)
+    tokens = models.FloatField(help_text="Requests available at refilled_at")
+    refilled_at = models.DateTimeField()
+    
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['name']
+
+    def __str__(self):
+        return f"{self.name}: {self.tokens:.1f} requests available"
@@ -0,0 +1,272 @@
+"""
+Bulk Write Service
+
+Helpers for writing many rows with INSERT ... ON CONFLICT DO UPDATE
+(bulk_create(update_conflicts=True)) while still reporting how many rows
+were created and how many already existed. sync() additionally compares
+incoming rows with the stored ones and only writes rows that changed;
+preview() reports the same comparison field by field without writing.
+"""
+
+import logging
+from typing import Dict, Iterator, List, Optional, Sequence, Set, Tuple
+from django.db import models
+
+
+logger = logging.getLogger(__name__)
+
+
+class BulkService:
+    """
+    Service class for batched upserts against a unique constraint.
+    """
+
+    @staticmethod
+    def _key_filters(model, objs: Sequence[models.Model], attnames: List[str]) -> Dict:
+        """
+        Build filters matching every stored row that may share a key with objs.
+
+        Filters each unique field with an IN clause and leaves matching the
+        full key to the caller.
+        """
+        filters = {}
+        for attname in attnames:
+            values = {getattr(obj, attname) for obj in objs}
+            if None in values:
+                values.discard(None)
+                # NULLs never conflict in a unique constraint
+                filters[f'{attname}__isnull'] = False
+            filters[f'{attname}__in'] = values
+        return filters
+
+    @staticmethod
+    def _unique(model, objs: Sequence[models.Model], unique_fields: List[str]) -> List[models.Model]:
+        """
+        Keep one object per unique key (the last one, as sequential saves would).
+
+        A single INSERT ... ON CONFLICT DO UPDATE cannot affect the same row
+        twice, so duplicate keys must not reach one statement. Keys with a
+        NULL never conflict and are all kept.
+        """
+        attnames = [model._meta.get_field(name).attname for name in unique_fields]
+        by_key = {}
+        for obj in objs:
+            key = tuple(getattr(obj, attname) for attname in attnames)
+            by_key[key if None not in key else object()] = obj
+
+        if len(by_key) < len(objs):
+            logger.warning(
+                f"{model.__name__}: {len(objs) - len(by_key)} rows with a duplicate "
+                f"{', '.join(unique_fields)} dropped, keeping the last one"
+            )
+            return list(by_key.values())
+        return list(objs)
+
+    @staticmethod
+    def existing_keys(model, objs: Sequence[models.Model], unique_fields: List[str]) -> Set[Tuple]:
+        """
+        Find which objects already exist in the database (one query).
+
+        Args:
+            model: Model class
+            objs: Unsaved model instances
+            unique_fields: Field names of the unique constraint
+
+        Returns:
+            Set of unique key tuples already stored
+        """
+        if not objs:
+            return set()
+
+        attnames = [model._meta.get_field(name).attname for name in unique_fields]
+        filters = BulkService._key_filters(model, objs, attnames)
+        return set(model.objects.filter(**filters).values_list(*attnames))
+
+    @staticmethod
+    def _compare(model, objs: List[models.Model], unique_fields: List[str],
+                 update_fields: List[str]) -> Iterator[Tuple[models.Model, Optional[Dict]]]:
+        """
+        Compare unsaved objects with the stored rows they would overwrite (one query).
+
+        Incoming values are normalized with each field's to_python() so that
+        API strings compare equal to the stored dates, numbers and times.
+        auto_now fields are ignored.
+
+        Yields:
+            Tuples of (object, changes), where changes is None for new objects
+            and otherwise maps each differing field name to (stored, incoming)
+        """
+        key_attnames = [model._meta.get_field(name).attname for name in unique_fields]
+        compare_fields = [
+            field for field in (model._meta.get_field(name) for name in update_fields)
+            if not getattr(field, 'auto_now', False)
+        ]
+        compare_attnames = [field.attname for field in compare_fields]
+
+        filters = BulkService._key_filters(model, objs, key_attnames)
+        stored = {
+            row[:len(key_attnames)]: row[len(key_attnames):]
+            for row in model.objects.filter(**filters).values_list(*key_attnames, *compare_attnames)
+        }
+
+        for obj in objs:
+            key = tuple(getattr(obj, attname) for attname in key_attnames)
+            if key not in stored:
+                yield obj, None
+                continue
+
+            changes = {}
+            for field, stored_value in zip(compare_fields, stored[key]):
+                value = field.to_python(getattr(obj, field.attname))
+                if value != stored_value:
+                    changes[field.name] = (stored_value, value)
+            yield obj, changes
+
+    @staticmethod
+    def diff(model, objs: Sequence[models.Model], unique_fields: List[str],
+             update_fields: List[str]) -> Tuple[List, List, List]:
+        """
+        Split unsaved objects into new, changed and unchanged ones (one query).
+
+        Args:
+            model: Model class
+            objs: Unsaved model instances
+            unique_fields: Field names of the unique constraint
+            update_fields: Fields to compare (auto_now fields are ignored)
+
+        Returns:
+            Tuple of (new_objs, changed_objs, unchanged_objs)
+        """
+        objs = BulkService._unique(model, list(objs), unique_fields)
+        if not objs:
+            return [], [], []
+
+        new_objs, changed_objs, unchanged_objs = [], [], []
+        for obj, changes in BulkService._compare(model, objs, unique_fields, update_fields):
+            if changes is None:
+                new_objs.append(obj)
+            elif changes:
+                changed_objs.append(obj)
+            else:
+                unchanged_objs.append(obj)
+
+        return new_objs, changed_objs, unchanged_objs
+
+    @staticmethod
+    def preview(model, objs: Sequence[models.Model], unique_fields: List[str], update_fields: List[str],
+                scope: Optional[Dict] = None) -> Dict[str, List]:
+        """
+        Describe what sync() would write, with read-only queries.
+
+        Args:
+            model: Model class
+            objs: Unsaved model instances
+            unique_fields: Field names of the unique constraint
+            update_fields: Fields to compare (auto_now fields are ignored)
+            scope: Optional filters selecting the stored rows that objs replace
+                (e.g. the results of the imported races); stored rows in the
+                scope that match no object are reported as orphaned
+
+        Returns:
+            Dictionary with the 'created' objects, the 'updated' (object, field changes)
+            pairs, the 'unchanged' objects and the 'orphaned' stored key tuples
+        """
+        objs = BulkService._unique(model, list(objs), unique_fields)
+        result = {'created': [], 'updated': [], 'unchanged': [], 'orphaned': []}
+
+        if objs:
+            for obj, changes in BulkService._compare(model, objs, unique_fields, update_fields):
+                if changes is None:
+                    result['created'].append(obj)
+                elif changes:
+                    result['updated'].append((obj, changes))
+                else:
+                    result['unchanged'].append(obj)
+
+        if scope is not None:
+            key_attnames = [model._meta.get_field(name).attname for name in unique_fields]
+            incoming = {tuple(getattr(obj, attname) for attname in key_attnames) for obj in objs}
+            result['orphaned'] = [
+                key for key in model.objects.filter(**scope).values_list(*key_attnames)
+                if key not in incoming
+            ]
+
+        return result
+
+    @staticmethod
+    def _write(model, objs: List[models.Model], unique_fields: List[str], update_fields: List[str],
+               batch_size: int):
+        """Run the batched INSERT ... ON CONFLICT DO UPDATE"""
+        attnames = [model._meta.get_field(name).attname for name in unique_fields]
+
+        # Sorting by key keeps lock order stable across concurrent writers
+        objs.sort(key=lambda obj: tuple(str(getattr(obj, attname)) for attname in attnames))
+
+        model.objects.bulk_create(
+            objs,
+            batch_size=batch_size,
+            update_conflicts=True,
+            unique_fields=unique_fields,
+            update_fields=update_fields,
+        )
+
+    @staticmethod
+    def upsert(model, objs: Sequence[models.Model], unique_fields: List[str], update_fields: List[str],
+               batch_size: int = 1000) -> Tuple[int, int]:
+        """
+        Insert new rows and update existing ones in batches.
+
+        Args:
+            model: Model class
+            objs: Unsaved model instances
+            unique_fields: Field names of the unique constraint to upsert on
+            update_fields: Fields to overwrite when the row already exists
+            batch_size: Rows per INSERT statement
+
+        Returns:
+            Tuple of (created_count, updated_count)
+        """
+        objs = BulkService._unique(model, list(objs), unique_fields)
+        if not objs:
+            return 0, 0
+
+        attnames = [model._meta.get_field(name).attname for name in unique_fields]
+        existing = BulkService.existing_keys(model, objs, unique_fields)
+
+        BulkService._write(model, objs, unique_fields, update_fields, batch_size)
+
+        updated = sum(1 for obj in objs if tuple(getattr(obj, attname) for attname in attnames) in existing)
+        created = len(objs) - updated
+
+        logger.debug(f"Upserted {model.__name__}: {created} created, {updated} updated")
+        return created, updated
+
+    @staticmethod
+    def sync(model, objs: Sequence[models.Model], unique_fields: List[str], update_fields: List[str],
+             batch_size: int = 1000) -> Dict[str, List]:
+        """
+        Insert new rows and update changed ones, leaving identical rows untouched.
+
+        Unchanged rows are not written at all, so their updated_at is kept.
+
+        Args:
+            model: Model class
+            objs: Unsaved model instances
+            unique_fields: Field names of the unique constraint to upsert on
+            update_fields: Fields to compare and overwrite when the row already exists
+            batch_size: Rows per INSERT statement
+
+        Returns:
+            Dictionary with the 'created', 'updated' and 'unchanged' objects
+        """
+        new_objs, changed_objs, unchanged_objs = BulkService.diff(model, objs, unique_fields, update_fields)
+
+        to_write = new_objs + changed_objs
+        if to_write:
+            BulkService._write(model, to_write, unique_fields, update_fields, batch_size)
+
+        logger.debug(
+            f"Synced {model.__name__}: {len(new_objs)} created, {len(changed_objs)} updated, "
+            f"{len(unchanged_objs)} unchanged"
+        )
+        return {'created': new_objs, 'updated': changed_objs, 'unchanged': unchanged_objs}
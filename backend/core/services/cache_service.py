@@ -0,0 +1,135 @@
+"""
+Season Cache Service
+
+This service keeps a data version per season in the database
+(SeasonDataVersion). Cached responses embed the version in their key, so
+bumping the version when a season's data changes invalidates every cached
+response for that season at once, without having to know which keys exist.
+
+The version is bumped in the transaction that writes the data (or right
+after it), so API workers see it as soon as an import commits, whichever
+process ran the import and whichever cache backend holds the cached
+payloads. Season 0 (GLOBAL_SEASON) versions the data that is not tied to a
+season: drivers, constructors, seasons and career statistics.
+"""
+
+import logging
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+from django.core.cache import cache
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.db.models import F
+from django.utils import timezone
+from core.models import SeasonDataVersion
+
+
+logger = logging.getLogger(__name__)
+
+
+class SeasonCacheService:
+    """
+    Service class for versioned, per-season caching of computed data.
+    """
+
+    GLOBAL_SEASON = 0
+
+    @staticmethod
+    def get_version(season: int) -> int:
+        """
+        Get the current data version of a season.
+
+        Args:
+            season: The season year
+
+        Returns:
+            Version number (0 until the season's data first changes)
+        """
+        version = SeasonDataVersion.objects.filter(season=season).values_list('version', flat=True).first()
+        return version or 0
+
+    @staticmethod
+    def get_versions(seasons: Optional[Iterable[int]] = None) -> Dict[int, Tuple[int, datetime]]:
+        """
+        Get the data versions of several seasons with one query.
+
+        Args:
+            seasons: Season years, GLOBAL_SEASON included (None = every season)
+
+        Returns:
+            Dictionary mapping season to (version, updated_at), for the seasons
+            whose data has changed at least once
+        """
+        versions = SeasonDataVersion.objects.all()
+        if seasons is not None:
+            versions = versions.filter(season__in=list(seasons))
+        return {
+            season: (version, updated_at)
+            for season, version, updated_at in versions.values_list('season', 'version', 'updated_at')
+        }
+
+    @staticmethod
+    def bump_version(season: int) -> None:
+        """
+        Invalidate every cached entry of a season.
+
+        Season data also feeds data that is not tied to a season (career
+        statistics), so the GLOBAL_SEASON version is bumped with it.
+
+        Args:
+            season: The season year (GLOBAL_SEASON for data not tied to a season)
+        """
+        seasons = {season, SeasonCacheService.GLOBAL_SEASON}
+        now = timezone.now()
+        updated = SeasonDataVersion.objects.filter(season__in=seasons).update(
+            version=F('version') + 1, updated_at=now
+        )
+        if updated < len(seasons):
+            existing = set(SeasonDataVersion.objects.filter(season__in=seasons).values_list('season', flat=True))
+            for missing in seasons - existing:
+                _, created = SeasonDataVersion.objects.get_or_create(season=missing)
+                if not created:
+                    # Created concurrently by another writer
+                    SeasonDataVersion.objects.filter(season=missing).update(
+                        version=F('version') + 1, updated_at=now
+                    )
+        logger.debug(f"Invalidated cached data for season {season}")
+
+    @staticmethod
+    def make_key(prefix: str, season: int, *parts: Any) -> str:
+        """
+        Build a cache key bound to the current data version of a season.
+
+        Args:
+            prefix: Namespace of the cached data
+            season: The season year
+            parts: Additional key components
+
+        Returns:
+            Cache key string
+        """
+        version = SeasonCacheService.get_version(season)
+        suffix = ':'.join(str(part) for part in parts)
+        return f"{prefix}:{season}:v{version}:{suffix}"
+
+    @staticmethod
+    def get_or_compute(prefix: str, season: int, parts: tuple, compute: Callable[[], Any],
+                       timeout=DEFAULT_TIMEOUT) -> Any:
+        """
+        Return cached data for a season or compute and cache it.
+
+        Args:
+            prefix: Namespace of the cached data
+            season: The season year
+            parts: Additional key components
+            compute: Callable producing the data on a cache miss
+            timeout: Cache timeout in seconds (defaults to the CACHES setting)
+
+        Returns:
+            Cached or freshly computed data
+        """
+        key = SeasonCacheService.make_key(prefix, season, *parts)
+        data = cache.get(key)
+        if data is None:
+            data = compute()
+            cache.set(key, data, timeout=timeout)
+        return data
@@ -0,0 +1,164 @@
+"""
+Driver Career Statistics Service
+
+This service maintains the precomputed DriverCareerStats table so that
+API serializers can read career statistics with a single join instead of
+aggregating Results and ChampionshipStandings for every row.
+"""
+
+import logging
+from typing import Dict, Iterable, Optional, Tuple
+from django.db import transaction
+from django.db.models import Sum, Count, Min, Q
+from core.models import Result, ChampionshipStanding, DriverSeason, DriverCareerStats
+
+
+logger = logging.getLogger(__name__)
+
+
+class CareerStatsService:
+    """
+    Service class for calculating and storing driver career statistics.
+
+    Statistics are recalculated per driver with grouped aggregate queries,
+    so the cost depends on the number of queries (three) and not on the
+    number of drivers or seasons involved.
+    """
+
+    STAT_FIELDS = [
+        'total_wins', 'total_podiums', 'world_championships',
+        'total_seasons', 'best_championship_finish', 'career_points',
+    ]
+
+    @staticmethod
+    def calculate_career_stats(driver_ids: Optional[Iterable[int]] = None) -> Dict[int, Dict]:
+        """
+        Calculate career statistics for drivers.
+
+        Args:
+            driver_ids: Database IDs of the drivers to calculate (None = all drivers)
+
+        Returns:
+            Dictionary mapping driver database ID to its statistics
+        """
+        results = Result.objects.all()
+        standings = ChampionshipStanding.objects.filter(
+            standing_type='driver',
+            round=0,  # Season total
+            driver__isnull=False
+        )
+        driver_seasons = DriverSeason.objects.all()
+
+        if driver_ids is not None:
+            driver_ids = list(driver_ids)
+            results = results.filter(driver_id__in=driver_ids)
+            standings = standings.filter(driver_id__in=driver_ids)
+            driver_seasons = driver_seasons.filter(driver_id__in=driver_ids)
+
+        def empty_stats():
+            return {
+                'total_wins': 0,
+                'total_podiums': 0,
+                'world_championships': 0,
+                'total_seasons': 0,
+                'best_championship_finish': None,
+                'career_points': 0.0,
+            }
+
+        stats = {driver_id: empty_stats() for driver_id in (driver_ids or [])}
+
+        # Race wins, podiums and points
+        for row in results.values('driver').annotate(
+            wins=Count('id', filter=Q(final_position=1)),
+            podiums=Count('id', filter=Q(final_position__in=[1, 2, 3])),
+            points=Sum('points'),
+        ).order_by():
+            entry = stats.setdefault(row['driver'], empty_stats())
+            entry['total_wins'] = row['wins']
+            entry['total_podiums'] = row['podiums']
+            entry['career_points'] = float(row['points'] or 0)
+
+        # World championships and best championship finish
+        for row in standings.values('driver').annotate(
+            titles=Count('id', filter=Q(position=1)),
+            best=Min('position'),
+        ).order_by():
+            entry = stats.setdefault(row['driver'], empty_stats())
+            entry['world_championships'] = row['titles']
+            entry['best_championship_finish'] = row['best']
+
+        # Seasons in F1
+        for row in driver_seasons.values('driver').annotate(
+            seasons=Count('season', distinct=True),
+        ).order_by():
+            entry = stats.setdefault(row['driver'], empty_stats())
+            entry['total_seasons'] = row['seasons']
+
+        return stats
+
+    @staticmethod
+    @transaction.atomic
+    def save_career_stats(driver_ids: Optional[Iterable[int]] = None) -> Tuple[int, int]:
+        """
+        Calculate and save career statistics to the database.
+
+        Args:
+            driver_ids: Database IDs of the drivers to refresh (None = all drivers)
+
+        Returns:
+            Tuple of (created_count, updated_count)
+        """
+        stats = CareerStatsService.calculate_career_stats(driver_ids)
+        if not stats:
+            return 0, 0
+
+        existing = set(
+            DriverCareerStats.objects
+            .filter(driver_id__in=stats.keys())
+            .values_list('driver_id', flat=True)
+        )
+
+        DriverCareerStats.objects.bulk_create(
+            [
+                DriverCareerStats(driver_id=driver_id, **values)
+                for driver_id, values in sorted(stats.items())
+            ],
+            update_conflicts=True,
+            unique_fields=['driver'],
+            update_fields=CareerStatsService.STAT_FIELDS + ['updated_at'],
+        )
+
+        created = len(stats) - len(existing)
+        updated = len(existing)
+
+        logger.info(f"Saved driver career stats: {created} created, {updated} updated")
+        return created, updated
+
+    @staticmethod
+    def update_for_season(season: int) -> Tuple[int, int]:
+        """
+        Refresh career statistics for every driver who took part in a season.
+
+        Called after results or standings for the season have been written.
+
+        Args:
+            season: The season year
+
+        Returns:
+            Tuple of (created_count, updated_count)
+        """
+        driver_ids = set(
+            Result.objects.filter(season=season).values_list('driver_id', flat=True).distinct()
+        )
+        driver_ids.update(
+            ChampionshipStanding.objects
+            .filter(season=season, standing_type='driver', driver__isnull=False)
+            .values_list('driver_id', flat=True)
+            .distinct()
+        )
+        driver_ids.update(
+            DriverSeason.objects.filter(season__year=season).values_list('driver_id', flat=True).distinct()
+        )
+
+        logger.info(f"Updating career stats for {len(driver_ids)} drivers of season {season}")
+        return CareerStatsService.save_career_stats(driver_ids)
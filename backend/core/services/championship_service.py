@@ -6,10 +6,15 @@ and managing championship standings for drivers and constructors.
 """
 
 import logging
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Optional
 from django.db import transaction
-from django.db.models import Sum, Count, Q
-from core.models import Result, ChampionshipStanding, Driver, Constructor, Race
+from django.db.models import Sum, Count, Q, F, Window, OuterRef, Subquery, Exists
+from django.db.models.functions import RowNumber
+from django.utils import timezone
+from core.models import Result, ChampionshipStanding, StandingsSnapshot, Race
+from core.services.bulk_service import BulkService
+from core.services.cache_service import SeasonCacheService
+from core.services.career_stats_service import CareerStatsService
 
 
 logger = logging.getLogger(__name__)
@@ -23,6 +28,13 @@ class ChampionshipService:
     clean architecture principles.
     """
     
+    # Unique constraint each standing type is upserted on
+    UNIQUE_FIELDS = {
+        'driver': ['season', 'standing_type', 'round', 'driver'],
+        'constructor': ['season', 'standing_type', 'round', 'constructor'],
+    }
+    UPDATE_FIELDS = ['team', 'position', 'points', 'wins', 'updated_at']
+    
     @staticmethod
     def calculate_driver_standings(season: int, up_to_round: int = None) -> List[Dict]:
         """
@@ -38,10 +50,18 @@ class ChampionshipService:
         logger.info(f"Calculating driver standings for season {season}, up to round {up_to_round}")
         
         # Build query filters
-        filters = Q(race__season=season)
+        filters = Q(season=season)
         if up_to_round:
             filters &= Q(race__round__lte=up_to_round)
         
+        # Constructor of each driver's latest race in the range
+        latest_team = (
+            Result.objects
+            .filter(filters, driver=OuterRef('driver'))
+            .order_by('-race__round', '-race__date')
+            .values('constructor')[:1]
+        )
+        
         # Aggregate points and wins per driver
         standings = (
             Result.objects
@@ -50,9 +70,10 @@ class ChampionshipService:
             .annotate(
                 total_points=Sum('points'),
                 total_wins=Count('id', filter=Q(final_position=1)),
-                races_count=Count('race', distinct=True)
+                races_count=Count('race', distinct=True),
+                team_id=Subquery(latest_team)
             )
-            .order_by('-total_points', '-total_wins')
+            .order_by('-total_points', '-total_wins', 'driver')
         )
         
         # Add position
@@ -62,6 +83,7 @@ class ChampionshipService:
                 'position': position,
                 'driver_id': standing['driver'],
                 'driver_name': f"{standing['driver__first_name']} {standing['driver__last_name']}",
+                'constructor_id': standing['team_id'],
                 'points': standing['total_points'] or 0.0,
                 'wins': standing['total_wins'],
                 'races': standing['races_count'],
@@ -84,7 +106,7 @@ class ChampionshipService:
         logger.info(f"Calculating constructor standings for season {season}, up to round {up_to_round}")
         
         # Build query filters
-        filters = Q(race__season=season)
+        filters = Q(season=season)
         if up_to_round:
             filters &= Q(race__round__lte=up_to_round)
         
@@ -98,7 +120,7 @@ class ChampionshipService:
                 total_wins=Count('id', filter=Q(final_position=1)),
                 races_count=Count('race', distinct=True)
             )
-            .order_by('-total_points', '-total_wins')
+            .order_by('-total_points', '-total_wins', 'constructor')
         )
         
         # Add position
@@ -115,6 +137,27 @@ class ChampionshipService:
         
         return result
     
+    @staticmethod
+    def _build_standings(season: int, round_num: int, standing_type: str, standings: List[Dict]) -> List[ChampionshipStanding]:
+        """Build unsaved ChampionshipStanding rows from calculated standing dictionaries"""
+        rows = []
+        for standing in standings:
+            row = ChampionshipStanding(
+                season=season,
+                standing_type=standing_type,
+                round=round_num,
+                position=standing['position'],
+                points=standing['points'],
+                wins=standing['wins'],
+            )
+            if standing_type == 'driver':
+                row.driver_id = standing['driver_id']
+                row.team_id = standing['constructor_id']
+            else:
+                row.constructor_id = standing['constructor_id']
+            rows.append(row)
+        return rows
+    
     @staticmethod
     @transaction.atomic
     def save_driver_standings(season: int, up_to_round: int = None) -> Tuple[int, int]:
@@ -131,30 +174,20 @@ class ChampionshipService:
         round_num = up_to_round or 0  # 0 means season total
         standings = ChampionshipService.calculate_driver_standings(season, up_to_round)
         
-        created = 0
-        updated = 0
-        
-        for standing in standings:
-            driver = Driver.objects.get(id=standing['driver_id'])
-            
-            obj, is_created = ChampionshipStanding.objects.update_or_create(
-                season=season,
-                standing_type='driver',
-                round=round_num,
-                driver=driver,
-                defaults={
-                    'position': standing['position'],
-                    'points': standing['points'],
-                    'wins': standing['wins'],
-                }
-            )
-            
-            if is_created:
-                created += 1
-            else:
-                updated += 1
+        created, updated = BulkService.upsert(
+            ChampionshipStanding,
+            ChampionshipService._build_standings(season, round_num, 'driver', standings),
+            unique_fields=ChampionshipService.UNIQUE_FIELDS['driver'],
+            update_fields=ChampionshipService.UPDATE_FIELDS,
+        )
         
+        ChampionshipService.mark_snapshot_fresh(season, 'driver', round_num)
         logger.info(f"Saved driver standings: {created} created, {updated} updated")
+        
+        # Season totals feed championship counts in the career stats table
+        if round_num == 0:
+            CareerStatsService.update_for_season(season)
+        
         return created, updated
     
     @staticmethod
@@ -173,31 +206,204 @@ class ChampionshipService:
         round_num = up_to_round or 0  # 0 means season total
         standings = ChampionshipService.calculate_constructor_standings(season, up_to_round)
         
-        created = 0
-        updated = 0
+        created, updated = BulkService.upsert(
+            ChampionshipStanding,
+            ChampionshipService._build_standings(season, round_num, 'constructor', standings),
+            unique_fields=ChampionshipService.UNIQUE_FIELDS['constructor'],
+            update_fields=ChampionshipService.UPDATE_FIELDS,
+        )
+        
+        ChampionshipService.mark_snapshot_fresh(season, 'constructor', round_num)
+        logger.info(f"Saved constructor standings: {created} created, {updated} updated")
+        return created, updated
+    
+    @staticmethod
+    def _rank(totals: Dict[int, Dict]) -> List[Tuple[int, Dict]]:
+        """Order running totals by points, then wins, then id (same order as the SQL aggregates)"""
+        return sorted(totals.items(), key=lambda item: (-item[1]['points'], -item[1]['wins'], item[0]))
+    
+    @staticmethod
+    def calculate_season_standings(season: int, from_round: int = 1,
+                                   initial: Optional[Dict[str, Dict[int, Dict]]] = None) -> Dict[int, Dict[str, List[Dict]]]:
+        """
+        Calculate driver and constructor standings after every round of a season.
         
-        for standing in standings:
-            constructor = Constructor.objects.get(id=standing['constructor_id'])
+        Streams the season's results once, ordered by round, and keeps running
+        totals in memory. Standings are emitted for every race of the season
+        (rounds without results repeat the previous totals) plus the season
+        total under round 0.
+        
+        Args:
+            season: The season year
+            from_round: First round to calculate (earlier results are not read)
+            initial: Running totals after the round before from_round, as returned
+                by _load_round_totals (None = start of the season)
             
-            obj, is_created = ChampionshipStanding.objects.update_or_create(
-                season=season,
-                standing_type='constructor',
-                round=round_num,
-                constructor=constructor,
-                defaults={
-                    'position': standing['position'],
-                    'points': standing['points'],
-                    'wins': standing['wins'],
-                }
-            )
+        Returns:
+            Dictionary mapping round number to {'driver': [...], 'constructor': [...]},
+            using the same standing dictionaries as calculate_*_standings
+        """
+        rounds = list(
+            Race.objects
+            .filter(season=season, round__gte=from_round)
+            .order_by('round')
+            .values_list('round', flat=True)
+        )
+        results = (
+            Result.objects
+            .filter(season=season, race__round__gte=from_round)
+            .order_by('race__round', 'race__date', 'id')
+            .values_list('race__round', 'driver_id', 'constructor_id', 'points', 'final_position')
+        )
+        
+        initial = initial or {}
+        drivers = {key: dict(totals) for key, totals in initial.get('driver', {}).items()}
+        constructors = {key: dict(totals) for key, totals in initial.get('constructor', {}).items()}
+        
+        def snapshot():
+            return {
+                'driver': [
+                    {
+                        'position': position,
+                        'driver_id': driver_id,
+                        'constructor_id': totals['team'],
+                        'points': totals['points'],
+                        'wins': totals['wins'],
+                    }
+                    for position, (driver_id, totals) in enumerate(ChampionshipService._rank(drivers), start=1)
+                ],
+                'constructor': [
+                    {
+                        'position': position,
+                        'constructor_id': constructor_id,
+                        'points': totals['points'],
+                        'wins': totals['wins'],
+                    }
+                    for position, (constructor_id, totals) in enumerate(ChampionshipService._rank(constructors), start=1)
+                ],
+            }
+        
+        standings = {}
+        pending_rounds = iter(rounds)
+        next_round = next(pending_rounds, None)
+        
+        for round_num, driver_id, constructor_id, points, final_position in results.iterator():
+            # Close every round that finished before this result
+            while next_round is not None and next_round < round_num:
+                standings[next_round] = snapshot()
+                next_round = next(pending_rounds, None)
+            
+            won = 1 if final_position == 1 else 0
             
-            if is_created:
-                created += 1
+            driver = drivers.setdefault(driver_id, {'points': 0.0, 'wins': 0, 'team': None})
+            driver['points'] += points or 0.0
+            driver['wins'] += won
+            driver['team'] = constructor_id
+            
+            constructor = constructors.setdefault(constructor_id, {'points': 0.0, 'wins': 0})
+            constructor['points'] += points or 0.0
+            constructor['wins'] += won
+        
+        while next_round is not None:
+            standings[next_round] = snapshot()
+            next_round = next(pending_rounds, None)
+        
+        # Season totals (round = 0)
+        standings[0] = snapshot()
+        return standings
+    
+    @staticmethod
+    def _load_round_totals(season: int, round_num: int) -> Optional[Dict[str, Dict[int, Dict]]]:
+        """
+        Load stored standings of a round as running totals for the season engine.
+        
+        Args:
+            season: The season year
+            round_num: Round whose stored standings to load
+            
+        Returns:
+            {'driver': {id: totals}, 'constructor': {id: totals}}, or None if the
+            stored standings of the round are missing or stale
+        """
+        fresh = StandingsSnapshot.objects.filter(season=season, round=round_num, is_stale=False).count()
+        if fresh < 2:  # Both driver and constructor snapshots are needed
+            return None
+        
+        totals = {'driver': {}, 'constructor': {}}
+        for standing_type, driver_id, constructor_id, team_id, points, wins in (
+            ChampionshipStanding.objects
+            .filter(season=season, round=round_num)
+            .values_list('standing_type', 'driver_id', 'constructor_id', 'team_id', 'points', 'wins')
+        ):
+            if standing_type == 'driver':
+                totals['driver'][driver_id] = {'points': points, 'wins': wins, 'team': team_id}
             else:
-                updated += 1
+                totals['constructor'][constructor_id] = {'points': points, 'wins': wins}
+        return totals
+    
+    @staticmethod
+    def _save_season_standings(season: int, standings: Dict[int, Dict[str, List[Dict]]]) -> Dict[str, int]:
+        """
+        Write standings of several rounds with one bulk upsert per standing type.
         
-        logger.info(f"Saved constructor standings: {created} created, {updated} updated")
-        return created, updated
+        Args:
+            season: The season year
+            standings: Output of calculate_season_standings (or a subset of rounds)
+            
+        Returns:
+            Dictionary with statistics about created/updated records
+        """
+        now = timezone.now()
+        stats = {}
+        
+        for standing_type in ('driver', 'constructor'):
+            rows = []
+            for round_num, by_type in standings.items():
+                rows.extend(
+                    ChampionshipService._build_standings(season, round_num, standing_type, by_type[standing_type])
+                )
+            
+            created, updated = BulkService.upsert(
+                ChampionshipStanding,
+                rows,
+                unique_fields=ChampionshipService.UNIQUE_FIELDS[standing_type],
+                update_fields=ChampionshipService.UPDATE_FIELDS,
+            )
+            stats[f'{standing_type}_created'] = created
+            stats[f'{standing_type}_updated'] = updated
+        
+        StandingsSnapshot.objects.bulk_create(
+            [
+                StandingsSnapshot(season=season, standing_type=standing_type, round=round_num, computed_at=now)
+                for round_num in standings
+                for standing_type in ('driver', 'constructor')
+            ],
+            update_conflicts=True,
+            unique_fields=['season', 'standing_type', 'round'],
+            update_fields=['is_stale', 'computed_at', 'updated_at'],
+        )
+        
+        return stats
+    
+    @staticmethod
+    @transaction.atomic
+    def save_official_standings(season: int, standings: Dict[int, Dict[str, List[Dict]]]) -> Dict[str, int]:
+        """
+        Store standings taken from an external source (e.g. the Ergast CSV
+        dump) instead of calculating them from results. Official standings
+        follow historical rules, such as dropped scores, that the
+        calculation does not model.
+        
+        Args:
+            season: The season year
+            standings: Standings by round and type, in the format of calculate_season_standings
+        
+        Returns:
+            Dictionary with statistics about created/updated records
+        """
+        stats = ChampionshipService._save_season_standings(season, standings)
+        SeasonCacheService.bump_version(season)
+        return stats
     
     @staticmethod
     @transaction.atomic
@@ -205,6 +411,9 @@ class ChampionshipService:
         """
         Recalculate all standings for a season (all rounds + season total).
         
+        Results are read once and every round is written in bulk, so the
+        number of queries does not grow with the number of rounds.
+        
         Args:
             season: The season year
             
@@ -213,38 +422,323 @@ class ChampionshipService:
         """
         logger.info(f"Recalculating all standings for season {season}")
         
-        # Get all races for the season
-        races = Race.objects.filter(season=season).order_by('round')
+        standings = ChampionshipService.calculate_season_standings(season)
+        stats = ChampionshipService._save_season_standings(season, standings)
+        
+        CareerStatsService.update_for_season(season)
+        SeasonCacheService.bump_version(season)
+        
+        logger.info(f"Standings recalculation complete: {stats}")
+        return stats
+    
+    @staticmethod
+    @transaction.atomic
+    def update_standings_for_round(season: int, round_num: int) -> Dict[str, int]:
+        """
+        Incrementally update standings after the results of a round changed.
         
-        stats = {
-            'driver_created': 0,
-            'driver_updated': 0,
-            'constructor_created': 0,
-            'constructor_updated': 0,
-        }
+        Starts from the stored standings of the previous round and only reads
+        results from round_num onwards, then refreshes the season total
+        (round 0) in place. Falls back to a full recalculation when the
+        previous round has no fresh stored standings.
         
-        # Calculate standings after each round
-        for race in races:
-            dc, du = ChampionshipService.save_driver_standings(season, race.round)
-            cc, cu = ChampionshipService.save_constructor_standings(season, race.round)
+        Args:
+            season: The season year
+            round_num: First round whose results changed
             
-            stats['driver_created'] += dc
-            stats['driver_updated'] += du
-            stats['constructor_created'] += cc
-            stats['constructor_updated'] += cu
+        Returns:
+            Dictionary with statistics about created/updated records
+        """
+        previous_round = (
+            Race.objects
+            .filter(season=season, round__lt=round_num)
+            .order_by('-round')
+            .values_list('round', flat=True)
+            .first()
+        )
         
-        # Calculate season totals (round = 0)
-        dc, du = ChampionshipService.save_driver_standings(season)
-        cc, cu = ChampionshipService.save_constructor_standings(season)
+        initial = None
+        if previous_round is not None:
+            initial = ChampionshipService._load_round_totals(season, previous_round)
+            if initial is None:
+                logger.info(f"No fresh standings for season {season} round {previous_round}, recalculating season")
+                return ChampionshipService.recalculate_all_standings(season)
         
-        stats['driver_created'] += dc
-        stats['driver_updated'] += du
-        stats['constructor_created'] += cc
-        stats['constructor_updated'] += cu
+        logger.info(f"Updating standings for season {season} from round {round_num}")
         
-        logger.info(f"Standings recalculation complete: {stats}")
+        standings = ChampionshipService.calculate_season_standings(season, from_round=round_num, initial=initial)
+        stats = ChampionshipService._save_season_standings(season, standings)
+        
+        CareerStatsService.update_for_season(season)
+        SeasonCacheService.bump_version(season)
+        
+        logger.info(f"Incremental standings update complete: {stats}")
         return stats
     
+    @staticmethod
+    def update_stale_standings(season: int) -> Dict[str, int]:
+        """
+        Bring stored standings of a season up to date, starting from the first
+        round that is stale or has never been calculated.
+        
+        Args:
+            season: The season year
+            
+        Returns:
+            Dictionary with statistics about created/updated records
+        """
+        fresh_rounds = set(
+            StandingsSnapshot.objects
+            .filter(season=season, is_stale=False)
+            .values('round')
+            .annotate(types=Count('id'))
+            .filter(types=2)
+            .values_list('round', flat=True)
+        )
+        race_rounds = Race.objects.filter(season=season).order_by('round').values_list('round', flat=True)
+        
+        first_stale = next((r for r in race_rounds if r not in fresh_rounds), None)
+        if first_stale is None:
+            if 0 in fresh_rounds:
+                logger.info(f"Standings for season {season} are up to date")
+                return {
+                    'driver_created': 0,
+                    'driver_updated': 0,
+                    'constructor_created': 0,
+                    'constructor_updated': 0,
+                }
+            return ChampionshipService.recalculate_all_standings(season)
+        
+        return ChampionshipService.update_standings_for_round(season, first_stale)
+    
+    @staticmethod
+    def calculate_progressive_driver_standings(season: int, up_to_round: int) -> List[Dict]:
+        """
+        Calculate driver standings up to a round with one SQL statement.
+        
+        Window functions compute each driver's running totals and pick the
+        constructor of their latest race, so no per-driver queries are needed.
+        
+        Args:
+            season: The season year
+            up_to_round: Calculate up to and including this round
+            
+        Returns:
+            List of standing dictionaries in the progressive API format
+        """
+        by_driver = [F('driver_id')]
+        rows = (
+            Result.objects
+            .filter(season=season, race__round__lte=up_to_round)
+            .annotate(
+                total_points=Window(Sum('points'), partition_by=by_driver),
+                total_wins=Window(Count('id', filter=Q(final_position=1)), partition_by=by_driver),
+                latest=Window(
+                    RowNumber(),
+                    partition_by=by_driver,
+                    order_by=[F('race__round').desc(), F('race__date').desc()]
+                ),
+            )
+            .filter(latest=1)
+            .values(
+                'driver_id', 'driver__first_name', 'driver__last_name', 'driver__code', 'driver__number',
+                'constructor_id', 'constructor__name', 'constructor__team_color',
+                'total_points', 'total_wins',
+            )
+            .order_by('-total_points', '-total_wins', 'driver_id')
+        )
+        
+        return [
+            {
+                'position': position,
+                'driver': {
+                    'id': row['driver_id'],
+                    'first_name': row['driver__first_name'],
+                    'last_name': row['driver__last_name'],
+                    'code': row['driver__code'],
+                    'number': row['driver__number'],
+                },
+                'constructor': {
+                    'id': row['constructor_id'],
+                    'name': row['constructor__name'],
+                    'team_color': row['constructor__team_color'],
+                },
+                'points': round(row['total_points'], 1),
+                'wins': row['total_wins'],
+            }
+            for position, row in enumerate(rows, start=1)
+        ]
+    
+    @staticmethod
+    def calculate_progressive_constructor_standings(season: int, up_to_round: int) -> List[Dict]:
+        """
+        Calculate constructor standings up to a round with one SQL statement.
+        
+        Args:
+            season: The season year
+            up_to_round: Calculate up to and including this round
+            
+        Returns:
+            List of standing dictionaries in the progressive API format
+        """
+        rows = (
+            Result.objects
+            .filter(season=season, race__round__lte=up_to_round)
+            .values('constructor', 'constructor__name')
+            .annotate(
+                total_points=Sum('points'),
+                total_wins=Count('race', filter=Q(final_position=1), distinct=True)
+            )
+            .order_by('-total_points', '-total_wins', 'constructor')
+        )
+        
+        return [
+            {
+                'position': position,
+                'constructor': {
+                    'id': row['constructor'],
+                    'name': row['constructor__name'],
+                },
+                'points': round(row['total_points'], 1),
+                'wins': row['total_wins'],
+            }
+            for position, row in enumerate(rows, start=1)
+        ]
+    
+    @staticmethod
+    def get_stored_progressive_standings(season: int, up_to_round: int, standing_type: str = 'driver') -> Optional[List[Dict]]:
+        """
+        Read progressive standings from the stored per-round snapshot.
+        
+        Args:
+            season: The season year
+            up_to_round: Round of the snapshot
+            standing_type: 'driver' or 'constructor'
+            
+        Returns:
+            List of standing dictionaries in the progressive API format,
+            or None if the snapshot is missing or stale
+        """
+        fresh_snapshot = StandingsSnapshot.objects.filter(
+            season=OuterRef('season'),
+            standing_type=OuterRef('standing_type'),
+            round=OuterRef('round'),
+            is_stale=False
+        )
+        rows = list(
+            ChampionshipStanding.objects
+            .filter(Exists(fresh_snapshot), season=season, standing_type=standing_type, round=up_to_round)
+            .select_related('driver', 'team', 'constructor')
+            .order_by('position')
+        )
+        if not rows:
+            return None
+        
+        if standing_type == 'driver':
+            return [
+                {
+                    'position': row.position,
+                    'driver': {
+                        'id': row.driver.id,
+                        'first_name': row.driver.first_name,
+                        'last_name': row.driver.last_name,
+                        'code': row.driver.code,
+                        'number': row.driver.number,
+                    },
+                    'constructor': {
+                        'id': row.team.id,
+                        'name': row.team.name,
+                        'team_color': row.team.team_color,
+                    } if row.team else None,
+                    'points': round(row.points, 1),
+                    'wins': row.wins,
+                }
+                for row in rows
+            ]
+        
+        return [
+            {
+                'position': row.position,
+                'constructor': {
+                    'id': row.constructor.id,
+                    'name': row.constructor.name,
+                },
+                'points': round(row.points, 1),
+                'wins': row.wins,
+            }
+            for row in rows
+        ]
+    
+    @staticmethod
+    def get_progressive_standings(season: int, up_to_round: int, standing_type: str = 'driver') -> List[Dict]:
+        """
+        Get progressive standings, cached per (season, round, type).
+        
+        Served from the stored per-round snapshot when it is fresh, with live
+        aggregation as fallback. Cached entries are invalidated when results
+        of the season change.
+        
+        Args:
+            season: The season year
+            up_to_round: Calculate up to and including this round
+            standing_type: 'driver' or 'constructor'
+            
+        Returns:
+            List of standing dictionaries in the progressive API format
+        """
+        if standing_type != 'driver':
+            standing_type = 'constructor'
+        
+        def compute():
+            standings = ChampionshipService.get_stored_progressive_standings(season, up_to_round, standing_type)
+            if standings is not None:
+                return standings
+            
+            logger.info(f"No fresh standings snapshot for season {season} round {up_to_round}, aggregating live")
+            if standing_type == 'driver':
+                return ChampionshipService.calculate_progressive_driver_standings(season, up_to_round)
+            return ChampionshipService.calculate_progressive_constructor_standings(season, up_to_round)
+        
+        return SeasonCacheService.get_or_compute(
+            'progressive-standings', season, (up_to_round, standing_type), compute
+        )
+    
+    @staticmethod
+    def mark_snapshot_fresh(season: int, standing_type: str, round_num: int) -> None:
+        """
+        Record that the stored standings of a round were just computed.
+        
+        Args:
+            season: The season year
+            standing_type: 'driver' or 'constructor'
+            round_num: Round number (0 = season total)
+        """
+        StandingsSnapshot.objects.update_or_create(
+            season=season,
+            standing_type=standing_type,
+            round=round_num,
+            defaults={'is_stale': False, 'computed_at': timezone.now()}
+        )
+    
+    @staticmethod
+    def invalidate_season(season: int, from_round: int = 1) -> None:
+        """
+        Flag stored standings as stale after results of a season changed.
+        
+        Snapshots from the changed round onwards and the season total are
+        marked stale, and cached standings of the season are dropped.
+        
+        Args:
+            season: The season year
+            from_round: First round whose results changed
+        """
+        StandingsSnapshot.objects.filter(
+            Q(round__gte=from_round) | Q(round=0),
+            season=season,
+            is_stale=False
+        ).update(is_stale=True, updated_at=timezone.now())
+        SeasonCacheService.bump_version(season)
+    
     @staticmethod
     def get_driver_position_history(driver_id: int, season: int) -> List[Dict]:
         """
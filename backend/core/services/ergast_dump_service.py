@@ -0,0 +1,549 @@
+"""
+Ergast CSV Dump Loader
+
+Loads the public Ergast-format CSV database dump (as published by Ergast
+and Jolpica) into the core models without any API request.
+
+The dump uses numeric surrogate keys (raceId, driverId...) and '\\N' for
+NULL. Files are streamed row by row with csv.DictReader, straight out of
+the zip archive if needed, and written with batched upserts (lap times go
+through LapImportService, i.e. COPY on PostgreSQL), so memory stays
+bounded even for the millions of rows in lap_times.csv.
+"""
+
+import csv
+import io
+import logging
+import zipfile
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import datetime
+from itertools import islice
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+from django.db import transaction
+from core.models import (
+    Constructor, Driver, DriverSeason, Qualifying, Race, Result, Season, Sprint,
+)
+from core.services.bulk_service import BulkService
+from core.services.cache_service import SeasonCacheService
+from core.services.career_stats_service import CareerStatsService
+from core.services.championship_service import ChampionshipService
+from core.services.lap_import_service import LapImportService
+from core.utils import merge_shared_drives, parse_lap_time, parse_result_status
+
+
+logger = logging.getLogger(__name__)
+
+NULL = '\\N'
+
+
+class ErgastDumpError(Exception):
+    """Raised when the dump is missing or malformed"""
+    pass
+
+
+class ErgastDumpLoader:
+    """
+    Streams an Ergast CSV dump (zip file or extracted directory) into the database.
+    """
+
+    BATCH_SIZE = 5000
+
+    DRIVER_FIELDS = [
+        'number', 'code', 'first_name', 'last_name', 'date_of_birth', 'nationality', 'url', 'updated_at',
+    ]
+    CONSTRUCTOR_FIELDS = ['name', 'nationality', 'url', 'updated_at']
+    RACE_FIELDS = [
+        'season', 'round', 'race_name', 'circuit_id', 'circuit_name', 'locality', 'country',
+        'date', 'time', 'url', 'updated_at',
+    ]
+    RESULT_FIELDS = [
+        'constructor', 'grid_position', 'final_position', 'position_text', 'points', 'laps_completed',
+        'status', 'retirement_reason', 'fastest_lap', 'fastest_lap_time', 'fastest_lap_time_milliseconds',
+        'fastest_lap_speed', 'updated_at',
+    ]
+    SPRINT_FIELDS = [
+        'constructor', 'grid_position', 'final_position', 'position_text', 'points', 'laps_completed',
+        'status', 'retirement_reason', 'fastest_lap_time', 'fastest_lap_time_milliseconds', 'updated_at',
+    ]
+    QUALIFYING_FIELDS = [
+        'constructor', 'position', 'q1_time', 'q2_time', 'q3_time',
+        'q1_milliseconds', 'q2_milliseconds', 'q3_milliseconds', 'updated_at',
+    ]
+
+    def __init__(self, path, from_season: Optional[int] = None, to_season: Optional[int] = None,
+                 batch_size: int = BATCH_SIZE, log: Optional[Callable[[str], None]] = None):
+        """
+        Args:
+            path: Path to the dump zip file or to the directory with the CSV files
+            from_season: First season to load (None = from the start)
+            to_season: Last season to load (None = up to the latest)
+            batch_size: Rows written per batch
+            log: Callable receiving progress messages (defaults to the logger)
+        """
+        self.path = Path(path)
+        if not self.path.exists():
+            raise ErgastDumpError(f"Dump not found: {self.path}")
+
+        self.from_season = from_season
+        self.to_season = to_season
+        self.batch_size = batch_size
+        self.log = log or logger.info
+
+        self._zip = zipfile.ZipFile(self.path) if zipfile.is_zipfile(self.path) else None
+
+        # Dump surrogate keys -> database IDs
+        self.race_map: Dict[str, Tuple[int, int, int]] = {}  # raceId -> (race pk, season, round)
+        self.driver_map: Dict[str, int] = {}
+        self.constructor_map: Dict[str, int] = {}
+        self.status_map: Dict[str, str] = {}
+
+        # Team of every driver in every race, for driver standings
+        self.race_teams: Dict[Tuple[str, str], int] = {}
+        # (season, driver pk) -> (round, constructor pk) of the driver's latest race
+        self.latest_teams: Dict[Tuple[int, int], Tuple[int, int]] = {}
+
+    def close(self):
+        if self._zip:
+            self._zip.close()
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def _find_member(self, filename: str) -> Optional[str]:
+        """Find a CSV in the zip regardless of the folder it was packed in"""
+        for name in self._zip.namelist():
+            if name.rsplit('/', 1)[-1] == filename:
+                return name
+        return None
+
+    @contextmanager
+    def _open(self, filename: str):
+        if self._zip:
+            member = self._find_member(filename)
+            if member is None:
+                yield None
+                return
+            with self._zip.open(member) as raw:
+                yield io.TextIOWrapper(raw, encoding='utf-8-sig', newline='')
+        else:
+            csv_path = self.path / filename
+            if not csv_path.exists():
+                yield None
+                return
+            with open(csv_path, encoding='utf-8-sig', newline='') as f:
+                yield f
+
+    def has_file(self, filename: str) -> bool:
+        with self._open(filename) as f:
+            return f is not None
+
+    def rows(self, filename: str) -> Iterator[Dict[str, Optional[str]]]:
+        """
+        Stream the rows of a CSV file with '\\N' converted to None.
+
+        Args:
+            filename: CSV file name (e.g. 'results.csv')
+
+        Yields:
+            Row dictionaries keyed by column name
+        """
+        with self._open(filename) as f:
+            if f is None:
+                self.log(f"  - {filename} not found in dump, skipped")
+                return
+            for row in csv.DictReader(f):
+                yield {key: (None if value in (NULL, '') else value) for key, value in row.items()}
+
+    def _batches(self, iterable) -> Iterator[list]:
+        iterator = iter(iterable)
+        while True:
+            batch = list(islice(iterator, self.batch_size))
+            if not batch:
+                return
+            yield batch
+
+    def _in_range(self, season: int) -> bool:
+        if self.from_season and season < self.from_season:
+            return False
+        if self.to_season and season > self.to_season:
+            return False
+        return True
+
+    @staticmethod
+    def _int(value: Optional[str]) -> Optional[int]:
+        return int(value) if value is not None else None
+
+    @staticmethod
+    def _float(value: Optional[str]) -> Optional[float]:
+        return float(value) if value is not None else None
+
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
+
+    def load(self, laps: bool = True) -> Dict[str, Dict[str, int]]:
+        """
+        Load the whole dump.
+
+        Reference tables are loaded first and every later file is resolved
+        through in-memory maps of dump keys to database IDs. Each file is
+        committed in its own transaction.
+
+        Args:
+            laps: Also load lap_times.csv (by far the largest file)
+
+        Returns:
+            Dictionary mapping each loaded table to its created/updated/unchanged counts
+        """
+        for required in ('races.csv', 'drivers.csv', 'constructors.csv'):
+            if not self.has_file(required):
+                raise ErgastDumpError(f"{required} not found in {self.path}")
+
+        stats = {}
+        stats['drivers'] = self.load_drivers()
+        stats['constructors'] = self.load_constructors()
+        stats['races'] = self.load_races()
+        self.status_map = {row['statusId']: row['status'] for row in self.rows('status.csv')}
+
+        stats['results'] = self.load_results()
+        stats['sprint_results'] = self.load_sprint_results()
+        stats['qualifying'] = self.load_qualifying()
+        if laps:
+            stats['lap_times'] = self.load_lap_times()
+        stats['driver_seasons'] = self.load_driver_seasons()
+        stats['standings'] = self.load_standings()
+
+        seasons = sorted({season for _, season, _ in self.race_map.values()})
+        created, updated = CareerStatsService.save_career_stats()
+        stats['career_stats'] = {'created': created, 'updated': updated, 'unchanged': 0}
+        for season in seasons:
+            SeasonCacheService.bump_version(season)
+
+        return stats
+
+    def _sync(self, model, objs, unique_fields, update_fields) -> Dict[str, int]:
+        """Upsert objects in batches and add up the counts"""
+        counts = {'created': 0, 'updated': 0, 'unchanged': 0}
+        for batch in self._batches(objs):
+            result = BulkService.sync(model, batch, unique_fields, update_fields, batch_size=self.batch_size)
+            for key in counts:
+                counts[key] += len(result[key])
+        return counts
+
+    @transaction.atomic
+    def load_drivers(self) -> Dict[str, int]:
+        self.log('Loading drivers.csv...')
+        refs = {}
+        drivers = []
+        for row in self.rows('drivers.csv'):
+            refs[row['driverId']] = row['driverRef']
+            drivers.append(Driver(
+                driver_id=row['driverRef'],
+                number=self._int(row['number']),
+                code=row['code'] or '',
+                first_name=row['forename'],
+                last_name=row['surname'],
+                date_of_birth=row['dob'],
+                nationality=row['nationality'] or '',
+                url=row['url'] or '',
+            ))
+
+        counts = self._sync(Driver, drivers, ['driver_id'], self.DRIVER_FIELDS)
+        ids = dict(Driver.objects.filter(driver_id__in=refs.values()).values_list('driver_id', 'id'))
+        self.driver_map = {dump_id: ids[ref] for dump_id, ref in refs.items()}
+        return counts
+
+    @transaction.atomic
+    def load_constructors(self) -> Dict[str, int]:
+        self.log('Loading constructors.csv...')
+        refs = {}
+        constructors = []
+        for row in self.rows('constructors.csv'):
+            refs[row['constructorId']] = row['constructorRef']
+            constructors.append(Constructor(
+                constructor_id=row['constructorRef'],
+                name=row['name'],
+                nationality=row['nationality'] or '',
+                url=row['url'] or '',
+            ))
+
+        counts = self._sync(Constructor, constructors, ['constructor_id'], self.CONSTRUCTOR_FIELDS)
+        ids = dict(
+            Constructor.objects.filter(constructor_id__in=refs.values()).values_list('constructor_id', 'id')
+        )
+        self.constructor_map = {dump_id: ids[ref] for dump_id, ref in refs.items()}
+        return counts
+
+    @transaction.atomic
+    def load_races(self) -> Dict[str, int]:
+        self.log('Loading circuits.csv and races.csv...')
+        circuits = {row['circuitId']: row for row in self.rows('circuits.csv')}
+
+        dump_ids = {}
+        races = []
+        for row in self.rows('races.csv'):
+            season = int(row['year'])
+            if not self._in_range(season):
+                continue
+
+            circuit = circuits.get(row['circuitId'], {})
+            race_time = None
+            if row['time']:
+                race_time = datetime.strptime(row['time'], '%H:%M:%S').time()
+
+            race = Race(
+                race_id=f"{season}_{row['round']}",
+                season=season,
+                round=int(row['round']),
+                race_name=row['name'],
+                circuit_id=circuit.get('circuitRef') or row['circuitId'],
+                circuit_name=circuit.get('name') or '',
+                locality=circuit.get('location') or '',
+                country=circuit.get('country') or '',
+                date=row['date'],
+                time=race_time,
+                url=row['url'] or '',
+            )
+            dump_ids[row['raceId']] = race.race_id
+            races.append(race)
+
+        counts = self._sync(Race, races, ['race_id'], self.RACE_FIELDS)
+
+        Season.objects.bulk_create(
+            [Season(year=year) for year in sorted({race.season for race in races})],
+            ignore_conflicts=True,
+        )
+
+        stored = {
+            race_id: (pk, season, round_num)
+            for pk, race_id, season, round_num in
+            Race.objects.filter(race_id__in=dump_ids.values()).values_list('id', 'race_id', 'season', 'round')
+        }
+        self.race_map = {dump_id: stored[race_id] for dump_id, race_id in dump_ids.items()}
+        return counts
+
+    def _iter_race_rows(self, filename: str) -> Iterator[Tuple[Dict, int, int, int, int]]:
+        """
+        Stream rows of a per-race file within the loaded seasons.
+
+        Yields:
+            Tuples of (row, race pk, season, driver pk, constructor pk)
+        """
+        for row in self.rows(filename):
+            race = self.race_map.get(row['raceId'])
+            if race is None:
+                continue
+            driver_id = self.driver_map.get(row['driverId'])
+            constructor_id = self.constructor_map.get(row['constructorId'])
+            if driver_id is None or constructor_id is None:
+                logger.warning(f"Skipping {filename} row with unknown driver/constructor: {row}")
+                continue
+            yield row, race[0], race[1], driver_id, constructor_id
+
+    def _status(self, row: Dict) -> Tuple[str, Optional[str]]:
+        """Get the (status, retirement_reason) of a results row"""
+        status_text = self.status_map.get(row['statusId'], '')
+        status = parse_result_status(status_text)
+        return status, (status_text if status == 'retired' else None)
+
+    @transaction.atomic
+    def load_results(self) -> Dict[str, int]:
+        self.log('Loading results.csv...')
+
+        def build():
+            for row, race_id, season, driver_id, constructor_id in self._iter_race_rows('results.csv'):
+                round_num = self.race_map[row['raceId']][2]
+                self.race_teams[(row['raceId'], row['driverId'])] = constructor_id
+                latest = self.latest_teams.get((season, driver_id))
+                if latest is None or round_num >= latest[0]:
+                    self.latest_teams[(season, driver_id)] = (round_num, constructor_id)
+
+                status, retirement_reason = self._status(row)
+                yield Result(
+                    race_id=race_id,
+                    season=season,
+                    driver_id=driver_id,
+                    constructor_id=constructor_id,
+                    grid_position=int(row['grid']),
+                    final_position=self._int(row['position']),
+                    position_text=row['positionText'],
+                    points=float(row['points']),
+                    laps_completed=int(row['laps']),
+                    status=status,
+                    retirement_reason=retirement_reason,
+                    fastest_lap=self._int(row['fastestLap']),
+                    fastest_lap_time=row['fastestLapTime'],
+                    fastest_lap_time_milliseconds=parse_lap_time(row['fastestLapTime']),
+                    fastest_lap_speed=self._float(row['fastestLapSpeed']),
+                )
+
+        # Shared drives list a driver once per car; the table holds one row per race and driver
+        return self._sync(Result, merge_shared_drives(build()), ['race', 'driver'], self.RESULT_FIELDS)
+
+    @transaction.atomic
+    def load_sprint_results(self) -> Dict[str, int]:
+        self.log('Loading sprint_results.csv...')
+
+        def build():
+            for row, race_id, season, driver_id, constructor_id in self._iter_race_rows('sprint_results.csv'):
+                status, retirement_reason = self._status(row)
+                yield Sprint(
+                    race_id=race_id,
+                    season=season,
+                    driver_id=driver_id,
+                    constructor_id=constructor_id,
+                    grid_position=int(row['grid']),
+                    final_position=self._int(row['position']),
+                    position_text=row['positionText'],
+                    points=float(row['points']),
+                    laps_completed=int(row['laps']),
+                    status=status,
+                    retirement_reason=retirement_reason,
+                    fastest_lap_time=row.get('fastestLapTime'),
+                    fastest_lap_time_milliseconds=parse_lap_time(row.get('fastestLapTime')),
+                )
+
+        return self._sync(Sprint, build(), ['race', 'driver'], self.SPRINT_FIELDS)
+
+    @transaction.atomic
+    def load_qualifying(self) -> Dict[str, int]:
+        self.log('Loading qualifying.csv...')
+
+        def build():
+            for row, race_id, season, driver_id, constructor_id in self._iter_race_rows('qualifying.csv'):
+                yield Qualifying(
+                    race_id=race_id,
+                    season=season,
+                    driver_id=driver_id,
+                    constructor_id=constructor_id,
+                    position=int(row['position']),
+                    q1_time=row['q1'],
+                    q2_time=row['q2'],
+                    q3_time=row['q3'],
+                    q1_milliseconds=parse_lap_time(row['q1']),
+                    q2_milliseconds=parse_lap_time(row['q2']),
+                    q3_milliseconds=parse_lap_time(row['q3']),
+                )
+
+        return self._sync(Qualifying, build(), ['race', 'driver'], self.QUALIFYING_FIELDS)
+
+    def load_lap_times(self) -> Dict[str, int]:
+        self.log('Loading lap_times.csv...')
+
+        def build():
+            for row in self.rows('lap_times.csv'):
+                race = self.race_map.get(row['raceId'])
+                driver_id = self.driver_map.get(row['driverId'])
+                if race is None or driver_id is None:
+                    continue
+                milliseconds = self._int(row.get('milliseconds'))
+                yield (
+                    race[0],
+                    driver_id,
+                    int(row['lap']),
+                    int(row['position']),
+                    row['time'],
+                    milliseconds if milliseconds is not None else parse_lap_time(row['time']),
+                    race[1],
+                )
+
+        return LapImportService.load_laps(build(), batch_size=self.batch_size)
+
+    @transaction.atomic
+    def load_driver_seasons(self) -> Dict[str, int]:
+        """Link each driver to the team of their latest race of every season"""
+        self.log('Updating driver seasons...')
+        season_ids = dict(
+            Season.objects
+            .filter(year__in={season for season, _ in self.latest_teams})
+            .values_list('year', 'id')
+        )
+        wanted = {
+            (driver_id, season_ids[season], constructor_id)
+            for (season, driver_id), (_, constructor_id) in self.latest_teams.items()
+        }
+
+        # One team per driver and season: drop entries for other teams
+        stale = [
+            pk for pk, driver_id, season_id, constructor_id in
+            DriverSeason.objects
+            .filter(season_id__in=season_ids.values())
+            .values_list('id', 'driver_id', 'season_id', 'constructor_id')
+            if (driver_id, season_id, constructor_id) not in wanted
+        ]
+        DriverSeason.objects.filter(id__in=stale).delete()
+
+        counts = self._sync(
+            DriverSeason,
+            [
+                DriverSeason(driver_id=driver_id, season_id=season_id, constructor_id=constructor_id)
+                for driver_id, season_id, constructor_id in sorted(wanted)
+            ],
+            ['driver', 'season', 'constructor'],
+            ['updated_at'],
+        )
+        return counts
+
+    def load_standings(self) -> Dict[str, int]:
+        """
+        Load the official driver and constructor standings after every round.
+
+        The standings of the last round of a season are also stored as its
+        season total (round 0). Seasons without standings in the dump are
+        marked stale, so they are recalculated from results.
+        """
+        self.log('Loading driver_standings.csv and constructor_standings.csv...')
+
+        # season -> round -> type -> standings
+        standings = defaultdict(lambda: defaultdict(lambda: {'driver': [], 'constructor': []}))
+
+        for row in self.rows('driver_standings.csv'):
+            race = self.race_map.get(row['raceId'])
+            driver_id = self.driver_map.get(row['driverId'])
+            if race is None or driver_id is None or row['position'] is None:
+                continue
+            standings[race[1]][race[2]]['driver'].append({
+                'position': int(row['position']),
+                'driver_id': driver_id,
+                'constructor_id': self.race_teams.get((row['raceId'], row['driverId'])),
+                'points': float(row['points']),
+                'wins': int(row['wins']),
+            })
+
+        for row in self.rows('constructor_standings.csv'):
+            race = self.race_map.get(row['raceId'])
+            constructor_id = self.constructor_map.get(row['constructorId'])
+            if race is None or constructor_id is None or row['position'] is None:
+                continue
+            standings[race[1]][race[2]]['constructor'].append({
+                'position': int(row['position']),
+                'constructor_id': constructor_id,
+                'points': float(row['points']),
+                'wins': int(row['wins']),
+            })
+
+        counts = {'created': 0, 'updated': 0, 'unchanged': 0}
+        loaded_seasons = {season for _, season, _ in self.race_map.values()}
+        for season in sorted(loaded_seasons):
+            by_round = standings.get(season)
+            if not by_round:
+                ChampionshipService.invalidate_season(season)
+                continue
+
+            by_round = dict(by_round)
+            last = by_round[max(by_round)]
+            by_round[0] = {standing_type: [dict(standing) for standing in rows] for standing_type, rows in last.items()}
+            # A driver's team in the season total is their latest one
+            for standing in by_round[0]['driver']:
+                latest = self.latest_teams.get((season, standing['driver_id']))
+                if latest:
+                    standing['constructor_id'] = latest[1]
+
+            stats = ChampionshipService.save_official_standings(season, by_round)
+            counts['created'] += stats['driver_created'] + stats['constructor_created']
+            counts['updated'] += stats['driver_updated'] + stats['constructor_updated']
+
+        return counts
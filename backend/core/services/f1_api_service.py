@@ -5,13 +5,37 @@ This service handles fetching data from the Ergast Developer API.
 API Documentation: http://ergast.com/mrd/
 
 Rate Limiting: 4 requests per second, 200 per hour
+(enforced with token buckets shared by all threads; the hourly budget is
+shared with other processes through the database, see rate_limiter.py)
+
+Every fetcher follows MRData.total and requests the remaining pages in
+parallel, so results are never silently truncated to the default page size.
+
+Responses are cached on disk (see response_cache.py), so re-importing a
+season only downloads what has expired. In offline mode every request is
+served from the cache and the network is never used.
 """
 
-import requests
+import logging
+import random
+import threading
 import time
-from typing import Dict, List, Optional
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
 from django.conf import settings
-from core.models import Driver, Constructor, Race, Result
+from django.db import connections
+from django.utils import timezone
+from requests.adapters import HTTPAdapter
+from core.services.rate_limiter import RateLimiter
+from core.services.response_cache import ResponseCache
+
+
+logger = logging.getLogger(__name__)
+
+# An endpoint path, or an (endpoint, params) pair
+EndpointRequest = Union[str, Tuple[str, Optional[Dict]]]
 
 
 class F1APIError(Exception):
@@ -19,30 +43,210 @@ class F1APIError(Exception):
     pass
 
 
+class F1APIRateLimitError(F1APIError):
+    """The API kept rejecting requests, or asked to wait longer than F1_API_MAX_RETRY_AFTER"""
+    
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class RequestStats:
+    """
+    Thread-safe counters of API requests, retries and latency.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.retries = 0
+        self.failures = 0
+        self.cache_hits = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+        self.rate_limit_wait = 0.0
+    
+    def record_request(self, latency: float):
+        with self._lock:
+            self.requests += 1
+            self.total_latency += latency
+            self.max_latency = max(self.max_latency, latency)
+    
+    def record_retry(self):
+        with self._lock:
+            self.retries += 1
+    
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+    
+    def record_cache_hit(self):
+        with self._lock:
+            self.cache_hits += 1
+    
+    def record_wait(self, seconds: float):
+        with self._lock:
+            self.rate_limit_wait += seconds
+    
+    def as_dict(self) -> Dict:
+        """
+        Get a snapshot of the counters.
+        
+        Returns:
+            Dictionary of request counts and latencies in seconds
+        """
+        with self._lock:
+            return {
+                'requests': self.requests,
+                'retries': self.retries,
+                'failures': self.failures,
+                'cache_hits': self.cache_hits,
+                'total_latency': round(self.total_latency, 3),
+                'avg_latency': round(self.total_latency / self.requests, 3) if self.requests else 0.0,
+                'max_latency': round(self.max_latency, 3),
+                'rate_limit_wait': round(self.rate_limit_wait, 3),
+            }
+
+
 class F1DataService:
     """
     Service class for fetching Formula 1 data from Ergast API.
+    
+    Requests go through a pooled keep-alive session and are retried with
+    exponential backoff and jitter on connection errors, 429 and 5xx.
+    Successful responses are stored in the on-disk response cache.
     """
     
-    def __init__(self):
+    RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+    MAX_BACKOFF = 60  # seconds
+    
+    def __init__(self, rate_limiter: Optional[RateLimiter] = None, max_workers: Optional[int] = None,
+                 offline: bool = False, refresh_cache: bool = False):
+        """
+        Args:
+            rate_limiter: Limiter to draw request slots from (defaults to the shared one)
+            max_workers: Maximum concurrent requests in fetch_many
+            offline: Serve every request from the response cache, expired or not,
+                and fail instead of using the network on a miss
+            refresh_cache: Ignore cached responses (they are still rewritten)
+        """
         self.base_url = settings.F1_API_BASE_URL
         self.rate_limit = settings.F1_API_RATE_LIMIT
-        self.last_request_time = 0
+        self.hourly_limit = settings.F1_API_HOURLY_LIMIT
+        self.max_workers = max_workers or settings.F1_API_MAX_WORKERS
+        self.page_size = settings.F1_API_PAGE_SIZE
+        self.timeout = settings.F1_API_TIMEOUT
+        self.max_retries = settings.F1_API_MAX_RETRIES
+        self.backoff_factor = settings.F1_API_BACKOFF_FACTOR
+        self.max_retry_after = settings.F1_API_MAX_RETRY_AFTER
+        
+        # Shared by default so every service instance and thread draws from one budget
+        self.rate_limiter = rate_limiter or RateLimiter.shared(self.rate_limit, self.hourly_limit)
+        self.stats = RequestStats()
+        self.offline = offline
+        self.refresh_cache = refresh_cache
+        self.cache = self._create_cache() if (settings.F1_API_CACHE_ENABLED or offline) else None
+        self.session = self._create_session(max(settings.F1_API_POOL_SIZE, self.max_workers))
+    
+    @staticmethod
+    def _create_session(pool_size: int) -> requests.Session:
+        """
+        Create a keep-alive session with a connection pool.
+        
+        Args:
+            pool_size: Maximum connections kept open per host
+            
+        Returns:
+            Configured requests session
+        """
+        session = requests.Session()
+        # Retries are handled in _make_request so they respect the rate limiter
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        session.headers.update({'Accept': 'application/json'})
+        return session
+    
+    @staticmethod
+    def _create_cache() -> ResponseCache:
+        """Create the on-disk response cache from settings"""
+        return ResponseCache(
+            settings.F1_API_CACHE_DIR,
+            completed_ttl=settings.F1_API_CACHE_TTL_COMPLETED,
+            current_ttl=settings.F1_API_CACHE_TTL_CURRENT,
+        )
+    
+    def close(self):
+        """Close pooled connections"""
+        self.session.close()
+    
+    def get_request_stats(self) -> Dict:
+        """
+        Get request, retry and latency counters for this service instance.
+        
+        Returns:
+            Dictionary of request statistics
+        """
+        return self.stats.as_dict()
     
     def _rate_limit_wait(self):
-        """Implement rate limiting to avoid hitting API limits"""
-        elapsed = time.time() - self.last_request_time
-        min_interval = 1.0 / self.rate_limit
+        """Wait for a slot in the per-second and per-hour request budgets"""
+        waited = self.rate_limiter.acquire()
+        self.stats.record_wait(waited)
+        if waited > 1:
+            logger.info(f"Rate limit reached, waited {waited:.1f}s")
+    
+    @staticmethod
+    def _get_retry_after(response: Optional[requests.Response]) -> Optional[float]:
+        """
+        Get the delay requested by a response's Retry-After header.
+        
+        Args:
+            response: Failed response, if any
+            
+        Returns:
+            Seconds to wait, or None if the header is missing or invalid
+        """
+        retry_after = response.headers.get('Retry-After') if response is not None else None
+        if not retry_after:
+            return None
+        try:
+            delay = float(retry_after)
+        except ValueError:
+            try:
+                delay = (parsedate_to_datetime(retry_after) - timezone.now()).total_seconds()
+            except (TypeError, ValueError):
+                return None
+        return max(delay, 0)
+    
+    def _get_backoff(self, attempt: int, response: Optional[requests.Response] = None) -> float:
+        """
+        Get the delay before retrying a request.
         
-        if elapsed < min_interval:
-            time.sleep(min_interval - elapsed)
+        Uses the Retry-After header when the server sends one (not capped by
+        MAX_BACKOFF: retrying earlier would only be rejected again), otherwise
+        exponential backoff with random jitter.
         
-        self.last_request_time = time.time()
+        Args:
+            attempt: Number of the failed attempt (0-based)
+            response: Failed response, if any
+            
+        Returns:
+            Seconds to wait
+        """
+        retry_after = self._get_retry_after(response)
+        if retry_after is not None:
+            return retry_after
+        
+        delay = self.backoff_factor * (2 ** attempt)
+        return min(delay + random.uniform(0, self.backoff_factor), self.MAX_BACKOFF)
     
     def _make_request(self, endpoint: str, params: Optional[Dict] = None) -> Dict:
         """
         Make a request to the F1 API with rate limiting.
         
+        Cached responses are returned without touching the network.
+        
         Args:
             endpoint: API endpoint path
             params: Query parameters
@@ -51,15 +255,21 @@ class F1DataService:
             JSON response data
             
         Raises:
-            F1APIError: If the API request fails
+            F1APIError: If the API request fails, or the response is not cached in offline mode
         """
-        self._rate_limit_wait()
+        if self.cache and not self.refresh_cache:
+            data = self.cache.get(endpoint, params, ignore_ttl=self.offline)
+            if data is not None:
+                self.stats.record_cache_hit()
+                return data
+        
+        if self.offline:
+            raise F1APIError(f"No cached response for {endpoint} (params: {params}) in offline mode")
         
         url = f"{self.base_url}/{endpoint}.json"
         
         try:
-            response = requests.get(url, params=params, timeout=10)
-            response.raise_for_status()
+            response = self._send(url, params)
             
             # Check if response is JSON
             content_type = response.headers.get('Content-Type', '')
@@ -70,6 +280,8 @@ class F1DataService:
                 )
             
             data = response.json()
+            if self.cache:
+                self.cache.set(endpoint, params, data)
             return data
             
         except requests.exceptions.JSONDecodeError as e:
@@ -78,8 +290,219 @@ class F1DataService:
                 f"Response preview: {response.text[:200]}"
             )
         except requests.exceptions.RequestException as e:
+            self.stats.record_failure()
             raise F1APIError(f"API request failed: {str(e)}. URL: {url}")
     
+    def _send(self, url: str, params: Optional[Dict] = None) -> requests.Response:
+        """
+        Send a GET request, retrying transient failures.
+        
+        A Retry-After of up to F1_API_MAX_RETRY_AFTER seconds is honoured and
+        pauses every thread using the same rate limiter; a longer one, or a
+        rate limit that persists after all retries, stops the request.
+        
+        Args:
+            url: Full request URL
+            params: Query parameters
+            
+        Returns:
+            Successful response
+            
+        Raises:
+            F1APIRateLimitError: If the API rate limit does not allow retrying in time
+            requests.exceptions.RequestException: If the request still fails after all retries
+        """
+        for attempt in range(self.max_retries + 1):
+            self._rate_limit_wait()
+            
+            started = time.monotonic()
+            try:
+                response = self.session.get(url, params=params, timeout=self.timeout)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                latency = time.monotonic() - started
+                self.stats.record_request(latency)
+                if attempt >= self.max_retries:
+                    raise
+                delay = self._get_backoff(attempt)
+                logger.warning(f"Request to {url} failed ({e}), retrying in {delay:.1f}s")
+            else:
+                latency = time.monotonic() - started
+                self.stats.record_request(latency)
+                logger.debug(f"GET {response.url} -> {response.status_code} in {latency * 1000:.0f}ms")
+                
+                if response.status_code not in self.RETRY_STATUS_CODES:
+                    response.raise_for_status()
+                    return response
+                
+                retry_after = self._get_retry_after(response)
+                too_long = retry_after is not None and retry_after > self.max_retry_after
+                if too_long or (response.status_code == 429 and attempt >= self.max_retries):
+                    self.stats.record_failure()
+                    wait = f", retry after {retry_after:.0f}s" if retry_after is not None else ""
+                    raise F1APIRateLimitError(
+                        f"API rate limit exceeded (HTTP {response.status_code}{wait}); Retry-After is honoured up to "
+                        f"F1_API_MAX_RETRY_AFTER="
+                        f"{self.max_retry_after}s. URL: {url}",
+                        retry_after=retry_after,
+                    )
+                if attempt >= self.max_retries:
+                    response.raise_for_status()
+                    return response
+                
+                delay = self._get_backoff(attempt, response)
+                if retry_after is not None:
+                    self.rate_limiter.pause(delay)
+                logger.warning(f"Request to {url} returned {response.status_code}, retrying in {delay:.1f}s")
+            
+            self.stats.record_retry()
+            time.sleep(delay)
+    
+    def fetch_many(self, endpoints: Sequence[EndpointRequest], max_workers: Optional[int] = None) -> List[Dict]:
+        """
+        Fetch several endpoints concurrently within the rate limit budget.
+        
+        Args:
+            endpoints: Endpoint paths, or (endpoint, params) pairs
+            max_workers: Maximum concurrent requests (defaults to F1_API_MAX_WORKERS)
+            
+        Returns:
+            JSON response data, in the same order as endpoints
+            
+        Raises:
+            F1APIError: If any of the requests fails
+        """
+        requests_to_make = [
+            (endpoint, None) if isinstance(endpoint, str) else endpoint
+            for endpoint in endpoints
+        ]
+        if not requests_to_make:
+            return []
+        
+        workers = min(max_workers or self.max_workers, len(requests_to_make))
+        if workers <= 1:
+            return [self._make_request(endpoint, params) for endpoint, params in requests_to_make]
+        
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='f1-api') as executor:
+            futures = [
+                executor.submit(self._make_threaded_request, endpoint, params)
+                for endpoint, params in requests_to_make
+            ]
+            return [future.result() for future in futures]
+    
+    def _make_threaded_request(self, endpoint: str, params: Optional[Dict] = None) -> Dict:
+        """Make a request from a worker thread, closing the database connection it opened"""
+        try:
+            return self._make_request(endpoint, params)
+        finally:
+            # Opened to reserve from the shared hourly budget; threads do not close it otherwise
+            connections.close_all()
+    
+    def iter_pages(self, endpoint: str, params: Optional[Dict] = None) -> Iterator[Dict]:
+        """
+        Fetch every page of an endpoint, following MRData.total.
+        
+        The first page is fetched alone to learn the total; the remaining
+        pages are fetched concurrently, max_workers pages at a time, and
+        yielded in order. Only one batch of pages is held in memory.
+        
+        Args:
+            endpoint: API endpoint path
+            params: Extra query parameters (limit/offset are managed here)
+            
+        Yields:
+            JSON response data of each page
+        """
+        page_size = self.page_size
+        params = dict(params or {})
+        
+        first = self._make_request(endpoint, {**params, 'limit': page_size, 'offset': 0})
+        yield first
+        
+        try:
+            total = int(first['MRData']['total'])
+            # The API may cap the page size below what was requested
+            page_size = int(first['MRData'].get('limit', page_size)) or page_size
+        except (KeyError, TypeError, ValueError):
+            return
+        
+        offsets = list(range(page_size, total, page_size))
+        if offsets:
+            logger.debug(f"Fetching {len(offsets)} more pages of {endpoint} ({total} rows)")
+        
+        for start in range(0, len(offsets), self.max_workers):
+            batch = offsets[start:start + self.max_workers]
+            yield from self.fetch_many(
+                [(endpoint, {**params, 'limit': page_size, 'offset': offset}) for offset in batch]
+            )
+    
+    def _iter_table(self, endpoint: str, table: str, key: str, params: Optional[Dict] = None) -> Iterator[Dict]:
+        """
+        Iterate the rows of a flat table (e.g. DriverTable.Drivers) across pages.
+        """
+        for data in self.iter_pages(endpoint, params):
+            try:
+                yield from data['MRData'][table][key]
+            except KeyError:
+                return
+    
+    def iter_races(self, endpoint: str, item_key: str, params: Optional[Dict] = None) -> Iterator[Dict]:
+        """
+        Iterate races of a RaceTable endpoint across pages.
+        
+        The API paginates the rows nested in each race (results, laps...), so
+        a race can be split over two pages. Consecutive chunks of the same
+        race are merged and each race is yielded once complete.
+        
+        Args:
+            endpoint: API endpoint path
+            item_key: Key of the nested rows (e.g. 'Results', 'Laps')
+            params: Extra query parameters
+            
+        Yields:
+            Race dictionaries with all of their nested rows
+        """
+        current = None
+        for data in self.iter_pages(endpoint, params):
+            try:
+                races = data['MRData']['RaceTable']['Races']
+            except KeyError:
+                races = []
+            
+            for race in races:
+                if current and (current['season'], current['round']) == (race['season'], race['round']):
+                    self._merge_race_items(current, race, item_key)
+                    continue
+                if current:
+                    yield current
+                current = race
+        
+        if current:
+            yield current
+    
+    @staticmethod
+    def _merge_race_items(race: Dict, chunk: Dict, item_key: str):
+        """Append the nested rows of a page chunk to the race they belong to"""
+        items = race.setdefault(item_key, [])
+        new_items = chunk.get(item_key, [])
+        
+        # A lap can also be split between pages: join its timings
+        if item_key == 'Laps' and items and new_items and items[-1]['number'] == new_items[0]['number']:
+            items[-1]['Timings'].extend(new_items[0].get('Timings', []))
+            new_items = new_items[1:]
+        
+        items.extend(new_items)
+    
+    def _iter_standings(self, endpoint: str, key: str) -> Iterator[Dict]:
+        """
+        Iterate the rows of the (single) standings list of an endpoint across pages.
+        """
+        for data in self.iter_pages(endpoint):
+            try:
+                for standings_list in data['MRData']['StandingsTable']['StandingsLists']:
+                    yield from standings_list.get(key, [])
+            except KeyError:
+                return
+    
     def fetch_drivers(self, season: Optional[int] = None) -> List[Dict]:
         """
         Fetch drivers for a specific season or all drivers.
@@ -91,12 +514,7 @@ class F1DataService:
             List of driver dictionaries
         """
         endpoint = f"{season}/drivers" if season else "drivers"
-        data = self._make_request(endpoint, params={"limit": 1000})
-        
-        try:
-            return data['MRData']['DriverTable']['Drivers']
-        except KeyError:
-            return []
+        return list(self._iter_table(endpoint, 'DriverTable', 'Drivers'))
     
     def fetch_constructors(self, season: Optional[int] = None) -> List[Dict]:
         """
@@ -109,12 +527,7 @@ class F1DataService:
             List of constructor dictionaries
         """
         endpoint = f"{season}/constructors" if season else "constructors"
-        data = self._make_request(endpoint, params={"limit": 1000})
-        
-        try:
-            return data['MRData']['ConstructorTable']['Constructors']
-        except KeyError:
-            return []
+        return list(self._iter_table(endpoint, 'ConstructorTable', 'Constructors'))
     
     def fetch_races(self, season: int) -> List[Dict]:
         """
@@ -127,12 +540,7 @@ class F1DataService:
             List of race dictionaries
         """
         endpoint = f"{season}"
-        data = self._make_request(endpoint)
-        
-        try:
-            return data['MRData']['RaceTable']['Races']
-        except KeyError:
-            return []
+        return list(self._iter_table(endpoint, 'RaceTable', 'Races'))
     
     def fetch_race_results(self, season: int, round_number: int) -> List[Dict]:
         """
@@ -146,15 +554,104 @@ class F1DataService:
             List of result dictionaries
         """
         endpoint = f"{season}/{round_number}/results"
-        data = self._make_request(endpoint)
+        for race in self.iter_races(endpoint, 'Results'):
+            return race.get('Results', [])
+        return []
+    
+    def fetch_season_results(self, season: int) -> Dict[int, List[Dict]]:
+        """
+        Fetch the results of every race of a season with the paged
+        {season}/results endpoint instead of one request per round.
         
-        try:
-            races = data['MRData']['RaceTable']['Races']
-            if races:
-                return races[0].get('Results', [])
-            return []
-        except KeyError:
-            return []
+        Args:
+            season: Year of the season
+            
+        Returns:
+            Dictionary mapping round number to its list of result dictionaries
+        """
+        return {
+            int(race['round']): race.get('Results', [])
+            for race in self.iter_races(f"{season}/results", 'Results')
+        }
+
+    def fetch_qualifying(self, season: int, round_number: int) -> List[Dict]:
+        """
+        Fetch qualifying results for a specific race.
+
+        Args:
+            season: Year of the season
+            round_number: Round number of the race
+
+        Returns:
+            List of qualifying result dictionaries
+        """
+        endpoint = f"{season}/{round_number}/qualifying"
+        for race in self.iter_races(endpoint, 'QualifyingResults'):
+            return race.get('QualifyingResults', [])
+        return []
+
+    def fetch_season_qualifying(self, season: int) -> Dict[int, List[Dict]]:
+        """
+        Fetch the qualifying results of every race of a season with the
+        paged {season}/qualifying endpoint.
+
+        Args:
+            season: Year of the season
+
+        Returns:
+            Dictionary mapping round number to its list of qualifying result dictionaries
+        """
+        return {
+            int(race['round']): race.get('QualifyingResults', [])
+            for race in self.iter_races(f"{season}/qualifying", 'QualifyingResults')
+        }
+
+    def fetch_sprint_results(self, season: int, round_number: int) -> List[Dict]:
+        """
+        Fetch sprint results for a specific race weekend.
+
+        Args:
+            season: Year of the season
+            round_number: Round number of the race
+
+        Returns:
+            List of sprint result dictionaries (empty if the weekend had no sprint)
+        """
+        endpoint = f"{season}/{round_number}/sprint"
+        for race in self.iter_races(endpoint, 'SprintResults'):
+            return race.get('SprintResults', [])
+        return []
+
+    def fetch_season_sprint_results(self, season: int) -> Dict[int, List[Dict]]:
+        """
+        Fetch the results of every sprint of a season with the paged
+        {season}/sprint endpoint.
+
+        Args:
+            season: Year of the season
+
+        Returns:
+            Dictionary mapping round number to its list of sprint result dictionaries
+            (only rounds with a sprint)
+        """
+        return {
+            int(race['round']): race.get('SprintResults', [])
+            for race in self.iter_races(f"{season}/sprint", 'SprintResults')
+        }
+
+    def iter_lap_times(self, season: int, round_number: Optional[int] = None) -> Iterator[Dict]:
+        """
+        Stream lap times of a race, or of a whole season, race by race.
+        
+        Args:
+            season: Year of the season
+            round_number: Round number (optional, streams every race of the season if not provided)
+            
+        Yields:
+            Race dictionaries with their complete 'Laps' list
+        """
+        endpoint = f"{season}/{round_number}/laps" if round_number else f"{season}/laps"
+        yield from self.iter_races(endpoint, 'Laps')
     
     def fetch_lap_times(self, season: int, round_number: int, lap: Optional[int] = None) -> List[Dict]:
         """
@@ -173,15 +670,9 @@ class F1DataService:
         else:
             endpoint = f"{season}/{round_number}/laps"
         
-        data = self._make_request(endpoint, params={"limit": 10000})
-        
-        try:
-            races = data['MRData']['RaceTable']['Races']
-            if races:
-                return races[0].get('Laps', [])
-            return []
-        except KeyError:
-            return []
+        for race in self.iter_races(endpoint, 'Laps'):
+            return race.get('Laps', [])
+        return []
     
     def fetch_driver_standings(self, season: int, round_number: Optional[int] = None) -> List[Dict]:
         """
@@ -199,15 +690,7 @@ class F1DataService:
         else:
             endpoint = f"{season}/driverStandings"
         
-        data = self._make_request(endpoint)
-        
-        try:
-            standings_lists = data['MRData']['StandingsTable']['StandingsLists']
-            if standings_lists:
-                return standings_lists[0].get('DriverStandings', [])
-            return []
-        except KeyError:
-            return []
+        return list(self._iter_standings(endpoint, 'DriverStandings'))
     
     def fetch_constructor_standings(self, season: int, round_number: Optional[int] = None) -> List[Dict]:
         """
@@ -225,15 +708,7 @@ class F1DataService:
         else:
             endpoint = f"{season}/constructorStandings"
         
-        data = self._make_request(endpoint)
-        
-        try:
-            standings_lists = data['MRData']['StandingsTable']['StandingsLists']
-            if standings_lists:
-                return standings_lists[0].get('ConstructorStandings', [])
-            return []
-        except KeyError:
-            return []
+        return list(self._iter_standings(endpoint, 'ConstructorStandings'))
 
 
 # Example usage in management commands or views:
@@ -251,6 +726,19 @@ races = service.fetch_races(season=2024)
 # Fetch results for a specific race
 results = service.fetch_race_results(season=2024, round_number=1)
 
+# Fetch results for every race of a season, grouped by round (a few paged requests)
+results_by_round = service.fetch_season_results(season=2024)
+
 # Fetch driver standings
 standings = service.fetch_driver_standings(season=2024)
+
+# Fetch several endpoints concurrently (shares the rate limit budget)
+data = service.fetch_many(["2024/1/results", "2024/2/results", ("2024/drivers", {"limit": 100})])
+
+# Stream a whole season of lap times race by race (pages fetched in parallel)
+for race in service.iter_lap_times(season=2024):
+    print(race['round'], len(race['Laps']))
+
+# Request, retry and latency counters
+print(service.get_request_stats())
 """
@@ -0,0 +1,237 @@
+"""
+Import State Service
+
+Change detection for API imports. The hash of every imported payload is
+stored per (season, round, resource) in ImportState; a re-import compares
+the hash of the freshly fetched payload and skips writing when it matches.
+The highest round with imported results is the season's high-water mark,
+so polling imports only need to fetch rounds after it.
+
+Completed season imports are also recorded ('season' resource), as
+checkpoints that let multi-season imports resume after an interruption.
+"""
+
+import hashlib
+import json
+import logging
+from typing import Any, Dict, Iterable, Optional, Set, Tuple
+from django.db.models import Max
+from django.utils import timezone
+from core.models import ImportState
+
+
+logger = logging.getLogger(__name__)
+
+
+class ImportStateService:
+    """
+    Service class for payload hashes and high-water marks of imports.
+    """
+
+    CHECKPOINT_RESOURCE = 'season'
+
+    @staticmethod
+    def payload_hash(payload: Any) -> str:
+        """
+        Hash an API payload independently of key order.
+
+        Args:
+            payload: JSON-serializable API data
+
+        Returns:
+            SHA-256 hex digest
+        """
+        canonical = json.dumps(payload, sort_keys=True, separators=(',', ':'))
+        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def get_hashes(season: int, resource: str) -> Dict[int, str]:
+        """
+        Get the stored payload hashes of a resource for a season.
+
+        Args:
+            season: The season year
+            resource: Resource name (see ImportState.RESOURCE_CHOICES)
+
+        Returns:
+            Dictionary mapping round number to payload hash
+        """
+        return dict(
+            ImportState.objects
+            .filter(season=season, resource=resource)
+            .values_list('round', 'payload_hash')
+        )
+
+    @staticmethod
+    def split_changed(season: int, resource: str, payloads: Dict[int, Any],
+                      force: bool = False, touch: bool = True) -> Tuple[Dict[int, Any], Dict[int, str]]:
+        """
+        Drop payloads identical to the last imported ones.
+
+        Rounds found unchanged are marked as checked, unless touch is False
+        (dry runs do not write anything).
+
+        Args:
+            season: The season year
+            resource: Resource name (see ImportState.RESOURCE_CHOICES)
+            payloads: Dictionary mapping round number (0 for season-wide) to fetched API data
+            force: Treat every payload as changed
+            touch: Update checked_at of the unchanged rounds
+
+        Returns:
+            Tuple of (changed payloads by round, their hashes by round)
+        """
+        stored = {} if force else ImportStateService.get_hashes(season, resource)
+
+        changed, hashes, unchanged_rounds = {}, {}, []
+        for round_num, payload in payloads.items():
+            payload_hash = ImportStateService.payload_hash(payload)
+            if stored.get(round_num) == payload_hash:
+                unchanged_rounds.append(round_num)
+                continue
+            changed[round_num] = payload
+            hashes[round_num] = payload_hash
+
+        if touch:
+            ImportStateService.touch(season, resource, unchanged_rounds)
+        return changed, hashes
+
+    @staticmethod
+    def record(season: int, resource: str, hashes: Dict[int, str], row_counts: Optional[Dict[int, int]] = None):
+        """
+        Store the payload hashes of imported rounds.
+
+        Call inside the transaction that writes the data, so the hash is
+        only kept if the import is committed.
+
+        Args:
+            season: The season year
+            resource: Resource name
+            hashes: Dictionary mapping round number to payload hash
+            row_counts: Optional dictionary mapping round number to payload rows
+        """
+        if not hashes:
+            return
+
+        now = timezone.now()
+        row_counts = row_counts or {}
+        ImportState.objects.bulk_create(
+            [
+                ImportState(
+                    season=season,
+                    round=round_num,
+                    resource=resource,
+                    payload_hash=payload_hash,
+                    row_count=row_counts.get(round_num, 0),
+                    checked_at=now,
+                )
+                for round_num, payload_hash in sorted(hashes.items())
+            ],
+            update_conflicts=True,
+            unique_fields=['season', 'round', 'resource'],
+            update_fields=['payload_hash', 'row_count', 'checked_at', 'updated_at'],
+        )
+
+    @staticmethod
+    def touch(season: int, resource: str, rounds: Iterable[int]):
+        """
+        Mark unchanged payloads as checked without rewriting them.
+
+        Args:
+            season: The season year
+            resource: Resource name
+            rounds: Round numbers whose payload was fetched and found unchanged
+        """
+        rounds = list(rounds)
+        if rounds:
+            ImportState.objects.filter(season=season, resource=resource, round__in=rounds).update(
+                checked_at=timezone.now()
+            )
+
+    @staticmethod
+    def high_water_mark(season: int, resource: str = 'results') -> int:
+        """
+        Get the last round of a season with imported data.
+
+        Args:
+            season: The season year
+            resource: Resource name
+
+        Returns:
+            Highest imported round number (0 if none)
+        """
+        return (
+            ImportState.objects
+            .filter(season=season, resource=resource, round__gt=0, row_count__gt=0)
+            .aggregate(last_round=Max('round'))['last_round']
+        ) or 0
+
+    @staticmethod
+    def completed_seasons(seasons: Iterable[int], options: Dict) -> Set[int]:
+        """
+        Get the seasons already imported with the same import options.
+
+        Args:
+            seasons: Season years to check
+            options: Import options the checkpoint must have been recorded with
+
+        Returns:
+            Set of completed season years
+        """
+        return set(
+            ImportState.objects
+            .filter(
+                season__in=list(seasons),
+                round=0,
+                resource=ImportStateService.CHECKPOINT_RESOURCE,
+                payload_hash=ImportStateService.payload_hash(options),
+            )
+            .values_list('season', flat=True)
+        )
+
+    @staticmethod
+    def mark_season_completed(season: int, options: Dict):
+        """
+        Record a checkpoint for a season whose import finished.
+
+        Args:
+            season: The season year
+            options: Import options used
+        """
+        ImportStateService.record(
+            season,
+            ImportStateService.CHECKPOINT_RESOURCE,
+            {0: ImportStateService.payload_hash(options)},
+        )
+
+    @staticmethod
+    def clear_checkpoints(seasons: Iterable[int]) -> int:
+        """
+        Forget completed season checkpoints so the seasons are imported again.
+
+        Args:
+            seasons: Season years
+
+        Returns:
+            Number of checkpoints removed
+        """
+        deleted, _ = ImportState.objects.filter(
+            season__in=list(seasons),
+            resource=ImportStateService.CHECKPOINT_RESOURCE,
+        ).delete()
+        return deleted
+
+    @staticmethod
+    def clear(season: int, resource: str) -> int:
+        """
+        Forget the imported payloads of a resource so every round is imported again.
+
+        Args:
+            season: Season year
+            resource: Resource name (e.g. 'laps')
+
+        Returns:
+            Number of records removed
+        """
+        deleted, _ = ImportState.objects.filter(season=season, resource=resource).delete()
+        return deleted
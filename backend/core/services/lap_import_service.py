@@ -0,0 +1,296 @@
+"""
+Lap Time Import Service
+
+Loads lap times in bulk. A season has tens of thousands of laps and the
+full history millions, so rows are streamed instead of built as model
+instances:
+
+- PostgreSQL: rows are written with COPY into a temporary staging table
+  in fixed-size batches, then merged into the lap table with a single
+  INSERT ... ON CONFLICT DO UPDATE that skips identical rows.
+- Other databases: rows are upserted in batches with BulkService.sync().
+
+Memory use is bounded by the batch size in both cases.
+
+Laps are range-partitioned by season on PostgreSQL (see PartitionService);
+missing season partitions are created before the merge.
+
+After each load the LapSeries rows (one per driver and race, with the
+lap times and positions as arrays) of the affected races are rebuilt, so
+charts can read a whole race from ~20 rows instead of ~1,400 laps.
+"""
+
+import io
+import logging
+from itertools import islice
+from typing import Dict, Iterable, Iterator, Set, Tuple
+from django.db import connection, transaction
+from core.models import Lap, LapSeries
+from core.services.bulk_service import BulkService
+from core.services.cache_service import SeasonCacheService
+from core.services.partition_service import PartitionService
+from core.utils import group_lap_series, parse_lap_time
+
+
+logger = logging.getLogger(__name__)
+
+# (race_id, driver_id, lap_number, position, lap_time, lap_time_milliseconds, season)
+LapRow = Tuple[int, int, int, int, str, int, int]
+
+
+class LapImportService:
+    """
+    Service class for streaming lap times into the database.
+    """
+
+    COLUMNS = ['race_id', 'driver_id', 'lap_number', 'position', 'lap_time', 'lap_time_milliseconds', 'season']
+    KEY_COLUMNS = ['race_id', 'driver_id', 'lap_number', 'season']
+    BATCH_SIZE = 5000
+    STAGING_TABLE = 'lap_staging'
+
+    @staticmethod
+    def iter_lap_rows(races: Iterable[Dict], race_ids: Dict[int, int], driver_ids: Dict[str, int]) -> Iterator[LapRow]:
+        """
+        Flatten API races with nested laps into lap rows, parsing lap times on the fly.
+
+        Args:
+            races: Race dictionaries with their 'Laps' (e.g. from F1DataService.iter_lap_times)
+            race_ids: Map of round number to Race database ID
+            driver_ids: Map of external driver ID to Driver database ID
+
+        Yields:
+            Lap row tuples in COLUMNS order
+        """
+        for race in races:
+            race_id = race_ids.get(int(race['round']))
+            if race_id is None:
+                logger.warning(f"Skipping laps of unknown race {race['season']} round {race['round']}")
+                continue
+
+            skipped = 0
+            for lap in race.get('Laps', []):
+                lap_number = int(lap['number'])
+                for timing in lap.get('Timings', []):
+                    driver_id = driver_ids.get(timing['driverId'])
+                    if driver_id is None:
+                        skipped += 1
+                        continue
+                    yield (
+                        race_id,
+                        driver_id,
+                        lap_number,
+                        int(timing['position']),
+                        timing['time'],
+                        parse_lap_time(timing['time']),
+                        int(race['season']),
+                    )
+
+            if skipped:
+                logger.warning(f"Skipped {skipped} lap times of unknown drivers in round {race['round']}")
+
+    @staticmethod
+    def _batches(rows: Iterable[LapRow], batch_size: int) -> Iterator[list]:
+        rows = iter(rows)
+        while True:
+            batch = list(islice(rows, batch_size))
+            if not batch:
+                return
+            yield batch
+
+    @staticmethod
+    @transaction.atomic
+    def load_laps(rows: Iterable[LapRow], batch_size: int = BATCH_SIZE) -> Dict[str, int]:
+        """
+        Insert or update lap rows, rebuild the lap series of their races and
+        bump the data version of their seasons.
+
+        Args:
+            rows: Lap row tuples in COLUMNS order (any iterable, consumed once)
+            batch_size: Rows held in memory at a time
+
+        Returns:
+            Dictionary with 'created', 'updated' and 'unchanged' counts
+        """
+        race_ids = set()
+        seasons = set()
+        season_index = LapImportService.COLUMNS.index('season')
+
+        def track(rows):
+            for row in rows:
+                race_ids.add(row[0])
+                seasons.add(row[season_index])
+                yield row
+
+        if connection.vendor == 'postgresql':
+            counts = LapImportService._copy_laps(track(rows), batch_size)
+        else:
+            counts = LapImportService._bulk_laps(track(rows), batch_size)
+
+        if counts['created'] or counts['updated']:
+            LapImportService.build_lap_series(race_ids)
+            for season in seasons:
+                SeasonCacheService.bump_version(season)
+        return counts
+
+    @staticmethod
+    @transaction.atomic
+    def build_lap_series(race_ids: Set[int], batch_size: int = 1000) -> Dict[str, int]:
+        """
+        Rebuild the LapSeries rows of some races from their laps.
+
+        Args:
+            race_ids: Race database IDs
+            batch_size: Series rows written per batch
+
+        Returns:
+            Dictionary with 'created', 'updated' and 'unchanged' counts
+        """
+        laps = (
+            Lap.objects.filter(race_id__in=race_ids)
+            .order_by('race_id', 'driver_id', 'lap_number')
+            .values_list('race_id', 'driver_id', 'lap_number', 'position', 'lap_time_milliseconds')
+            .iterator(chunk_size=LapImportService.BATCH_SIZE)
+        )
+        series = (
+            LapSeries(race_id=race_id, driver_id=driver_id, lap_times_milliseconds=times, positions=positions)
+            for race_id, driver_id, times, positions in group_lap_series(laps)
+        )
+
+        counts = {'created': 0, 'updated': 0, 'unchanged': 0}
+        for batch in LapImportService._batches(series, batch_size):
+            result = BulkService.sync(
+                LapSeries, batch,
+                unique_fields=['race', 'driver'],
+                update_fields=['lap_times_milliseconds', 'positions', 'updated_at'],
+                batch_size=batch_size,
+            )
+            for key in counts:
+                counts[key] += len(result[key])
+
+        logger.info(
+            f"Lap series of {len(race_ids)} races: {counts['created']} created, "
+            f"{counts['updated']} updated, {counts['unchanged']} unchanged"
+        )
+        return counts
+
+    @staticmethod
+    @transaction.atomic
+    def delete_season(season: int) -> int:
+        """
+        Delete the laps and lap series of a season.
+
+        On PostgreSQL this truncates the season partition of the lap table.
+
+        Args:
+            season: Season year
+
+        Returns:
+            Number of laps removed
+        """
+        deleted = PartitionService.truncate_season(Lap, season)
+        LapSeries.objects.filter(race__season=season).delete()
+        SeasonCacheService.bump_version(season)
+        logger.info(f"Deleted {deleted} laps of season {season}")
+        return deleted
+
+    @staticmethod
+    def _bulk_laps(rows: Iterable[LapRow], batch_size: int) -> Dict[str, int]:
+        """Upsert lap rows in batches through the ORM"""
+        counts = {'created': 0, 'updated': 0, 'unchanged': 0}
+
+        for batch in LapImportService._batches(rows, batch_size):
+            laps = [Lap(**dict(zip(LapImportService.COLUMNS, row))) for row in batch]
+            result = BulkService.sync(
+                Lap, laps,
+                unique_fields=['race', 'driver', 'lap_number', 'season'],
+                update_fields=['position', 'lap_time', 'lap_time_milliseconds'],
+                batch_size=batch_size,
+            )
+            for key in counts:
+                counts[key] += len(result[key])
+
+        return counts
+
+    @staticmethod
+    def _copy_laps(rows: Iterable[LapRow], batch_size: int) -> Dict[str, int]:
+        """Stream lap rows into a staging table with COPY and merge them"""
+        quote = connection.ops.quote_name
+        staging = quote(LapImportService.STAGING_TABLE)
+        lap_table = quote(Lap._meta.db_table)
+        columns = ', '.join(quote(column) for column in LapImportService.COLUMNS)
+        key_list = [quote(column) for column in LapImportService.KEY_COLUMNS]
+        key_columns = ', '.join(key_list)
+        value_columns = [quote(c) for c in LapImportService.COLUMNS if c not in LapImportService.KEY_COLUMNS]
+
+        with connection.cursor() as cursor:
+            # Same column types as the lap table, without its constraints
+            cursor.execute(f"DROP TABLE IF EXISTS {staging}")
+            cursor.execute(
+                f"CREATE TEMPORARY TABLE {staging} ON COMMIT DROP AS "
+                f"SELECT {columns} FROM {lap_table} WITH NO DATA"
+            )
+
+            staged = 0
+            copy_sql = f"COPY {staging} ({columns}) FROM STDIN"
+            for batch in LapImportService._batches(rows, batch_size):
+                LapImportService._copy_batch(cursor, copy_sql, batch)
+                staged += len(batch)
+
+            if not staged:
+                return {'created': 0, 'updated': 0, 'unchanged': 0}
+
+            cursor.execute(f"SELECT DISTINCT {quote('season')} FROM {staging}")
+            PartitionService.ensure_partitions(Lap, [season for (season,) in cursor.fetchall()])
+
+            # Keys already stored (system columns such as xmax cannot be
+            # returned from a partitioned table to tell inserts from updates)
+            cursor.execute(
+                f"""
+                SELECT
+                    (SELECT COUNT(*) FROM (SELECT DISTINCT {key_columns} FROM {staging}) AS staged_keys),
+                    (SELECT COUNT(*) FROM (SELECT DISTINCT {key_columns} FROM {staging}) AS staged_keys
+                     WHERE EXISTS (SELECT 1 FROM {lap_table} WHERE {' AND '.join(
+                         f'{lap_table}.{column} = staged_keys.{column}' for column in key_list
+                     )}))
+                """
+            )
+            distinct_staged, existing = cursor.fetchone()
+
+            # Identical rows are not updated at all, so only changed rows are returned
+            cursor.execute(
+                f"""
+                WITH merged AS (
+                    INSERT INTO {lap_table} ({columns}, {quote('created_at')})
+                    SELECT DISTINCT ON ({key_columns}) {columns}, now()
+                    FROM {staging}
+                    ORDER BY {key_columns}
+                    ON CONFLICT ({key_columns}) DO UPDATE SET
+                        {', '.join(f'{column} = EXCLUDED.{column}' for column in value_columns)}
+                    WHERE ({', '.join(f'{lap_table}.{column}' for column in value_columns)})
+                        IS DISTINCT FROM ({', '.join(f'EXCLUDED.{column}' for column in value_columns)})
+                    RETURNING 1
+                )
+                SELECT COUNT(*) FROM merged
+                """
+            )
+            changed = cursor.fetchone()[0]
+            created = distinct_staged - existing
+            updated = changed - created
+
+        return {'created': created, 'updated': updated, 'unchanged': distinct_staged - created - updated}
+
+    @staticmethod
+    def _copy_batch(cursor, copy_sql: str, batch: list):
+        """Send one batch of rows through COPY (psycopg2 or psycopg 3)"""
+        raw_cursor = cursor.cursor
+        if hasattr(raw_cursor, 'copy_expert'):
+            buffer = io.StringIO()
+            for row in batch:
+                buffer.write('\t'.join(r'\N' if value is None else str(value) for value in row))
+                buffer.write('\n')
+            buffer.seek(0)
+            raw_cursor.copy_expert(copy_sql, buffer)
+        else:
+            with raw_cursor.copy(copy_sql) as copy:
+                for row in batch:
+                    copy.write_row(row)
@@ -0,0 +1,140 @@
+"""
+Partition Service
+
+Season partitions of the lap table on PostgreSQL. Migration 0016 turns the
+lap table into a table partitioned by RANGE (season) with one partition per
+season (core_lap_<season>):
+
+- Queries filtering on Lap.season only scan that season's partition.
+- A season's laps are dropped with a TRUNCATE of its partition instead of
+  a mass DELETE (no dead tuples, no index churn, no long VACUUM).
+
+New seasons get their partition when their laps are first imported.
+Rows written for a season without a partition (ORM writes, new seasons)
+land in the DEFAULT partition (core_lap_default, migration 0018) and are
+moved to the season partition once it is created. On other databases the
+table is not partitioned and the same calls fall back to ORM queries.
+"""
+
+import logging
+from typing import Iterable
+from django.db import connection
+
+
+logger = logging.getLogger(__name__)
+
+
+class PartitionService:
+    """
+    Service class for the season partitions of partitioned tables.
+    """
+
+    @staticmethod
+    def is_partitioned(model) -> bool:
+        """
+        Check whether the table of a model is partitioned.
+
+        Args:
+            model: Model class
+
+        Returns:
+            True on PostgreSQL when the table is a partitioned table
+        """
+        if connection.vendor != 'postgresql':
+            return False
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(%s)",
+                [model._meta.db_table],
+            )
+            return cursor.fetchone() is not None
+
+    @staticmethod
+    def partition_name(model, season: int) -> str:
+        """Name of the partition holding one season of a model's table"""
+        return f'{model._meta.db_table}_{int(season)}'
+
+    @staticmethod
+    def default_partition_name(model) -> str:
+        """Name of the DEFAULT partition of a model's table"""
+        return f'{model._meta.db_table}_default'
+
+    @staticmethod
+    def ensure_partitions(model, seasons: Iterable[int]):
+        """
+        Create the missing season partitions of a partitioned table.
+
+        Rows of the season already stored in the DEFAULT partition are moved
+        to the new partition (PostgreSQL refuses to create a partition whose
+        rows are still in the default one). Does nothing when the table is
+        not partitioned.
+
+        Args:
+            model: Model class
+            seasons: Season years that are about to be written
+        """
+        if not PartitionService.is_partitioned(model):
+            return
+
+        quote = connection.ops.quote_name
+        table = quote(model._meta.db_table)
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT to_regclass(%s)", [PartitionService.default_partition_name(model)])
+            default = cursor.fetchone()[0]
+
+            for season in sorted({int(season) for season in seasons}):
+                partition = PartitionService.partition_name(model, season)
+                cursor.execute("SELECT to_regclass(%s)", [partition])
+                if cursor.fetchone()[0] is not None:
+                    continue
+
+                bounds = f"FOR VALUES FROM ({season}) TO ({season + 1})"
+                if default is None:
+                    cursor.execute(f"CREATE TABLE {quote(partition)} PARTITION OF {table} {bounds}")
+                    continue
+
+                cursor.execute(f"CREATE TABLE {quote(partition)} (LIKE {table} INCLUDING DEFAULTS)")
+                cursor.execute(
+                    f"WITH moved AS (DELETE FROM {quote(PartitionService.default_partition_name(model))} "
+                    f"WHERE season = %s RETURNING *) INSERT INTO {quote(partition)} SELECT * FROM moved",
+                    [season],
+                )
+                if cursor.rowcount:
+                    logger.info(f"Moved {cursor.rowcount} rows of season {season} out of the default partition")
+                cursor.execute(f"ALTER TABLE {table} ATTACH PARTITION {quote(partition)} {bounds}")
+
+    @staticmethod
+    def truncate_season(model, season: int) -> int:
+        """
+        Delete every row of a season.
+
+        Truncates the season partition of a partitioned table, otherwise
+        (or when the season's rows are still in the default partition)
+        deletes the rows with a filtered DELETE.
+
+        Args:
+            model: Model class with a season field
+            season: Season year
+
+        Returns:
+            Number of rows removed
+        """
+        partition = PartitionService.partition_name(model, season)
+        if PartitionService.is_partitioned(model):
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT to_regclass(%s)", [partition])
+                has_partition = cursor.fetchone()[0] is not None
+        else:
+            has_partition = False
+
+        if not has_partition:
+            deleted, _ = model.objects.filter(season=season).delete()
+            return deleted
+
+        with connection.cursor() as cursor:
+            cursor.execute(f"SELECT COUNT(*) FROM {connection.ops.quote_name(partition)}")
+            deleted = cursor.fetchone()[0]
+            cursor.execute(f"TRUNCATE {connection.ops.quote_name(partition)}")
+
+        logger.info(f"Truncated partition {partition} ({deleted} rows)")
+        return deleted
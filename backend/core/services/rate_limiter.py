@@ -0,0 +1,166 @@
+"""
+API Rate Limiting
+
+Thread-safe token buckets used by F1DataService to stay within the
+Ergast/Jolpica limits (4 requests per second, 200 per hour) while several
+threads fetch concurrently.
+
+The per-second budget is enforced within each process. The hourly budget
+is stored in the database, so imports running in several processes (cron
+jobs, manual runs) draw from the same requests.
+"""
+
+import threading
+import time
+from typing import Dict, Optional, Tuple
+from django.db import transaction
+from django.utils import timezone
+from core.models import RateLimitBucket
+
+
+class TokenBucket:
+    """
+    Token bucket refilled continuously at `rate` tokens per second, holding
+    at most `capacity` tokens.
+
+    Not thread-safe on its own; RateLimiter guards its buckets with a lock.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+
+    def _refill(self, now: float):
+        elapsed = now - self.updated_at
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+        self.updated_at = now
+
+    def reserve(self, now: float) -> float:
+        """
+        Take one token, borrowing against future refills if necessary.
+
+        Returns:
+            Seconds to wait before the reserved token may be used
+        """
+        self._refill(now)
+        self.tokens -= 1
+        if self.tokens >= 0:
+            return 0.0
+        return -self.tokens / self.rate
+
+
+class DatabaseTokenBucket:
+    """
+    Token bucket stored in a RateLimitBucket row, shared by every process.
+
+    Each reservation locks the row for one short transaction, so it must not
+    be made inside a long-running transaction (imports fetch before writing).
+    """
+
+    def __init__(self, name: str, rate: float, capacity: float):
+        self.name = name
+        self.rate = rate
+        self.capacity = capacity
+
+    def reserve(self, now: float) -> float:
+        """
+        Take one token, borrowing against future refills if necessary.
+
+        Args:
+            now: Ignored; the database row is refilled using wall-clock time,
+                which is comparable across processes
+
+        Returns:
+            Seconds to wait before the reserved token may be used
+        """
+        with transaction.atomic():
+            bucket, _ = RateLimitBucket.objects.select_for_update().get_or_create(
+                name=self.name,
+                defaults={'tokens': self.capacity, 'refilled_at': timezone.now()},
+            )
+            refilled_at = timezone.now()
+            elapsed = max((refilled_at - bucket.refilled_at).total_seconds(), 0)
+            tokens = min(self.capacity, bucket.tokens + elapsed * self.rate) - 1
+            RateLimitBucket.objects.filter(pk=bucket.pk).update(
+                tokens=tokens, refilled_at=refilled_at, updated_at=refilled_at
+            )
+        if tokens >= 0:
+            return 0.0
+        return -tokens / self.rate
+
+
+class RateLimiter:
+    """
+    Enforces a per-second and a per-hour request budget across threads.
+
+    Each call to acquire() reserves a slot in both buckets under a lock and
+    then sleeps outside the lock, so waiting threads do not block each other
+    from reserving the following slots. pause() holds back every request
+    until a given time (a Retry-After sent by the API).
+    """
+
+    # Name of the database bucket holding the hourly budget of the shared limiters
+    SHARED_HOURLY_BUCKET = 'f1-api-hourly'
+
+    _shared: Dict[Tuple[float, int], 'RateLimiter'] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, per_second: float, per_hour: Optional[int] = None, hourly_bucket: Optional[str] = None):
+        """
+        Args:
+            per_second: Requests allowed per second
+            per_hour: Requests allowed per hour (None = no hourly budget)
+            hourly_bucket: Name of a database bucket to keep the hourly budget in,
+                shared with other processes (None = kept in this limiter only)
+        """
+        self.per_second = per_second
+        self.per_hour = per_hour
+        self._lock = threading.Lock()
+        self._resume_at = 0.0
+        self._buckets = [TokenBucket(rate=per_second, capacity=max(per_second, 1))]
+        if per_hour:
+            if hourly_bucket:
+                self._buckets.append(DatabaseTokenBucket(hourly_bucket, rate=per_hour / 3600.0, capacity=per_hour))
+            else:
+                self._buckets.append(TokenBucket(rate=per_hour / 3600.0, capacity=per_hour))
+
+    @classmethod
+    def shared(cls, per_second: float, per_hour: Optional[int] = None) -> 'RateLimiter':
+        """
+        Get the process-wide limiter for a budget, so every F1DataService
+        instance (and every thread using one) draws from the same tokens.
+        Its hourly budget is also shared with other processes.
+        """
+        key = (per_second, per_hour)
+        with cls._shared_lock:
+            if key not in cls._shared:
+                cls._shared[key] = cls(per_second, per_hour, hourly_bucket=cls.SHARED_HOURLY_BUCKET)
+            return cls._shared[key]
+
+    def acquire(self) -> float:
+        """
+        Block until a request is allowed by every budget.
+
+        Returns:
+            Seconds spent waiting
+        """
+        with self._lock:
+            now = time.monotonic()
+            wait = max(bucket.reserve(now) for bucket in self._buckets)
+            wait = max(wait, self._resume_at - now)
+
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def pause(self, seconds: float):
+        """
+        Hold back every request for some time, e.g. after a Retry-After.
+
+        Args:
+            seconds: Seconds from now before the next request may be sent
+        """
+        with self._lock:
+            self._resume_at = max(self._resume_at, time.monotonic() + seconds)
@@ -0,0 +1,133 @@
+"""
+API Response Cache
+
+Persistent on-disk cache of Ergast API responses used by F1DataService.
+
+Each response is stored gzip-compressed in a file named after the SHA-256
+of its endpoint and query parameters, so the same request always maps to
+the same file and repeated imports never download it twice. Responses for
+completed seasons rarely change and are kept much longer than responses
+for the season in progress.
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, Optional
+from django.utils import timezone
+
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCache:
+    """
+    Content-addressed store of JSON API responses on disk.
+    """
+
+    SEASON_PATTERN = re.compile(r'^(\d{4})(?:/|$)')
+
+    def __init__(self, cache_dir, completed_ttl: Optional[int], current_ttl: Optional[int]):
+        """
+        Args:
+            cache_dir: Directory holding the cached responses
+            completed_ttl: Seconds to keep responses of completed seasons (None = forever)
+            current_ttl: Seconds to keep responses of the current season and
+                endpoints not bound to a season (None = forever)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.completed_ttl = completed_ttl
+        self.current_ttl = current_ttl
+
+    @staticmethod
+    def make_key(endpoint: str, params: Optional[Dict] = None) -> str:
+        """
+        Build the cache key of a request.
+
+        Args:
+            endpoint: API endpoint path
+            params: Query parameters
+
+        Returns:
+            Hex digest identifying the request
+        """
+        canonical = json.dumps(
+            {'endpoint': endpoint.strip('/'), 'params': {k: str(v) for k, v in (params or {}).items()}},
+            sort_keys=True,
+        )
+        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f'{key}.json.gz'
+
+    def get_ttl(self, endpoint: str) -> Optional[int]:
+        """
+        Get how long a response may be served from the cache.
+
+        Args:
+            endpoint: API endpoint path
+
+        Returns:
+            TTL in seconds (None = never expires)
+        """
+        match = self.SEASON_PATTERN.match(endpoint.strip('/'))
+        if match and int(match.group(1)) < timezone.now().year:
+            return self.completed_ttl
+        return self.current_ttl
+
+    def get(self, endpoint: str, params: Optional[Dict] = None, ignore_ttl: bool = False) -> Optional[Dict]:
+        """
+        Read a cached response.
+
+        Args:
+            endpoint: API endpoint path
+            params: Query parameters
+            ignore_ttl: Return the entry even if it has expired (offline replay)
+
+        Returns:
+            Cached JSON data, or None if missing or expired
+        """
+        path = self._path(self.make_key(endpoint, params))
+        try:
+            if not ignore_ttl:
+                ttl = self.get_ttl(endpoint)
+                if ttl is not None and time.time() - path.stat().st_mtime > ttl:
+                    return None
+            with gzip.open(path, 'rt', encoding='utf-8') as f:
+                return json.load(f)['data']
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable cache entry {path}: {e}")
+            return None
+
+    def set(self, endpoint: str, params: Optional[Dict], data: Dict) -> None:
+        """
+        Store a response.
+
+        The entry is written to a temporary file and renamed into place, so
+        concurrent readers never see a partial file.
+
+        Args:
+            endpoint: API endpoint path
+            params: Query parameters
+            data: JSON response data
+        """
+        path = self._path(self.make_key(endpoint, params))
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        entry = {'endpoint': endpoint, 'params': params or {}, 'data': data}
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as raw, gzip.GzipFile(fileobj=raw, mode='wb') as f:
+                f.write(json.dumps(entry, separators=(',', ':')).encode('utf-8'))
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
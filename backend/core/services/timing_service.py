@@ -0,0 +1,220 @@
+"""
+Timing Service
+
+Fastest lap, qualifying gap and lap record queries. They run on the
+integer millisecond columns (fastest_lap_time_milliseconds,
+q1/q2/q3_milliseconds), so ordering is numeric and each query is a single
+indexed ORDER BY ... LIMIT instead of parsing time strings in Python.
+
+Race lap charts are read from LapSeries, one row per driver.
+"""
+
+import logging
+from typing import Dict, List, Optional
+from django.db.models import OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from core.models import LapSeries, Qualifying, Race, Result
+
+
+logger = logging.getLogger(__name__)
+
+
+class TimingService:
+    """
+    Service class for queries on lap and qualifying times.
+    """
+
+    DRIVER_FIELDS = ['driver_id', 'driver__first_name', 'driver__last_name', 'driver__code', 'driver__number']
+    CONSTRUCTOR_FIELDS = ['constructor_id', 'constructor__name', 'constructor__team_color']
+
+    @staticmethod
+    def _driver(row: Dict) -> Dict:
+        """Nest the driver columns of a values() row"""
+        return {
+            'id': row['driver_id'],
+            'first_name': row['driver__first_name'],
+            'last_name': row['driver__last_name'],
+            'code': row['driver__code'],
+            'number': row['driver__number'],
+        }
+
+    @staticmethod
+    def _driver_and_constructor(row: Dict) -> Dict:
+        """Nest the driver and constructor columns of a values() row"""
+        return {
+            'driver': TimingService._driver(row),
+            'constructor': {
+                'id': row['constructor_id'],
+                'name': row['constructor__name'],
+                'team_color': row['constructor__team_color'],
+            },
+        }
+
+    @staticmethod
+    def get_fastest_laps(race_id: int, limit: Optional[int] = None) -> List[Dict]:
+        """
+        Rank the drivers of a race by their fastest lap.
+
+        Args:
+            race_id: Race database ID
+            limit: Number of drivers to return (None = all)
+
+        Returns:
+            List of dictionaries with the rank, driver, constructor, lap number,
+            time, milliseconds and gap to the fastest lap in milliseconds
+        """
+        rows = (
+            Result.objects
+            .filter(race_id=race_id, fastest_lap_time_milliseconds__isnull=False)
+            .order_by('fastest_lap_time_milliseconds')
+            .values(
+                *TimingService.DRIVER_FIELDS, *TimingService.CONSTRUCTOR_FIELDS,
+                'fastest_lap', 'fastest_lap_time', 'fastest_lap_time_milliseconds', 'fastest_lap_speed',
+            )
+        )
+        if limit:
+            rows = rows[:limit]
+
+        best = None
+        fastest_laps = []
+        for rank, row in enumerate(rows, start=1):
+            if best is None:
+                best = row['fastest_lap_time_milliseconds']
+            fastest_laps.append({
+                'rank': rank,
+                **TimingService._driver_and_constructor(row),
+                'lap': row['fastest_lap'],
+                'time': row['fastest_lap_time'],
+                'milliseconds': row['fastest_lap_time_milliseconds'],
+                'speed': row['fastest_lap_speed'],
+                'gap_milliseconds': row['fastest_lap_time_milliseconds'] - best,
+            })
+        return fastest_laps
+
+    @staticmethod
+    def get_pole_gaps(race_id: int) -> List[Dict]:
+        """
+        Get the qualifying order of a race with each driver's gap to pole.
+
+        A driver's time is the one set in the last session they reached
+        (Q3, else Q2, else Q1), compared with the pole sitter's time.
+
+        Args:
+            race_id: Race database ID
+
+        Returns:
+            List of dictionaries with the position, driver, constructor, Q1/Q2/Q3
+            milliseconds, best time in milliseconds and gap to pole in milliseconds
+        """
+        rows = (
+            Qualifying.objects
+            .filter(race_id=race_id)
+            .annotate(best_milliseconds=Coalesce('q3_milliseconds', 'q2_milliseconds', 'q1_milliseconds'))
+            .order_by('position')
+            .values(
+                *TimingService.DRIVER_FIELDS, *TimingService.CONSTRUCTOR_FIELDS, 'position',
+                'q1_milliseconds', 'q2_milliseconds', 'q3_milliseconds', 'best_milliseconds',
+            )
+        )
+
+        pole = None
+        gaps = []
+        for row in rows:
+            if row['position'] == 1:
+                pole = row['best_milliseconds']
+            gap = None
+            if pole is not None and row['best_milliseconds'] is not None:
+                gap = row['best_milliseconds'] - pole
+            gaps.append({
+                'position': row['position'],
+                **TimingService._driver_and_constructor(row),
+                'q1_milliseconds': row['q1_milliseconds'],
+                'q2_milliseconds': row['q2_milliseconds'],
+                'q3_milliseconds': row['q3_milliseconds'],
+                'best_milliseconds': row['best_milliseconds'],
+                'gap_milliseconds': gap,
+            })
+        return gaps
+
+    @staticmethod
+    def get_lap_records(circuit_id: Optional[str] = None) -> List[Dict]:
+        """
+        Get the race lap record (fastest lap set in a race) of each circuit.
+
+        Each circuit's record is one indexed ORDER BY ... LIMIT 1 subquery.
+
+        Args:
+            circuit_id: Only return the record of this circuit (optional)
+
+        Returns:
+            List of dictionaries with the circuit, time, milliseconds, season,
+            round and driver of each record, ordered by circuit name
+        """
+        record = (
+            Result.objects
+            .filter(race__circuit_id=OuterRef('circuit_id'), fastest_lap_time_milliseconds__isnull=False)
+            .order_by('fastest_lap_time_milliseconds', 'race__date')
+            .values('id')[:1]
+        )
+        circuits = Race.objects.all()
+        if circuit_id:
+            circuits = circuits.filter(circuit_id=circuit_id)
+        record_ids = {
+            circuit: result_id
+            for circuit, result_id in
+            circuits.order_by('circuit_id').values('circuit_id').distinct()
+            .annotate(record_id=Subquery(record)).values_list('circuit_id', 'record_id')
+            if result_id is not None
+        }
+
+        rows = (
+            Result.objects
+            .filter(id__in=record_ids.values())
+            .order_by('race__circuit_name')
+            .values(
+                *TimingService.DRIVER_FIELDS, *TimingService.CONSTRUCTOR_FIELDS,
+                'race__circuit_id', 'race__circuit_name', 'season', 'race__round',
+                'fastest_lap_time', 'fastest_lap_time_milliseconds',
+            )
+        )
+        return [
+            {
+                'circuit_id': row['race__circuit_id'],
+                'circuit_name': row['race__circuit_name'],
+                'time': row['fastest_lap_time'],
+                'milliseconds': row['fastest_lap_time_milliseconds'],
+                'season': row['season'],
+                'round': row['race__round'],
+                **TimingService._driver_and_constructor(row),
+            }
+            for row in rows
+        ]
+
+    @staticmethod
+    def get_race_laps(race_id: int) -> List[Dict]:
+        """
+        Get the lap times and positions of every driver in a race.
+
+        Args:
+            race_id: Race database ID
+
+        Returns:
+            List of dictionaries with the driver, number of laps and the lap
+            times in milliseconds and positions by lap (element i = lap i + 1),
+            ordered by driver
+        """
+        rows = (
+            LapSeries.objects
+            .filter(race_id=race_id)
+            .order_by('driver__last_name', 'driver_id')
+            .values(*TimingService.DRIVER_FIELDS, 'lap_times_milliseconds', 'positions')
+        )
+        return [
+            {
+                'driver': TimingService._driver(row),
+                'laps': len(row['positions']),
+                'lap_times_milliseconds': row['lap_times_milliseconds'],
+                'positions': row['positions'],
+            }
+            for row in rows
+        ]
@@ -0,0 +1,44 @@
+"""
+Signal handlers that keep stored and cached standings in sync with race results,
+and the season data versions in sync with single-row writes (admin, scripts).
+
+Bulk writes (bulk_create/update) do not send these signals; code using them
+must invalidate the season explicitly.
+"""
+
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from core.models import (
+    Race, Result, Qualifying, Sprint, Lap, ChampionshipStanding, DriverSeason, ConstructorSeason,
+    Season, Driver, Constructor, DriverCareerStats,
+)
+from core.services.cache_service import SeasonCacheService
+from core.services.championship_service import ChampionshipService
+
+
+# Models with a season column, and models whose rows are not tied to a season
+SEASON_MODELS = (Qualifying, Sprint, Lap, ChampionshipStanding)
+GLOBAL_MODELS = (Season, Driver, Constructor, DriverCareerStats)
+
+
+@receiver([post_save, post_delete], sender=Result)
+def invalidate_season_on_result_change(sender, instance, **kwargs):
+    """Invalidate stored and cached standings from the round of a changed result"""
+    ChampionshipService.invalidate_season(instance.race.season, instance.race.round)
+
+
+@receiver([post_save, post_delete], sender=Race)
+def invalidate_season_on_race_change(sender, instance, **kwargs):
+    """Invalidate stored and cached standings for the season of a changed race"""
+    ChampionshipService.invalidate_season(instance.season)
+
+
+@receiver([post_save, post_delete])
+def bump_data_version_on_change(sender, instance, **kwargs):
+    """Bump the data version of the season of a changed row"""
+    if sender in SEASON_MODELS:
+        SeasonCacheService.bump_version(instance.season)
+    elif sender in (DriverSeason, ConstructorSeason):
+        SeasonCacheService.bump_version(instance.season.year)
+    elif sender in GLOBAL_MODELS:
+        SeasonCacheService.bump_version(SeasonCacheService.GLOBAL_SEASON)
@@ -1,3 +1,896 @@
-from django.test import TestCase
+import csv
+import json
+import re
+import tempfile
+from datetime import date, timedelta
+from io import StringIO
+from pathlib import Path
+from unittest import mock
+import requests
+from django.conf import settings
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection, transaction
+from django.db.models import Count
+from django.test import TestCase, override_settings
+from core.models import (
+    ChampionshipStanding, Constructor, Driver, DriverCareerStats, DriverSeason, ImportState, Lap, LapSeries, Qualifying,
+    Race, RateLimitBucket, Result, Season, SeasonDataVersion, Sprint,
+)
+from core.services.bulk_service import BulkService
+from core.services.cache_service import SeasonCacheService
+from core.services.career_stats_service import CareerStatsService
+from core.services.championship_service import ChampionshipService
+from core.services.ergast_dump_service import ErgastDumpLoader
+from core.services.f1_api_service import F1APIError, F1APIRateLimitError, F1DataService
+from core.services.lap_import_service import LapImportService
+from core.services.partition_service import PartitionService
+from core.services.rate_limiter import DatabaseTokenBucket
 
-# Create your tests here.
+
+class QueryPlanTests(TestCase):
+    """
+    EXPLAIN the hot endpoint queries and fail when one of them reads a large
+    table with a full sequential scan instead of an index.
+
+    On PostgreSQL sequential scans are disabled while explaining, so the
+    planner only falls back to one, or to walking a whole index, when no
+    index matches the query (small test tables would otherwise always be
+    scanned). Partition pruning of
+    the lap table is not a full scan and is not explained here.
+    """
+
+    LARGE_TABLES = [
+        'core_result', 'core_lap', 'core_lapseries', 'core_qualifying', 'core_sprint',
+        'core_championshipstanding',
+    ]
+    SEASON = 2023
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.constructor = Constructor.objects.create(constructor_id='team', name='Team', nationality='Italian')
+        cls.drivers = [
+            Driver.objects.create(driver_id=f'driver{i}', first_name='Driver', last_name=str(i), nationality='British')
+            for i in range(3)
+        ]
+        cls.race = Race.objects.create(
+            race_id=f'{cls.SEASON}_1', season=cls.SEASON, round=1, race_name='Grand Prix', circuit_id='circuit',
+            circuit_name='Circuit', locality='City', country='Country', date=date(cls.SEASON, 3, 1),
+        )
+        # Laps are read from their own season partition on PostgreSQL
+        PartitionService.ensure_partitions(Lap, [cls.SEASON])
+        for position, driver in enumerate(cls.drivers, start=1):
+            common = {'race': cls.race, 'driver': driver, 'constructor': cls.constructor}
+            Result.objects.create(
+                **common, grid_position=position, final_position=position, position_text=str(position),
+                fastest_lap_time_milliseconds=90000 + position,
+            )
+            Sprint.objects.create(**common, grid_position=position, final_position=position, position_text=str(position))
+            Qualifying.objects.create(**common, position=position, q1_milliseconds=89000 + position)
+            Lap.objects.create(race=cls.race, driver=driver, lap_number=1, position=position, lap_time='1:30.000')
+            LapSeries.objects.create(race=cls.race, driver=driver, lap_times_milliseconds=[90000], positions=[position])
+            ChampionshipStanding.objects.create(
+                season=cls.SEASON, standing_type='driver', round=0, driver=driver, team=cls.constructor,
+                position=position, points=25 - position,
+            )
+        ChampionshipStanding.objects.create(
+            season=cls.SEASON, standing_type='constructor', round=0, constructor=cls.constructor, position=1, points=40,
+        )
+
+    def full_scans(self, plan):
+        """Large tables read with a full table scan in an EXPLAIN output"""
+        if connection.vendor == 'postgresql':
+            scanned = list(self.postgresql_full_scans(json.loads(plan)[0]['Plan']))
+        else:
+            # SQLite: 'SCAN table' without an index ('SEARCH' and 'SCAN table USING INDEX' use one)
+            scanned = re.findall(r'\bSCAN (?:TABLE )?(\w+)\b(?! USING)', plan)
+        return [
+            table for table in scanned
+            if any(table == large or re.fullmatch(rf'{large}_(\d+|default)', table) for large in self.LARGE_TABLES)
+        ]
+
+    def postgresql_full_scans(self, node):
+        """
+        Tables of the sequential scans and of the index scans without an
+        index condition on a full (not partial) index: the whole index is
+        walked, which the planner does when sequential scans are disabled
+        """
+        if node['Node Type'] == 'Seq Scan' or (
+            node['Node Type'] in ('Index Scan', 'Index Only Scan') and 'Index Cond' not in node
+            and not self.is_partial_index(node['Index Name'])
+        ):
+            yield node['Relation Name']
+        for child in node.get('Plans', []):
+            yield from self.postgresql_full_scans(child)
+
+    def is_partial_index(self, name):
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT indpred IS NOT NULL FROM pg_index WHERE indexrelid = to_regclass(%s)', [name])
+            row = cursor.fetchone()
+        return bool(row and row[0])
+
+    def assertUsesIndexes(self, queryset):
+        with transaction.atomic():
+            if connection.vendor == 'postgresql':
+                with connection.cursor() as cursor:
+                    cursor.execute('SET LOCAL enable_seqscan = off')
+                plan = queryset.explain(format='json')
+            else:
+                plan = queryset.explain()
+        self.assertEqual(self.full_scans(plan), [], f'Full table scan in plan of:\n{queryset.query}\n\n{plan}')
+
+    def test_detects_full_scans(self):
+        # Guards the assertion itself: status has no index
+        with self.assertRaises(AssertionError):
+            self.assertUsesIndexes(Result.objects.filter(status='dnf'))
+
+    def test_race_queries(self):
+        self.assertUsesIndexes(Result.objects.filter(race=self.race).order_by('final_position'))
+        self.assertUsesIndexes(Qualifying.objects.filter(race=self.race).order_by('position'))
+        self.assertUsesIndexes(Sprint.objects.filter(race=self.race).order_by('final_position'))
+        self.assertUsesIndexes(Lap.objects.filter(race=self.race).order_by('lap_number'))
+        self.assertUsesIndexes(LapSeries.objects.filter(race=self.race))
+        self.assertUsesIndexes(
+            Result.objects.filter(race=self.race, fastest_lap_time_milliseconds__isnull=False)
+            .order_by('fastest_lap_time_milliseconds')
+        )
+
+    def test_season_queries(self):
+        self.assertUsesIndexes(Result.objects.filter(season=self.SEASON, driver=self.drivers[0]))
+        self.assertUsesIndexes(Qualifying.objects.filter(season=self.SEASON))
+        self.assertUsesIndexes(Sprint.objects.filter(season=self.SEASON))
+        # Best finish of a driver season (DriverSeasonViewSet)
+        self.assertUsesIndexes(
+            Result.objects.filter(driver=self.drivers[0], season=self.SEASON, final_position__isnull=False)
+            .order_by('final_position').values('final_position')[:1]
+        )
+
+    def test_win_and_podium_queries(self):
+        self.assertUsesIndexes(
+            Result.objects.filter(final_position=1).values('driver').annotate(wins=Count('id')).order_by()
+        )
+        self.assertUsesIndexes(Result.objects.filter(final_position=1, driver=self.drivers[0]))
+        self.assertUsesIndexes(Result.objects.filter(final_position__in=[1, 2, 3], driver=self.drivers[0]))
+
+    def test_final_standing_queries(self):
+        driver_ids = [driver.id for driver in self.drivers]
+        # Season totals prefetched for driver seasons and read for career stats
+        self.assertUsesIndexes(
+            ChampionshipStanding.objects.filter(standing_type='driver', round=0, driver_id__in=driver_ids)
+        )
+        self.assertUsesIndexes(
+            ChampionshipStanding.objects.filter(standing_type='driver', round=0, driver_id__in=driver_ids)
+            .values('driver').annotate(best=Count('position')).order_by()
+        )
+        # Constructor season totals (ConstructorSerializer)
+        self.assertUsesIndexes(
+            ChampionshipStanding.objects.filter(
+                season=self.SEASON, standing_type='constructor', round=0, constructor_id__in=[self.constructor.id]
+            )
+        )
+        self.assertUsesIndexes(
+            ChampionshipStanding.objects.filter(season=self.SEASON, standing_type='driver').order_by('-round', 'position')
+        )
+
+
+class LapPartitionTests(TestCase):
+    """
+    Laps can be written for any season. On PostgreSQL, seasons without a
+    partition land in the default partition until ensure_partitions moves
+    them to their own.
+    """
+
+    SEASON = 2031
+
+    def setUp(self):
+        self.driver = Driver.objects.create(driver_id='driver', first_name='Driver', last_name='One', nationality='British')
+        self.race = Race.objects.create(
+            race_id=f'{self.SEASON}_1', season=self.SEASON, round=1, race_name='Grand Prix', circuit_id='circuit',
+            circuit_name='Circuit', locality='City', country='Country', date=date(self.SEASON, 3, 1),
+        )
+
+    def partition_rows(self, partition):
+        with connection.cursor() as cursor:
+            cursor.execute(f'SELECT COUNT(*) FROM {connection.ops.quote_name(partition)}')
+            return cursor.fetchone()[0]
+
+    def test_lap_for_new_season(self):
+        Lap.objects.create(race=self.race, driver=self.driver, lap_number=1, position=1, lap_time='1:30.000')
+        Lap.objects.bulk_create([
+            Lap(race=self.race, driver=self.driver, lap_number=2, position=1, lap_time='1:29.000', season=self.SEASON),
+        ])
+        self.assertEqual(Lap.objects.filter(season=self.SEASON).count(), 2)
+
+        if PartitionService.is_partitioned(Lap):
+            PartitionService.ensure_partitions(Lap, [self.SEASON])
+            self.assertEqual(self.partition_rows(PartitionService.partition_name(Lap, self.SEASON)), 2)
+            self.assertEqual(self.partition_rows(PartitionService.default_partition_name(Lap)), 0)
+
+        self.assertEqual(Lap.objects.filter(season=self.SEASON).count(), 2)
+        self.assertEqual(PartitionService.truncate_season(Lap, self.SEASON), 2)
+        self.assertFalse(Lap.objects.filter(season=self.SEASON).exists())
+
+    def test_truncate_season_without_partition(self):
+        Lap.objects.create(race=self.race, driver=self.driver, lap_number=1, position=1, lap_time='1:30.000')
+        self.assertEqual(PartitionService.truncate_season(Lap, self.SEASON), 1)
+        self.assertFalse(Lap.objects.filter(season=self.SEASON).exists())
+
+
+class LapSeriesTests(TestCase):
+    """
+    Lap series are stored as integer arrays (native on PostgreSQL) and read
+    back as lists, with None for laps without timing data.
+    """
+
+    SEASON = 2031
+
+    def setUp(self):
+        self.driver = Driver.objects.create(driver_id='driver', first_name='Driver', last_name='One', nationality='British')
+        self.race = Race.objects.create(
+            race_id=f'{self.SEASON}_1', season=self.SEASON, round=1, race_name='Grand Prix', circuit_id='circuit',
+            circuit_name='Circuit', locality='City', country='Country', date=date(self.SEASON, 3, 1),
+        )
+
+    def test_build_lap_series(self):
+        for lap_number, position, lap_time, milliseconds in [(1, 3, '1:30.000', 90000), (3, 1, '1:29.500', 89500)]:
+            Lap.objects.create(
+                race=self.race, driver=self.driver, lap_number=lap_number, position=position,
+                lap_time=lap_time, lap_time_milliseconds=milliseconds,
+            )
+
+        self.assertEqual(LapImportService.build_lap_series({self.race.id})['created'], 1)
+        series = LapSeries.objects.get(race=self.race, driver=self.driver)
+        self.assertEqual(series.positions, [3, None, 1])
+        self.assertEqual(series.lap_times_milliseconds, [90000, None, 89500])
+        self.assertEqual(LapSeries.objects.filter(positions=[3, None, 1]).count(), 1)
+
+        self.assertEqual(LapImportService.build_lap_series({self.race.id})['unchanged'], 1)
+        Lap.objects.filter(race=self.race, lap_number=3).update(position=2)
+        self.assertEqual(LapImportService.build_lap_series({self.race.id})['updated'], 1)
+        self.assertEqual(LapSeries.objects.get(race=self.race, driver=self.driver).positions, [3, None, 2])
+
+
+class ChampionshipStandingsTests(TestCase):
+    """
+    Season standings calculated from a small season with known totals:
+    a late entrant (C from round 2), a retirement (B in round 3) and a tie
+    on points decided by wins (B and C on 33 after round 3, C has a win).
+    """
+
+    SEASON = 2032
+
+    # Round -> (driver, constructor, finishing position, points)
+    RESULTS = {
+        1: [('a', 'x', 1, 25), ('b', 'y', 2, 18)],
+        2: [('c', 'y', 1, 25), ('a', 'x', 2, 18), ('b', 'y', 3, 15)],
+        3: [('a', 'x', 1, 25), ('c', 'y', 6, 8), ('b', 'y', None, 0)],
+    }
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.drivers = {
+            key: Driver.objects.create(driver_id=key, first_name='Driver', last_name=key.upper(), nationality='British')
+            for key in ('a', 'b', 'c')
+        }
+        cls.constructors = {
+            key: Constructor.objects.create(constructor_id=key, name=key.upper(), nationality='Italian')
+            for key in ('x', 'y')
+        }
+        cls.races = {}
+        for round_num, results in cls.RESULTS.items():
+            race = Race.objects.create(
+                race_id=f'{cls.SEASON}_{round_num}', season=cls.SEASON, round=round_num, race_name='Grand Prix',
+                circuit_id='circuit', circuit_name='Circuit', locality='City', country='Country',
+                date=date(cls.SEASON, 3, round_num),
+            )
+            cls.races[round_num] = race
+            for driver, constructor, position, points in results:
+                Result.objects.create(
+                    race=race, driver=cls.drivers[driver], constructor=cls.constructors[constructor],
+                    grid_position=1, final_position=position, position_text=str(position or 'R'), points=points,
+                )
+
+    def summary(self, standings, standing_type):
+        """(key, points, wins) in standing order, checking positions are 1..n"""
+        entities = self.drivers if standing_type == 'driver' else self.constructors
+        ids = {entity.id: key for key, entity in entities.items()}
+        id_field = f'{standing_type}_id'
+        self.assertEqual([standing['position'] for standing in standings], list(range(1, len(standings) + 1)))
+        return [(ids[standing[id_field]], standing['points'], standing['wins']) for standing in standings]
+
+    def test_season_standings(self):
+        standings = ChampionshipService.calculate_season_standings(self.SEASON)
+        self.assertEqual(sorted(standings), [0, 1, 2, 3])
+
+        self.assertEqual(self.summary(standings[1]['driver'], 'driver'), [('a', 25, 1), ('b', 18, 0)])
+        self.assertEqual(
+            self.summary(standings[2]['driver'], 'driver'), [('a', 43, 1), ('b', 33, 0), ('c', 25, 1)]
+        )
+        self.assertEqual(
+            self.summary(standings[3]['driver'], 'driver'), [('a', 68, 2), ('c', 33, 1), ('b', 33, 0)]
+        )
+        self.assertEqual(self.summary(standings[2]['constructor'], 'constructor'), [('y', 58, 1), ('x', 43, 1)])
+        self.assertEqual(self.summary(standings[3]['constructor'], 'constructor'), [('x', 68, 2), ('y', 66, 1)])
+        self.assertEqual(standings[0], standings[3])
+
+        # Drivers carry the constructor of their latest race
+        teams = {standing['driver_id']: standing['constructor_id'] for standing in standings[3]['driver']}
+        self.assertEqual(teams[self.drivers['c'].id], self.constructors['y'].id)
+
+        # Same totals and order as the SQL aggregates
+        for round_num in (1, 2, 3):
+            for standing_type, calculate in [
+                ('driver', ChampionshipService.calculate_driver_standings),
+                ('constructor', ChampionshipService.calculate_constructor_standings),
+            ]:
+                self.assertEqual(
+                    self.summary(standings[round_num][standing_type], standing_type),
+                    self.summary(calculate(self.SEASON, round_num), standing_type),
+                )
+
+    def stored_standings(self):
+        return list(
+            ChampionshipStanding.objects
+            .filter(season=self.SEASON)
+            .order_by('standing_type', 'round', 'position')
+            .values_list('standing_type', 'round', 'position', 'driver_id', 'constructor_id', 'team_id', 'points', 'wins')
+        )
+
+    def assertUpdateMatchesRecalculation(self, round_num):
+        """update_standings_for_round runs incrementally and stores what a full recalculation stores"""
+        with self.assertLogs('core.services.championship_service', 'INFO') as logs:
+            ChampionshipService.update_standings_for_round(self.SEASON, round_num)
+        self.assertIn(f'Updating standings for season {self.SEASON} from round {round_num}', '\n'.join(logs.output))
+        updated = self.stored_standings()
+
+        ChampionshipService.recalculate_all_standings(self.SEASON)
+        self.assertEqual(updated, self.stored_standings())
+        return updated
+
+    def test_round_update_matches_recalculation(self):
+        ChampionshipService.recalculate_all_standings(self.SEASON)
+
+        # Round 2 corrected: B won and C finished third
+        for driver, position, points in [('b', 1, 25), ('c', 3, 15)]:
+            result = Result.objects.get(race=self.races[2], driver=self.drivers[driver])
+            result.final_position, result.position_text, result.points = position, str(position), points
+            result.save()
+
+        self.assertUpdateMatchesRecalculation(2)
+        standings = ChampionshipService.calculate_season_standings(self.SEASON)
+        # Tied on points and wins after round 2: ordered by id
+        self.assertEqual(
+            self.summary(standings[2]['driver'], 'driver'), [('a', 43, 1), ('b', 43, 1), ('c', 15, 0)]
+        )
+        self.assertEqual(
+            self.summary(standings[3]['driver'], 'driver'), [('a', 68, 2), ('b', 43, 1), ('c', 23, 0)]
+        )
+
+    def test_round_update_with_late_entrant(self):
+        ChampionshipService.recalculate_all_standings(self.SEASON)
+
+        driver = Driver.objects.create(driver_id='d', first_name='Driver', last_name='D', nationality='British')
+        Result.objects.create(
+            race=self.races[3], driver=driver, constructor=self.constructors['x'],
+            grid_position=4, final_position=4, position_text='4', points=12,
+        )
+
+        self.assertUpdateMatchesRecalculation(3)
+        self.assertEqual(
+            ChampionshipStanding.objects.get(season=self.SEASON, round=0, driver=driver).points, 12
+        )
+        self.assertEqual(
+            ChampionshipStanding.objects.get(season=self.SEASON, round=0, constructor=self.constructors['x']).points, 80
+        )
+
+    def expected_career_stats(self):
+        """Career stats of every driver counted from their results, season totals and seasons"""
+        expected = {}
+        for driver in Driver.objects.all():
+            results = Result.objects.filter(driver=driver)
+            finishes = ChampionshipStanding.objects.filter(driver=driver, standing_type='driver', round=0)
+            positions = list(finishes.values_list('position', flat=True))
+            expected[driver.driver_id] = {
+                'total_wins': results.filter(final_position=1).count(),
+                'total_podiums': results.filter(final_position__lte=3).count(),
+                'world_championships': positions.count(1),
+                'total_seasons': DriverSeason.objects.filter(driver=driver).values('season').distinct().count(),
+                'best_championship_finish': min(positions, default=None),
+                'career_points': float(sum(results.values_list('points', flat=True))),
+            }
+        return expected
+
+    def stored_career_stats(self):
+        return {
+            stats.driver.driver_id: {field: getattr(stats, field) for field in CareerStatsService.STAT_FIELDS}
+            for stats in DriverCareerStats.objects.select_related('driver')
+        }
+
+    def test_career_stats_follow_season_updates(self):
+        # An earlier season won by B, with C second
+        race = Race.objects.create(
+            race_id=f'{self.SEASON - 1}_1', season=self.SEASON - 1, round=1, race_name='Grand Prix',
+            circuit_id='circuit', circuit_name='Circuit', locality='City', country='Country',
+            date=date(self.SEASON - 1, 3, 1),
+        )
+        for driver, position, points in [('b', 1, 25), ('c', 2, 18)]:
+            Result.objects.create(
+                race=race, driver=self.drivers[driver], constructor=self.constructors['y'],
+                grid_position=1, final_position=position, position_text=str(position), points=points,
+            )
+        for year, drivers in [(self.SEASON - 1, 'bc'), (self.SEASON, 'abc')]:
+            season = Season.objects.create(year=year)
+            for driver in drivers:
+                DriverSeason.objects.create(
+                    driver=self.drivers[driver], season=season, constructor=self.constructors['y'],
+                )
+
+        ChampionshipService.recalculate_all_standings(self.SEASON - 1)
+        ChampionshipService.recalculate_all_standings(self.SEASON)
+        stored = self.stored_career_stats()
+        self.assertEqual(stored, self.expected_career_stats())
+        self.assertEqual(
+            [(stored[driver]['world_championships'], stored[driver]['total_seasons']) for driver in 'abc'],
+            [(1, 1), (1, 2), (0, 2)],
+        )
+
+        # Round 3 corrected: B finished second instead of retiring
+        result = Result.objects.get(race=self.races[3], driver=self.drivers['b'])
+        result.final_position, result.position_text, result.points = 2, '2', 18
+        result.save()
+        ChampionshipService.update_standings_for_round(self.SEASON, 3)
+        stored = self.stored_career_stats()
+        self.assertEqual(stored, self.expected_career_stats())
+        self.assertEqual((stored['b']['total_podiums'], stored['b']['career_points']), (4, 76.0))
+
+
+class ErgastDumpTests(TestCase):
+    """
+    Loading an Ergast CSV dump, including the shared drives of the 1950s
+    (a driver with one results.csv row per car in the same race).
+    """
+
+    RESULT_COLUMNS = [
+        'resultId', 'raceId', 'driverId', 'constructorId', 'number', 'grid', 'position', 'positionText',
+        'positionOrder', 'points', 'laps', 'time', 'milliseconds', 'fastestLap', 'rank', 'fastestLapTime',
+        'fastestLapSpeed', 'statusId',
+    ]
+
+    def write_csv(self, name, header, rows):
+        with open(self.path / name, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(header)
+            writer.writerows(rows)
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = Path(directory.name)
+
+        self.write_csv(
+            'drivers.csv', ['driverId', 'driverRef', 'number', 'code', 'forename', 'surname', 'dob', 'nationality', 'url'],
+            [
+                ['1', 'fangio', '\\N', '\\N', 'Juan', 'Fangio', '1911-06-24', 'Argentine', ''],
+                ['2', 'farina', '\\N', '\\N', 'Nino', 'Farina', '1906-10-30', 'Italian', ''],
+            ],
+        )
+        self.write_csv(
+            'constructors.csv', ['constructorId', 'constructorRef', 'name', 'nationality', 'url'],
+            [['1', 'alfa', 'Alfa Romeo', 'Italian', '']],
+        )
+        self.write_csv(
+            'races.csv', ['raceId', 'year', 'round', 'circuitId', 'name', 'date', 'time', 'url'],
+            [['1', '1951', '4', '1', 'French Grand Prix', '1951-07-01', '\\N', '']],
+        )
+        self.write_csv('status.csv', ['statusId', 'status'], [['1', 'Finished'], ['2', 'Engine']])
+        # Fangio retired his own car, then won in the car he took over
+        self.write_csv('results.csv', self.RESULT_COLUMNS, [
+            ['1', '1', '1', '1', '8', '1', '\\N', 'R', '10', '0', '20', '\\N', '\\N', '\\N', '\\N', '\\N', '\\N', '2'],
+            ['2', '1', '2', '1', '4', '2', '2', '2', '2', '6', '77', '\\N', '\\N', '\\N', '\\N', '\\N', '\\N', '1'],
+            ['3', '1', '1', '1', '6', '7', '1', '1', '1', '5', '77', '\\N', '\\N', '\\N', '\\N', '\\N', '\\N', '1'],
+        ])
+
+    def load(self):
+        loader = ErgastDumpLoader(self.path, log=lambda message: None)
+        try:
+            return loader.load(laps=False)
+        finally:
+            loader.close()
+
+    def test_shared_drives(self):
+        stats = self.load()
+        self.assertEqual(stats['results']['created'], 2)
+
+        fangio = Result.objects.get(season=1951, driver__driver_id='fangio')
+        self.assertEqual((fangio.final_position, fangio.points, fangio.laps_completed), (1, 5, 77))
+        self.assertEqual(Result.objects.get(season=1951, driver__driver_id='farina').points, 6)
+
+        self.assertEqual(self.load()['results'], {'created': 0, 'updated': 0, 'unchanged': 2})
+
+
+class FakeErgastAPI:
+    """
+    Stands in for the HTTP session of F1DataService: serves paged Ergast
+    responses (limit/offset over the nested rows, like the real API) from
+    fixture data, and records the requested endpoints.
+    """
+
+    ITEM_KEYS = {'results': 'Results', 'qualifying': 'QualifyingResults', 'sprint': 'SprintResults', 'laps': 'Laps'}
+
+    def __init__(self, season, drivers, constructors, races):
+        self.season = season
+        self.drivers = drivers
+        self.constructors = constructors
+        self.races = races
+        self.requests = []
+
+    def close(self):
+        pass
+
+    def get(self, url, params=None, timeout=None):
+        endpoint = url[len(settings.F1_API_BASE_URL) + 1:-len('.json')]
+        self.requests.append(endpoint)
+        params = params or {}
+        limit, offset = int(params.get('limit', 30)), int(params.get('offset', 0))
+
+        parts = endpoint.split('/')
+        if parts[-1] in ('drivers', 'constructors'):
+            rows = self.drivers if parts[-1] == 'drivers' else self.constructors
+            key = parts[-1].capitalize()
+            total, body = len(rows), {f'{key[:-1]}Table': {key: rows[offset:offset + limit]}}
+        elif len(parts) == 1:
+            races = [self.race_info(race) for race in self.races]
+            total, body = len(races), {'RaceTable': {'Races': races[offset:offset + limit]}}
+        else:
+            item_key = self.ITEM_KEYS[parts[-1]]
+            round_num = int(parts[1]) if len(parts) == 3 else None
+            rows = [
+                (race, item) for race in self.races if round_num in (None, int(race['round']))
+                for item in race.get(item_key, [])
+            ]
+            races = []
+            for race, item in rows[offset:offset + limit]:
+                if races and races[-1]['round'] == race['round']:
+                    races[-1][item_key].append(item)
+                else:
+                    races.append({**self.race_info(race), item_key: [item]})
+            total, body = len(rows), {'RaceTable': {'Races': races}}
+
+        response = requests.Response()
+        response.status_code = 200
+        response.url = url
+        response.headers['Content-Type'] = 'application/json; charset=utf-8'
+        mr_data = {'limit': str(limit), 'offset': str(offset), 'total': str(total), **body}
+        response._content = json.dumps({'MRData': mr_data}).encode()
+        return response
+
+    def race_info(self, race):
+        return {key: value for key, value in race.items() if key not in self.ITEM_KEYS.values()}
+
+
+def ergast_driver(driver_id, given_name, family_name):
+    return {
+        'driverId': driver_id, 'givenName': given_name, 'familyName': family_name,
+        'dateOfBirth': '1911-06-24', 'nationality': 'Argentine', 'url': '',
+    }
+
+
+def ergast_race(round_num, race_date, results):
+    return {
+        'season': '1951', 'round': str(round_num), 'raceName': f'Grand Prix {round_num}', 'url': '',
+        'Circuit': {'circuitId': f'circuit{round_num}', 'circuitName': 'Circuit', 'Location': {'locality': 'City', 'country': 'Country'}},
+        'date': race_date, 'Results': results,
+    }
+
+
+def ergast_result(driver, position, position_text, points, laps, status='Finished'):
+    return {
+        'position': str(position), 'positionText': position_text, 'points': str(points), 'grid': '1',
+        'laps': str(laps), 'status': status, 'Driver': driver, 'Constructor': ALFA,
+    }
+
+
+FANGIO = ergast_driver('fangio', 'Juan', 'Fangio')
+FARINA = ergast_driver('farina', 'Nino', 'Farina')
+ALFA = {'constructorId': 'alfa', 'name': 'Alfa Romeo', 'nationality': 'Italian', 'url': ''}
+
+
+@override_settings(F1_API_CACHE_ENABLED=False, F1_API_MAX_WORKERS=1)
+class ImportCommandTests(TestCase):
+    """
+    import_f1_data against a fake API serving a historic season, where
+    Fangio shared a car in round 1 (two results for the same race).
+    """
+
+    SEASON = 1951
+
+    def setUp(self):
+        self.api = FakeErgastAPI(
+            self.SEASON, [FANGIO, FARINA], [ALFA],
+            [
+                ergast_race(1, '1951-05-27', [
+                    ergast_result(FARINA, 1, '1', 9, 42),
+                    ergast_result(FANGIO, 2, '2', 3, 42),
+                    ergast_result(FANGIO, 9, 'R', 0, 10, status='Engine'),
+                ]),
+                ergast_race(2, '1951-07-01', []),
+            ],
+        )
+        patcher = mock.patch.object(F1DataService, '_create_session', return_value=self.api)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def run_import(self, *args):
+        out = StringIO()
+        call_command('import_f1_data', '--season', str(self.SEASON), *args, stdout=out)
+        return out.getvalue()
+
+    def stored_rows(self):
+        """Every imported row with its updated_at, and the season data version"""
+        rows = {
+            model.__name__: sorted(model.objects.values_list('id', 'updated_at'))
+            for model in (Driver, Constructor, Race, Result, Qualifying, Sprint)
+        }
+        return rows, SeasonCacheService.get_version(self.SEASON)
+
+    def test_second_import_only_fetches_after_the_high_water_mark(self):
+        self.run_import()
+        self.assertIn('1951/results', self.api.requests)
+        stored = self.stored_rows()
+
+        # Nothing new: round 1 is not requested again and nothing is written
+        self.api.requests = []
+        output = self.run_import()
+        self.assertIn('Results imported up to round 1, fetching 2', output)
+        self.assertIn('Drivers: unchanged since last import, skipped', output)
+        self.assertNotIn('1951/results', self.api.requests)
+        self.assertIn('1951/2/results', self.api.requests)
+        self.assertEqual(self.stored_rows(), stored)
+
+        # Round 2 published: only its results are written
+        self.api.races[1]['Results'] = [ergast_result(FANGIO, 1, '1', 9, 77), ergast_result(FARINA, 2, '2', 6, 77)]
+        self.api.requests = []
+        self.run_import()
+        self.assertNotIn('1951/results', self.api.requests)
+        results = Result.objects.filter(season=self.SEASON)
+        self.assertEqual(results.filter(race__round=2).count(), 2)
+        self.assertEqual(
+            sorted(results.filter(race__round=1).values_list('id', 'updated_at')),
+            stored[0]['Result'],
+        )
+
+    def test_dry_run_writes_nothing(self):
+        output = self.run_import('--dry-run')
+        self.assertIn('nothing was written', output)
+        self.assertIn('Results: 2 to insert, 0 to update, 0 unchanged', output)
+        # Not even the shared request budget or the import state
+        for model in (Driver, Race, Result, ImportState, RateLimitBucket, SeasonDataVersion):
+            self.assertFalse(model.objects.exists(), model.__name__)
+
+        self.run_import()
+        stored = self.stored_rows(), list(RateLimitBucket.objects.values_list('tokens', 'updated_at'))
+        checked = list(ImportState.objects.values_list('checked_at', flat=True))
+
+        self.api.races[0]['Results'][0]['points'] = '10'
+        output = self.run_import('--full', '--dry-run')
+        self.assertIn('Results: 0 to insert, 1 to update, 1 unchanged', output)
+        self.assertIn("~ round 1 / farina: points 9.0 → 10.0", output)
+        self.assertEqual((self.stored_rows(), list(RateLimitBucket.objects.values_list('tokens', 'updated_at'))), stored)
+        self.assertEqual(list(ImportState.objects.values_list('checked_at', flat=True)), checked)
+
+    def test_shared_drives(self):
+        self.run_import()
+        fangio = Result.objects.get(season=self.SEASON, race__round=1, driver__driver_id='fangio')
+        self.assertEqual((fangio.final_position, fangio.points, fangio.laps_completed), (2, 3, 42))
+        self.assertEqual(Result.objects.filter(season=self.SEASON).count(), 2)
+
+
+def api_response(status_code, headers=None, data=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response.url = f'{settings.F1_API_BASE_URL}/1951/results.json'
+    response.headers.update({'Content-Type': 'application/json', **(headers or {})})
+    response._content = json.dumps(data or {}).encode()
+    return response
+
+
+@override_settings(
+    F1_API_CACHE_ENABLED=False, F1_API_MAX_RETRIES=2, F1_API_BACKOFF_FACTOR=1, F1_API_MAX_RETRY_AFTER=30,
+)
+class F1DataServiceTests(TestCase):
+    """
+    Retries of F1DataService requests, against a mocked session: backoff on
+    connection errors and 5xx, Retry-After honoured up to F1_API_MAX_RETRY_AFTER.
+    """
+
+    def setUp(self):
+        self.rate_limiter = mock.Mock(acquire=mock.Mock(return_value=0))
+        self.service = F1DataService(rate_limiter=self.rate_limiter)
+        self.service.session = mock.Mock()
+        sleep = mock.patch('core.services.f1_api_service.time.sleep')
+        self.sleep = sleep.start()
+        self.addCleanup(sleep.stop)
+        # No jitter: backoff is exactly 1s, 2s, ...
+        jitter = mock.patch('core.services.f1_api_service.random.uniform', return_value=0)
+        jitter.start()
+        self.addCleanup(jitter.stop)
+
+    def respond(self, *responses):
+        self.service.session.get.side_effect = responses
+
+    def test_retries_with_backoff(self):
+        self.respond(requests.exceptions.ConnectionError('reset'), api_response(503), api_response(200, data={'ok': 1}))
+        self.assertEqual(self.service._make_request('1951/results'), {'ok': 1})
+        self.assertEqual(self.sleep.call_args_list, [mock.call(1), mock.call(2)])
+        self.rate_limiter.pause.assert_not_called()
+        stats = self.service.get_request_stats()
+        self.assertEqual((stats['requests'], stats['retries'], stats['failures']), (3, 2, 0))
+
+        # Still failing after the last retry
+        self.respond(*(api_response(500) for _ in range(3)))
+        with self.assertRaises(F1APIError):
+            self.service._make_request('1951/results')
+
+    def test_retry_after_is_honoured_up_to_the_ceiling(self):
+        self.respond(api_response(429, {'Retry-After': '30'}), api_response(200, data={'ok': 1}))
+        self.assertEqual(self.service._make_request('1951/results'), {'ok': 1})
+        self.sleep.assert_called_once_with(30)
+        # Every thread sharing the limiter waits too
+        self.rate_limiter.pause.assert_called_once_with(30)
+
+    def test_rate_limit_error_above_the_ceiling(self):
+        self.respond(api_response(429, {'Retry-After': '31'}))
+        with self.assertRaises(F1APIRateLimitError) as error:
+            self.service._make_request('1951/results')
+        self.assertEqual(error.exception.retry_after, 31)
+        self.assertEqual(self.service.session.get.call_count, 1)
+        self.sleep.assert_not_called()
+
+        # Rate limited on every attempt, without Retry-After
+        self.respond(*(api_response(429) for _ in range(3)))
+        with self.assertRaises(F1APIRateLimitError) as error:
+            self.service._make_request('1951/results')
+        self.assertIsNone(error.exception.retry_after)
+
+    @override_settings(F1_API_PAGE_SIZE=2, F1_API_MAX_WORKERS=2)
+    def test_races_split_across_pages(self):
+        api = FakeErgastAPI(1951, [], [], [
+            ergast_race(1, '1951-05-27', [
+                ergast_result(FARINA, 1, '1', 9, 42),
+                ergast_result(FANGIO, 2, '2', 6, 42),
+                ergast_result(FANGIO, 9, 'R', 0, 10, status='Engine'),
+            ]),
+            ergast_race(2, '1951-07-01', [ergast_result(FANGIO, 1, '1', 9, 77), ergast_result(FARINA, 2, '2', 6, 77)]),
+        ])
+        service = F1DataService(rate_limiter=self.rate_limiter)
+        service.session = api
+
+        # 5 results over 3 pages of 2: both races are split
+        results = service.fetch_season_results(1951)
+        self.assertEqual(len(api.requests), 3)
+        drivers = {
+            round_num: [(row['Driver']['driverId'], row['positionText']) for row in rows]
+            for round_num, rows in results.items()
+        }
+        self.assertEqual(
+            drivers,
+            {1: [('farina', '1'), ('fangio', '2'), ('fangio', 'R')], 2: [('fangio', '1'), ('farina', '2')]},
+        )
+        self.assertEqual(len(list(service.iter_races('1951/results', 'Results'))), 2)
+
+
+class BulkServiceTests(TestCase):
+    """
+    BulkService.sync writes new and changed rows only and reports what it did.
+    """
+
+    def drivers(self, **nationalities):
+        return [
+            Driver(driver_id=driver_id, first_name='Driver', last_name=driver_id, nationality=nationality)
+            for driver_id, nationality in nationalities.items()
+        ]
+
+    def sync(self, objs):
+        return BulkService.sync(Driver, objs, ['driver_id'], ['nationality', 'updated_at'])
+
+    def test_sync_writes_changed_rows_only(self):
+        result = self.sync(self.drivers(one='British', two='British'))
+        self.assertEqual([len(result[key]) for key in ('created', 'updated', 'unchanged')], [2, 0, 0])
+        stored = dict(Driver.objects.values_list('driver_id', 'updated_at'))
+
+        result = self.sync(self.drivers(one='British', two='German', three='Italian'))
+        self.assertEqual([len(result[key]) for key in ('created', 'updated', 'unchanged')], [1, 1, 1])
+        self.assertEqual([obj.driver_id for obj in result['updated']], ['two'])
+
+        # The unchanged row is not written at all
+        after = dict(Driver.objects.values_list('driver_id', 'updated_at'))
+        self.assertEqual(after['one'], stored['one'])
+        self.assertGreater(after['two'], stored['two'])
+        self.assertEqual(Driver.objects.get(driver_id='two').nationality, 'German')
+
+    def test_diff_normalizes_incoming_values(self):
+        self.sync(self.drivers(one='British'))
+        Driver.objects.filter(driver_id='one').update(date_of_birth=date(1911, 6, 24))
+
+        # API values are strings: compared with the stored date after to_python()
+        objs = self.drivers(one='British')
+        objs[0].date_of_birth = '1911-06-24'
+        new_objs, changed_objs, unchanged_objs = BulkService.diff(
+            Driver, objs, ['driver_id'], ['nationality', 'date_of_birth', 'updated_at']
+        )
+        self.assertEqual((new_objs, changed_objs, unchanged_objs), ([], [], objs))
+
+    def test_preview_reports_orphans_in_scope(self):
+        self.sync(self.drivers(one='British', two='British', other='British'))
+
+        result = BulkService.preview(
+            Driver, self.drivers(one='German', three='Italian'), ['driver_id'], ['nationality', 'updated_at'],
+            scope={'driver_id__in': ['one', 'two', 'three']},
+        )
+        self.assertEqual([obj.driver_id for obj in result['created']], ['three'])
+        self.assertEqual(
+            [(obj.driver_id, changes) for obj, changes in result['updated']],
+            [('one', {'nationality': ('British', 'German')})],
+        )
+        # Stored rows outside the scope are never orphaned
+        self.assertEqual(result['orphaned'], [('two',)])
+        self.assertEqual(Driver.objects.filter(nationality='British').count(), 3)
+
+    def test_duplicate_keys(self):
+        # One upsert statement cannot write a row twice: the last object wins
+        objs = self.drivers(one='British') + self.drivers(one='German')
+        result = self.sync(objs)
+        self.assertEqual(len(result['created']), 1)
+        self.assertEqual(Driver.objects.get(driver_id='one').nationality, 'German')
+
+
+class SeasonCacheTests(TestCase):
+    """
+    Cached season data is keyed on the data version stored in the database,
+    so a bump from another process (an import) invalidates it everywhere.
+    """
+
+    def setUp(self):
+        cache.clear()
+
+    def test_bump_invalidates_cached_data(self):
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return len(calls)
+
+        self.assertEqual(SeasonCacheService.get_version(2023), 0)
+        self.assertEqual(SeasonCacheService.get_or_compute('test', 2023, (), compute), 1)
+        self.assertEqual(SeasonCacheService.get_or_compute('test', 2023, (), compute), 1)
+
+        SeasonCacheService.bump_version(2023)
+        self.assertEqual(SeasonCacheService.get_version(2023), 1)
+        self.assertEqual(SeasonCacheService.get_or_compute('test', 2023, (), compute), 2)
+
+        # Bumped by another process: only the database row changes
+        SeasonDataVersion.objects.filter(season=2023).update(version=5)
+        self.assertEqual(SeasonCacheService.get_or_compute('test', 2023, (), compute), 3)
+        self.assertEqual(SeasonCacheService.get_or_compute('test', 2022, (), compute), 4)
+
+
+class RateLimiterTests(TestCase):
+    """
+    The hourly request budget is kept in the database, so limiters of
+    different processes draw from the same tokens.
+    """
+
+    def test_hourly_budget_is_shared(self):
+        # Two processes with a budget of 2 requests per hour
+        first, second = (DatabaseTokenBucket('test', rate=2 / 3600, capacity=2) for _ in range(2))
+        self.assertEqual(first.reserve(0), 0)
+        self.assertEqual(second.reserve(0), 0)
+        self.assertAlmostEqual(first.reserve(0), 1800, delta=1)
+        self.assertAlmostEqual(second.reserve(0), 3600, delta=1)
+
+        # Refilled over time, never above the capacity
+        bucket = RateLimitBucket.objects.get(name='test')
+        bucket.refilled_at -= timedelta(hours=3)
+        bucket.save()
+        self.assertEqual(first.reserve(0), 0)
+        self.assertEqual(RateLimitBucket.objects.get(name='test').tokens, 1)
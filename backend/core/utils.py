@@ -0,0 +1,109 @@
+"""
+Shared parsing helpers for F1 data.
+"""
+
+from itertools import groupby
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+
+def parse_lap_time(value: Optional[str]) -> Optional[int]:
+    """
+    Convert a lap or qualifying time to milliseconds.
+
+    Accepts the API formats 'm:ss.SSS' and 'ss.SSS' (and 'h:mm:ss.SSS').
+
+    Args:
+        value: Time string as returned by the API
+
+    Returns:
+        Time in milliseconds, or None if the value is empty or malformed
+    """
+    if not value:
+        return None
+
+    try:
+        parts = value.strip().split(':')
+        seconds = float(parts[-1])
+        minutes = int(parts[-2]) if len(parts) > 1 else 0
+        hours = int(parts[-3]) if len(parts) > 2 else 0
+    except ValueError:
+        return None
+
+    if len(parts) > 3 or seconds < 0 or minutes < 0 or hours < 0:
+        return None
+
+    return round((hours * 3600 + minutes * 60 + seconds) * 1000)
+
+
+def parse_result_status(status_text: Optional[str]) -> str:
+    """
+    Map an API status text (e.g. 'Finished', '+1 Lap', 'Engine') to a
+    Result/Sprint status.
+
+    Args:
+        status_text: Status as returned by the API
+
+    Returns:
+        One of the model STATUS_CHOICES keys
+    """
+    status_text = (status_text or '').lower()
+    if 'retire' in status_text or 'engine' in status_text or 'collision' in status_text:
+        return 'retired'
+    if 'disqualif' in status_text:
+        return 'dsq'
+    return 'finished'
+
+
+def group_lap_series(laps: Iterable[Tuple[int, int, int, int, Optional[int]]]) -> Iterator[Tuple[int, int, List, List]]:
+    """
+    Group lap rows into one lap time array and one position array per driver and race.
+
+    Element i of each array is lap i + 1; laps missing from the input are None.
+
+    Args:
+        laps: (race_id, driver_id, lap_number, position, lap_time_milliseconds)
+            tuples ordered by race and driver
+
+    Yields:
+        (race_id, driver_id, lap_times_milliseconds, positions) tuples
+    """
+    for (race_id, driver_id), rows in groupby(laps, key=lambda lap: (lap[0], lap[1])):
+        times, positions = [], []
+        for _, _, lap_number, position, milliseconds in rows:
+            if lap_number > len(times):
+                missing = lap_number - len(times)
+                times.extend([None] * missing)
+                positions.extend([None] * missing)
+            times[lap_number - 1] = milliseconds
+            positions[lap_number - 1] = position
+        yield race_id, driver_id, times, positions
+
+
+def merge_shared_drives(results: Iterable) -> Iterator:
+    """
+    Collapse the rows of a driver who drove more than one car in a race
+    (shared drives, common until the late 1950s) into one row per race and driver.
+
+    The best-classified row is kept (a finishing position before none, then
+    the most laps) and credited with the points of all the driver's rows,
+    which is how they counted for the championship.
+
+    Args:
+        results: Unsaved Result (or Sprint) instances, with the rows of each
+            race consecutive
+
+    Yields:
+        One instance per race and driver, in order of first appearance
+    """
+    for _, race_results in groupby(results, key=lambda result: result.race_id):
+        by_driver = {}
+        for result in race_results:
+            by_driver.setdefault(result.driver_id, []).append(result)
+
+        for rows in by_driver.values():
+            best = min(rows, key=lambda row: (
+                row.final_position is None, row.final_position or 0, -(row.laps_completed or 0)
+            ))
+            if len(rows) > 1:
+                best.points = sum(row.points or 0 for row in rows)
+            yield best
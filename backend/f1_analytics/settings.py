@@ -179,6 +179,9 @@ REST_FRAMEWORK = {
     'EXCEPTION_HANDLER': 'rest_framework.views.exception_handler',
 }
 
+# HTTP caching of API responses (see ConditionalGetMixin in api/views.py)
+API_COMPLETED_SEASON_MAX_AGE = config('API_COMPLETED_SEASON_MAX_AGE', default=60 * 60 * 24 * 7, cast=int)  # seconds
+
 
 # CORS settings
 # https://github.com/adamchainz/django-cors-headers
@@ -197,6 +200,20 @@ CORS_ALLOW_CREDENTIALS = True
 
 F1_API_BASE_URL = config('F1_API_BASE_URL', default='http://ergast.com/api/f1')
 F1_API_RATE_LIMIT = config('F1_API_RATE_LIMIT', default=4, cast=int)  # requests per second
+F1_API_HOURLY_LIMIT = config('F1_API_HOURLY_LIMIT', default=200, cast=int)  # requests per hour
+F1_API_MAX_WORKERS = config('F1_API_MAX_WORKERS', default=4, cast=int)  # concurrent requests
+F1_API_POOL_SIZE = config('F1_API_POOL_SIZE', default=10, cast=int)  # keep-alive connections
+F1_API_PAGE_SIZE = config('F1_API_PAGE_SIZE', default=100, cast=int)  # rows per page (API maximum)
+F1_API_TIMEOUT = config('F1_API_TIMEOUT', default=10, cast=int)  # seconds
+F1_API_MAX_RETRIES = config('F1_API_MAX_RETRIES', default=3, cast=int)
+F1_API_BACKOFF_FACTOR = config('F1_API_BACKOFF_FACTOR', default=0.5, cast=float)  # seconds
+F1_API_MAX_RETRY_AFTER = config('F1_API_MAX_RETRY_AFTER', default=600, cast=int)  # longest Retry-After honoured (seconds)
+
+# On-disk cache of API responses (see core/services/response_cache.py)
+F1_API_CACHE_ENABLED = config('F1_API_CACHE_ENABLED', default=True, cast=bool)
+F1_API_CACHE_DIR = config('F1_API_CACHE_DIR', default=str(BASE_DIR / 'api_cache'))
+F1_API_CACHE_TTL_COMPLETED = config('F1_API_CACHE_TTL_COMPLETED', default=60 * 60 * 24 * 30, cast=int)  # seconds
+F1_API_CACHE_TTL_CURRENT = config('F1_API_CACHE_TTL_CURRENT', default=60 * 60, cast=int)  # seconds
 
 # Logging Configuration
 LOGGING = {
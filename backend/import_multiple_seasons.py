@@ -1,5 +1,12 @@
 """
 Import F1 data for multiple seasons
+
+Usage:
+    python import_multiple_seasons.py            # Download (or reuse cached) API data
+    python import_multiple_seasons.py --offline  # Replay cached API responses only
+
+Seasons are imported by the import_seasons management command; re-running
+the script resumes from the seasons that did not finish.
 """
 import sys
 import os
@@ -11,6 +18,7 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'f1_analytics.settings')
 django.setup()
 
 from django.core.management import call_command
+from django.core.management.base import CommandError
 from core.models import Season
 
 # Seasons to import (2020-2025)
@@ -29,28 +37,28 @@ def create_season_records():
         else:
             print(f"- Season {year} already exists")
 
-def import_season_data(year):
-    """Import data for a specific season"""
-    print(f"\n{'='*60}")
-    print(f"Importing data for {year} season...")
-    print('='*60)
-    
-    try:
-        call_command('import_f1_data', year=year, verbosity=1)
-        print(f"✓ Successfully imported {year} season data")
-    except Exception as e:
-        print(f"✗ Error importing {year} season: {e}")
-
 def main():
+    offline = '--offline' in sys.argv[1:]
+    
     print("F1 Multi-Season Data Import")
+    if offline:
+        print("Offline mode: replaying cached API responses")
     print("="*60)
     
     # Step 1: Create Season records
     create_season_records()
     
-    # Step 2: Import data for each season
-    for year in SEASONS_TO_IMPORT:
-        import_season_data(year)
+    # Step 2: Import all seasons in parallel (completed seasons are skipped on re-runs)
+    try:
+        call_command(
+            'import_seasons',
+            from_season=min(SEASONS_TO_IMPORT),
+            to_season=max(SEASONS_TO_IMPORT),
+            offline=offline,
+            verbosity=1,
+        )
+    except CommandError as e:
+        print(f"✗ {e}")
     
     print(f"\n{'='*60}")
     print("Multi-season import completed!")
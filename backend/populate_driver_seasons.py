@@ -10,6 +10,7 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'f1_analytics.settings')
 django.setup()
 
 from core.models import DriverSeason, Result, Season, Driver
+from core.services.career_stats_service import CareerStatsService
 from django.db.models import Q
 
 def populate_driver_seasons():
@@ -78,6 +79,10 @@ def populate_driver_seasons():
     print(f"   Created: {created_count} new entries")
     print(f"   Updated: {updated_count} existing entries")
     print(f"   Deleted: {deleted_count} duplicate entries")
+    
+    # Season counts feed the precomputed career stats table
+    created, updated = CareerStatsService.save_career_stats()
+    print(f"   Career stats: {created} created, {updated} updated")
 
 
 if __name__ == '__main__':
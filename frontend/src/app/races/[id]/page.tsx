@@ -4,18 +4,23 @@ import { useState, useEffect } from 'react';
 import { useParams, useRouter } from 'next/navigation';
 import Link from 'next/link';
 import { f1Api } from '@/lib/api';
-import { Race, Result, Qualifying, Sprint, ProgressiveStandingsResponse } from '@/types/f1';
+import { Race, Result, Qualifying, Sprint, ProgressiveStandingsResponse, Expanded } from '@/types/f1';
 import { ArrowLeft, Calendar, MapPin, Loader2, Trophy, Timer, Flag, AlertCircle } from 'lucide-react';
 
+// Fetched with expand=driver,constructor
+type RaceResult = Expanded<Result, 'driver' | 'constructor'>;
+type QualifyingResult = Expanded<Qualifying, 'driver' | 'constructor'>;
+type SprintResult = Expanded<Sprint, 'driver' | 'constructor'>;
+
 export default function RaceDetailPage() {
   const params = useParams();
   const router = useRouter();
   const raceId = params.id as string;
 
   const [race, setRace] = useState<Race | null>(null);
-  const [results, setResults] = useState<Result[]>([]);
-  const [qualifying, setQualifying] = useState<Qualifying[]>([]);
-  const [sprint, setSprint] = useState<Sprint[]>([]);
+  const [results, setResults] = useState<RaceResult[]>([]);
+  const [qualifying, setQualifying] = useState<QualifyingResult[]>([]);
+  const [sprint, setSprint] = useState<SprintResult[]>([]);
   const [progressiveStandings, setProgressiveStandings] = useState<ProgressiveStandingsResponse | null>(null);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
@@ -37,13 +42,13 @@ export default function RaceDetailPage() {
       setRace(raceData);
 
       // Load results
-      const resultsResponse = await f1Api.getResults({ race: parseInt(raceId) });
+      const resultsResponse = await f1Api.getResults({ race: parseInt(raceId), expand: 'driver,constructor' });
       const allResults = resultsResponse.data.results || resultsResponse.data;
       setResults(allResults);
 
       // Load qualifying
       try {
-        const qualifyingResponse = await f1Api.getQualifying({ race: parseInt(raceId) });
+        const qualifyingResponse = await f1Api.getQualifying({ race: parseInt(raceId), expand: 'driver,constructor' });
         const qualifyingData = qualifyingResponse.data.results || qualifyingResponse.data;
         setQualifying(qualifyingData);
       } catch (err) {
@@ -53,7 +58,7 @@ export default function RaceDetailPage() {
 
       // Load sprint (may not exist)
       try {
-        const sprintResponse = await f1Api.getSprint({ race: parseInt(raceId) });
+        const sprintResponse = await f1Api.getSprint({ race: parseInt(raceId), expand: 'driver,constructor' });
         const sprintData = sprintResponse.data.results || sprintResponse.data;
         setSprint(sprintData);
       } catch (err) {
@@ -256,7 +261,7 @@ export default function RaceDetailPage() {
 }
 
 // Qualifying Section Component
-function QualifyingSection({ qualifying }: { qualifying: Qualifying[] }) {
+function QualifyingSection({ qualifying }: { qualifying: QualifyingResult[] }) {
   return (
     <div className="bg-gray-900/90 backdrop-blur-sm rounded-xl p-6 border border-gray-700">
       <h2 className="text-2xl font-bold text-white mb-6 flex items-center gap-2">
@@ -321,7 +326,7 @@ function QualifyingSection({ qualifying }: { qualifying: Qualifying[] }) {
 }
 
 // Sprint Section Component
-function SprintSection({ sprint }: { sprint: Sprint[] }) {
+function SprintSection({ sprint }: { sprint: SprintResult[] }) {
   return (
     <div className="bg-gray-900/90 backdrop-blur-sm rounded-xl p-6 border border-gray-700">
       <h2 className="text-2xl font-bold text-white mb-6 flex items-center gap-2">
@@ -393,7 +398,7 @@ function SprintSection({ sprint }: { sprint: Sprint[] }) {
 }
 
 // Race Results Section with Podium Emphasis
-function RaceResultsSection({ results }: { results: Result[] }) {
+function RaceResultsSection({ results }: { results: RaceResult[] }) {
   const podium = results.filter(r => r.final_position && r.final_position <= 3);
   const others = results.filter(r => !r.final_position || r.final_position > 3);
 
@@ -438,7 +443,7 @@ function RaceResultsSection({ results }: { results: Result[] }) {
 }
 
 // Podium Card Component
-function PodiumCard({ result }: { result: Result }) {
+function PodiumCard({ result }: { result: RaceResult }) {
   const position = result.final_position || 0;
   const colors = {
     1: { bg: 'from-yellow-600/20 to-yellow-900/20', border: 'border-yellow-400', text: 'text-yellow-400', medal: '🥇' },
@@ -488,7 +493,7 @@ function PodiumCard({ result }: { result: Result }) {
 }
 
 // Result Row Component
-function ResultRow({ result }: { result: Result }) {
+function ResultRow({ result }: { result: RaceResult }) {
   let pointsDisplay;
   if (result.status === 'retired' || result.status.startsWith('retired')) {
     pointsDisplay = <span className="text-red-400 font-bold">DNF</span>;
@@ -3,14 +3,17 @@
 import { useState, useEffect } from 'react';
 import Link from 'next/link';
 import { f1Api } from '@/lib/api';
-import { ChampionshipStanding } from '@/types/f1';
+import { ChampionshipStanding, Expanded } from '@/types/f1';
 import { ArrowLeft, Trophy, Users, Loader2 } from 'lucide-react';
 import { useSeason } from '@/contexts/SeasonContext';
 
+// Fetched with expand=driver,constructor
+type Standing = Expanded<ChampionshipStanding, 'driver' | 'constructor'>;
+
 type StandingType = 'driver' | 'constructor';
 
 export default function StandingsPage() {
-  const [standings, setStandings] = useState<ChampionshipStanding[]>([]);
+  const [standings, setStandings] = useState<Standing[]>([]);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
   const [standingType, setStandingType] = useState<StandingType>('driver');
@@ -29,6 +32,7 @@ export default function StandingsPage() {
         season: currentSeason,
         standing_type: standingType,
         round: 0, // 0 means season total
+        expand: 'driver,constructor',
       });
       
       // Handle paginated response
@@ -37,7 +41,7 @@ export default function StandingsPage() {
       
       // Sort by position
       const sortedStandings = standings.sort(
-        (a: ChampionshipStanding, b: ChampionshipStanding) => a.position - b.position
+        (a: Standing, b: Standing) => a.position - b.position
       );
       setStandings(sortedStandings);
       
@@ -53,11 +57,15 @@ export default function StandingsPage() {
     }
   };
 
-  const loadDriverTeams = async (standings: ChampionshipStanding[]) => {
+  const loadDriverTeams = async (standings: Standing[]) => {
     try {
       // Get all results for the season to find team assignments
       let allResults: any[] = [];
-      const resultsResponse = await f1Api.getResults({ race__season: currentSeason });
+      const resultsResponse = await f1Api.getResults({
+        season: currentSeason,
+        fields: 'id,race,driver,constructor',
+        expand: 'race,driver,constructor',
+      });
       allResults = resultsResponse.data.results || resultsResponse.data;
       
       // If paginated, fetch all pages
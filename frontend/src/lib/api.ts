@@ -89,15 +89,31 @@ export const f1Api = {
   getRace: (id: number) =>
     api.get(`/races/${id}/`),
 
-  // Results
-  getResults: (params?: { race__season?: number; race?: number; driver?: number }) =>
+  // Fastest laps of a race ranked by time (limit=1 for the fastest lap only)
+  getRaceFastestLaps: (id: number, params?: { limit?: number }) =>
+    api.get(`/races/${id}/fastest-laps/`, { params }),
+
+  // Qualifying order of a race with the gap to pole
+  getRacePoleGap: (id: number) =>
+    api.get(`/races/${id}/pole-gap/`),
+
+  // Lap times and positions of every driver in a race (one entry per driver)
+  getRaceLaps: (id: number) =>
+    api.get(`/races/${id}/laps/`),
+
+  // Race lap record of every circuit (or of one circuit)
+  getLapRecords: (params?: { circuit_id?: string }) =>
+    api.get('/races/lap-records/', { params }),
+
+  // Results (relations are returned as ids unless listed in `expand`)
+  getResults: (params?: { season?: number; race?: number; driver?: number; fields?: string; expand?: string }) =>
     api.get('/results/', { params }),
   
   getResult: (id: number) =>
     api.get(`/results/${id}/`),
 
   // Standings
-  getStandings: (params?: { season?: number; standing_type?: 'driver' | 'constructor'; round?: number }) =>
+  getStandings: (params?: { season?: number; standing_type?: 'driver' | 'constructor'; round?: number; fields?: string; expand?: string }) =>
     api.get('/standings/', { params }),
   
   getStanding: (id: number) =>
@@ -108,15 +124,15 @@ export const f1Api = {
     api.get('/standings/progressive/', { params }),
 
   // Qualifying
-  getQualifying: (params?: { race__season?: number; race?: number; driver?: number }) =>
+  getQualifying: (params?: { season?: number; race?: number; driver?: number; fields?: string; expand?: string }) =>
     api.get('/qualifying/', { params }),
 
   // Sprint
-  getSprint: (params?: { race__season?: number; race?: number; driver?: number }) =>
+  getSprint: (params?: { season?: number; race?: number; driver?: number; fields?: string; expand?: string }) =>
     api.get('/sprint/', { params }),
 
   // Laps
-  getLaps: (params?: { race?: number; driver?: number }) =>
+  getLaps: (params?: { season?: number; race?: number; driver?: number; fields?: string; expand?: string }) =>
     api.get('/laps/', { params }),
 };
 
@@ -116,9 +116,10 @@ export interface Race {
 
 export interface Result {
   id: number;
-  race: Race;
-  driver: Driver;
-  constructor: Constructor;
+  race: number | Race;
+  season: number;
+  driver: number | Driver;
+  constructor: number | Constructor;
   grid_position: number;
   final_position: number | null;
   position_text: string;
@@ -128,6 +129,7 @@ export interface Result {
   retirement_reason: string | null;
   fastest_lap: number | null;
   fastest_lap_time: string | null;
+  fastest_lap_time_milliseconds: number | null;
   fastest_lap_speed: number | null;
   created_at: string;
   updated_at: string;
@@ -135,8 +137,9 @@ export interface Result {
 
 export interface Lap {
   id: number;
-  race: Race;
-  driver: Driver;
+  race: number | Race;
+  season: number;
+  driver: number | Driver;
   lap_number: number;
   position: number;
   lap_time: string;
@@ -149,8 +152,8 @@ export interface ChampionshipStanding {
   season: number;
   standing_type: 'driver' | 'constructor';
   round: number;
-  driver: Driver | null;
-  constructor: Constructor | null;
+  driver: number | Driver | null;
+  constructor: number | Constructor | null;
   position: number;
   points: number;
   wins: number;
@@ -160,22 +163,27 @@ export interface ChampionshipStanding {
 
 export interface Qualifying {
   id: number;
-  race: Race;
-  driver: Driver;
-  constructor: Constructor;
+  race: number | Race;
+  season: number;
+  driver: number | Driver;
+  constructor: number | Constructor;
   position: number;
   q1_time: string | null;
   q2_time: string | null;
   q3_time: string | null;
+  q1_milliseconds: number | null;
+  q2_milliseconds: number | null;
+  q3_milliseconds: number | null;
   created_at: string;
   updated_at: string;
 }
 
 export interface Sprint {
   id: number;
-  race: Race;
-  driver: Driver;
-  constructor: Constructor;
+  race: number | Race;
+  season: number;
+  driver: number | Driver;
+  constructor: number | Constructor;
   grid_position: number;
   final_position: number | null;
   position_text: string;
@@ -184,6 +192,7 @@ export interface Sprint {
   status: 'finished' | 'dnf' | 'dsq' | 'dns' | 'retired';
   retirement_reason: string | null;
   fastest_lap_time: string | null;
+  fastest_lap_time_milliseconds: number | null;
   created_at: string;
   updated_at: string;
 }
@@ -212,6 +221,11 @@ export interface ProgressiveStandingsResponse {
   standings: ProgressiveStanding[];
 }
 
+// Relations of results, laps, qualifying, sprint and standings are returned
+// as ids unless listed in `expand`: Expanded<Result, 'driver'> is a Result
+// fetched with expand=driver
+export type Expanded<T, K extends keyof T> = Omit<T, K> & { [P in K]: Exclude<T[P], number> };
+
 // API Response Types
 export interface PaginatedResponse<T> {
   count: number;